@@ -30,7 +30,7 @@
 
         # Wrapper script for running automation tests
         run-ha-tests = pkgs.writeShellScriptBin "run-ha-tests" ''
-          exec pytest tests/ -v --cov --cov-report=term-missing
+          exec pytest tests/ -v -n auto -m "not slow" --branch-coverage
         '';
 
         # Pre-commit hooks configuration
@@ -132,7 +132,7 @@
               echo "  run-ha-tests       - Run automation logic tests with pytest"
               echo ""
               echo "Testing shortcuts:"
-              echo "  run-ha-tests                    - Run all tests with coverage"
+              echo "  run-ha-tests                    - Run all tests with branch coverage"
               echo "  run-ha-tests tests/automations/ - Run specific test directory"
               echo "  run-ha-tests -k test_name       - Run tests matching pattern"
               echo ""
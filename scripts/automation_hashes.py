@@ -0,0 +1,129 @@
+"""Content hashes of the automations, to reload only what an edit changed.
+
+`automation.reload` re-reads and validates the whole configuration, then
+replaces the automations whose configuration differs from the running one;
+the others keep their runs (delays, waits, queued runs). Either way it
+fires `automation_reloaded`, which restarts house/startup.yaml and so
+reconciles mode control, the camera and the study lamp 10 seconds later.
+
+Most edits change one automation, and many (comments, formatting, moving a
+file) change none. Hashing each automation's parsed configuration, loaded
+the way Home Assistant loads it, tells which ones actually changed:
+
+- none: nothing to reload, and nothing is restarted or reconciled
+- one: `automation.reload` with its `id` (added or removed ones included)
+- several: a single full reload, as each reload reads the whole
+  configuration, whether targeted or not
+
+An automation using a blueprint also changes when the blueprint does.
+Automations without an `id` cannot be targeted: a change to one of them
+needs a full reload.
+
+Only Home Assistant's YAML loader is needed, not the test tooling, so this
+runs wherever the configuration is deployed. The tests import it as
+`scripts.automation_hashes`.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from homeassistant.util.yaml import load_yaml_dict
+
+# This repository, the configuration tree scripts/reload_automations.py reloads
+CONFIG_PATH = Path(__file__).resolve().parent.parent
+
+# File the hashes of the last reload are kept in, in the configuration tree
+MANIFEST = ".automation_hashes.json"
+
+# Key prefix of automations without an id, which are keyed by alias
+NO_ID_PREFIX = "alias:"
+
+
+class ReloadPlan(NamedTuple):
+    """The automations changed since the last reload, by id."""
+
+    changed: list[str]
+    added: list[str]
+    removed: list[str]
+
+    @property
+    def automations(self) -> list[str]:
+        """Return every automation the reload affects."""
+        return [*self.changed, *self.added, *self.removed]
+
+    def service_calls(self) -> list[dict[str, Any]]:
+        """Return the data of the `automation.reload` calls applying the plan."""
+        automations = self.automations
+        if not automations:
+            return []
+        if len(automations) == 1 and not automations[0].startswith(NO_ID_PREFIX):
+            return [{"id": automations[0]}]
+        return [{}]
+
+
+def load_automations(config_path: Path = CONFIG_PATH) -> list[dict[str, Any]]:
+    """Return every automation, loaded the way integrations/automation.yaml does.
+
+    Args:
+        config_path: Configuration tree to load
+    """
+    package = load_yaml_dict(config_path / "integrations" / "automation.yaml")
+    return [
+        automation_config
+        for key in ("automation", "automation split")
+        for automation_config in package.get(key) or []
+    ]
+
+
+def automation_hashes(config_path: Path = CONFIG_PATH) -> dict[str, str]:
+    """Return the hash of each automation's configuration, by id.
+
+    Args:
+        config_path: Configuration tree to load, e.g. a synthetic one
+            (see tests/helpers/synthetic_house.py)
+    """
+    hashes = {}
+    for config in load_automations(config_path):
+        key = config.get("id") or f"{NO_ID_PREFIX}{config.get('alias', '')}"
+        content = json.dumps(config, sort_keys=True, default=str)
+        if blueprint := (config.get("use_blueprint") or {}).get("path"):
+            path = config_path / "blueprints" / "automation" / blueprint
+            content += path.read_text() if path.exists() else ""
+        hashes[key] = hashlib.sha256(content.encode()).hexdigest()
+    return hashes
+
+
+def plan_reload(previous: dict[str, str], current: dict[str, str]) -> ReloadPlan:
+    """Compare the hashes of the last reload with the current ones.
+
+    Args:
+        previous: Hashes at the last reload, see `automation_hashes()`
+        current: Hashes of the configuration as it is now
+    """
+    return ReloadPlan(
+        changed=[key for key in current if key in previous and previous[key] != current[key]],
+        added=[key for key in current if key not in previous],
+        removed=[key for key in previous if key not in current],
+    )
+
+
+def read_manifest(config_path: Path = CONFIG_PATH) -> dict[str, str] | None:
+    """Return the hashes of the last reload, None if there are none yet.
+
+    Args:
+        config_path: Configuration tree the manifest is kept in
+    """
+    path = config_path / MANIFEST
+    return json.loads(path.read_text()) if path.exists() else None
+
+
+def write_manifest(hashes: dict[str, str], config_path: Path = CONFIG_PATH) -> None:
+    """Keep the hashes of a reload, to compare the next one with.
+
+    Args:
+        hashes: Hashes of the configuration reloaded
+        config_path: Configuration tree to keep the manifest in
+    """
+    (config_path / MANIFEST).write_text(json.dumps(hashes, indent=2, sort_keys=True) + "\n")
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""List the conditions of the automations not ordered cheap-first.
+
+Conditions are and-ed or or-ed, both stopping at the first condition that
+settles the result, so a cheap check (a trigger id, an entity's state)
+put before a template saves rendering it whenever it already settles it.
+Each list of conditions whose estimated costs are not in increasing order
+is listed with the order suggested (see tests/helpers/condition_order.py):
+
+    python scripts/condition_order.py                   # every automation file
+    python scripts/condition_order.py house/mode.yaml   # one file
+
+Exits with 1 if a list of conditions should be reordered.
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(1, str(PROJECT_ROOT))
+
+from tests.helpers.condition_order import Reordering, file_reorderings  # noqa: E402
+from tests.helpers.automation_helpers import automation_files  # noqa: E402
+
+
+def report(file: str, found: list[Reordering]) -> str:
+    """Return the report of the reorderings of an automation file.
+
+    Args:
+        file: Automation file relative to automations/
+        found: Its reorderings
+    """
+    lines = [f"{file}: {len(found)} to reorder"]
+    for reordering in found:
+        lines.append(f"  {reordering.path} {reordering.label}")
+        for name, conditions in (("now", reordering.current), ("suggested", reordering.suggested)):
+            order = ", ".join(f"{label} ({cost:g})" for label, cost in conditions)
+            lines.append(f"    {name:>9}: {order}")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    """Parse the command line and list the reorderings of each file."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "files",
+        nargs="*",
+        help="Automation files relative to automations/ (default: all)",
+    )
+    options = parser.parse_args()
+    os.chdir(PROJECT_ROOT)
+
+    to_reorder = 0
+    for file in options.files or automation_files():
+        found = file_reorderings(file)
+        if found:
+            print(report(file, found))
+        to_reorder += len(found)
+    if not to_reorder:
+        print("Every list of conditions is ordered cheap-first")
+    return 1 if to_reorder else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
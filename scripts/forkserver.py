@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""Fork server for fast local pytest runs.
+
+Importing homeassistant and pytest_homeassistant_custom_component takes
+seconds, while a single automation test runs in a fraction of one. The
+server imports and warms them once, then forks a fresh child for every run:
+the child takes over the client's terminal and runs pytest, so only the
+test files themselves are imported (and any edits to them picked up).
+
+    python scripts/forkserver.py serve &
+    python scripts/forkserver.py run tests/automations/test_house_mode.py -k work
+    python scripts/forkserver.py stop
+
+`run` falls back to running pytest directly when no server is listening.
+Restart the server after upgrading Home Assistant or the test requirements.
+"""
+
+import argparse
+import importlib
+import io
+import json
+import os
+import signal
+import socket
+import sys
+import threading
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SOCKET_PATH = PROJECT_ROOT / ".pytest_cache" / "forkserver.sock"
+
+# Third-party modules imported once by the server. Nothing from tests/ is
+# imported, so each run sees the current test files.
+WARM_MODULES = [
+    "pytest",
+    "pytest_asyncio",
+    "pytest_homeassistant_custom_component.plugins",
+    "pytest_homeassistant_custom_component.common",
+    "homeassistant.helpers.script",
+    "homeassistant.helpers.state",
+    "syrupy",
+    "yaml",
+]
+
+# Integrations the tests set up, imported so children do not load them in an executor
+WARM_COMPONENTS = [
+    "automation",
+    "climate",
+    "homeassistant",
+    "input_boolean",
+    "input_datetime",
+    "input_number",
+    "input_select",
+    "input_text",
+    "light",
+    "scene",
+    "script",
+    "shell_command",
+    "switch",
+    "trace",
+]
+
+
+def warm() -> None:
+    """Import everything a test run needs that does not change between runs."""
+    for module in WARM_MODULES:
+        importlib.import_module(module)
+    for domain in WARM_COMPONENTS:
+        for suffix in ("", ".reproduce_state"):
+            try:
+                importlib.import_module(f"homeassistant.components.{domain}{suffix}")
+            except ImportError:
+                pass
+    if threading.active_count() > 1:
+        print("warning: threads started while warming, forked children may hang", file=sys.stderr)
+
+
+def serve(socket_path: Path) -> None:
+    """Warm up, then fork a child for every run request until told to stop.
+
+    Args:
+        socket_path: Unix socket to listen on
+    """
+    warm()
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    socket_path.unlink(missing_ok=True)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    server.listen()
+    # Children are never waited for, let the kernel reap them
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    print(f"forkserver ready on {socket_path}", file=sys.stderr)
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            message, fds, _, _ = socket.recv_fds(conn, 1 << 20, 3)
+            request = json.loads(message)
+            if request.get("stop"):
+                conn.close()
+                break
+            if os.fork() == 0:
+                server.close()
+                _run_child(conn, fds, request)
+            conn.close()
+            for fd in fds:
+                os.close(fd)
+    finally:
+        server.close()
+        socket_path.unlink(missing_ok=True)
+
+
+def _run_child(conn: socket.socket, fds: list[int], request: dict) -> None:
+    """Run pytest in a forked child on the client's terminal, then exit.
+
+    Args:
+        conn: Connection to the client, the exit code is sent back on it
+        fds: The client's stdin, stdout and stderr
+        request: The client's arguments, working directory and environment
+    """
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    for target, fd in enumerate(fds):
+        os.dup2(fd, target)
+        os.close(fd)
+    sys.stdin = io.TextIOWrapper(io.FileIO(0, "r", closefd=False))
+    sys.stdout = io.TextIOWrapper(
+        io.FileIO(1, "w", closefd=False), line_buffering=os.isatty(1)
+    )
+    sys.stderr = io.TextIOWrapper(
+        io.FileIO(2, "w", closefd=False), line_buffering=True
+    )
+    os.chdir(request["cwd"])
+    os.environ.clear()
+    os.environ.update(request["env"])
+    sys.path[0] = request["cwd"]
+    sys.argv = ["pytest", *request["args"]]
+
+    code = 1
+    try:
+        conn.sendall(json.dumps({"pid": os.getpid()}).encode() + b"\n")
+        import pytest
+
+        # The warm plugins were imported before pytest could rewrite their asserts
+        code = int(
+            pytest.main(
+                [*request["args"], "-W", "ignore::pytest.PytestAssertRewriteWarning"]
+            )
+        )
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            conn.sendall(json.dumps({"exit": code}).encode() + b"\n")
+        finally:
+            os._exit(code)
+
+
+def run(socket_path: Path, args: list[str]) -> int:
+    """Run pytest in a child of the server, or directly if none is listening.
+
+    Args:
+        socket_path: Unix socket the server listens on
+        args: Arguments for pytest
+
+    Returns:
+        pytest's exit code
+    """
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(str(socket_path))
+    except (FileNotFoundError, ConnectionRefusedError):
+        os.execvp(sys.executable, [sys.executable, "-m", "pytest", *args])
+
+    request = {"args": args, "cwd": os.getcwd(), "env": dict(os.environ)}
+    socket.send_fds(client, [json.dumps(request).encode()], [0, 1, 2])
+
+    pid = None
+    replies = client.makefile("r")
+    while True:
+        try:
+            line = replies.readline()
+        except KeyboardInterrupt:
+            # Let pytest stop the run and report, as it would in the foreground
+            if pid is not None:
+                os.kill(pid, signal.SIGINT)
+            continue
+        if not line:
+            # The child died without reporting
+            return 1
+        reply = json.loads(line)
+        if "pid" in reply:
+            pid = reply["pid"]
+        elif "exit" in reply:
+            return reply["exit"]
+
+
+def stop(socket_path: Path) -> None:
+    """Tell the server to shut down.
+
+    Args:
+        socket_path: Unix socket the server listens on
+    """
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.connect(str(socket_path))
+    socket.send_fds(client, [json.dumps({"stop": True}).encode()], [])
+    client.close()
+
+
+def main() -> int:
+    """Parse the command line and serve, run or stop."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--socket", type=Path, default=SOCKET_PATH, help="Unix socket path")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("serve", help="Warm up and wait for runs")
+    commands.add_parser("run", help="Run pytest with the given arguments", add_help=False)
+    commands.add_parser("stop", help="Stop the server")
+    options, pytest_args = parser.parse_known_args()
+
+    if options.command == "serve":
+        serve(options.socket)
+    elif options.command == "run":
+        return run(options.socket, pytest_args)
+    else:
+        stop(options.socket)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
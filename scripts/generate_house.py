@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Write a synthetic configuration tree at a chosen scale.
+
+The tree follows this repository's layout (integrations/, entities/,
+scenes/<room>/<mode>.yaml, automations/<room>/*.yaml and an
+apply_mode_scenes.yaml covering every room), see
+tests/helpers/synthetic_house.py:
+
+    python scripts/generate_house.py /tmp/house --rooms 50 --automations 500
+
+The scale benchmarks in tests/benchmarks/test_scale.py generate their own.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(1, str(PROJECT_ROOT))
+
+from tests.helpers.synthetic_house import (  # noqa: E402
+    DEFAULT_LIGHTS_PER_ROOM,
+    DEFAULT_OCCUPANTS,
+    generate_house,
+)
+
+
+def main() -> int:
+    """Generate the tree and say what is in it."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("path", type=Path, help="Directory to write the tree to")
+    parser.add_argument("--rooms", type=int, required=True, help="Number of rooms")
+    parser.add_argument(
+        "--automations", type=int, required=True, help="Number of automations"
+    )
+    parser.add_argument(
+        "--lights-per-room",
+        type=int,
+        default=DEFAULT_LIGHTS_PER_ROOM,
+        help=f"Lights in each room (default {DEFAULT_LIGHTS_PER_ROOM})",
+    )
+    parser.add_argument(
+        "--occupants",
+        type=int,
+        default=DEFAULT_OCCUPANTS,
+        help=f"Occupants sharing the work scenes (default {DEFAULT_OCCUPANTS})",
+    )
+    args = parser.parse_args()
+
+    if args.path.exists() and any(args.path.iterdir()):
+        print(f"{args.path} is not empty", file=sys.stderr)
+        return 1
+    house = generate_house(
+        args.path, args.rooms, args.automations, args.lights_per_room, args.occupants
+    )
+    print(
+        f"{house.path}: {len(house.rooms)} rooms, {house.automations} automations, "
+        f"{house.scenes} scenes, {sum(map(len, house.lights))} lights"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""Mutation testing of the automation YAML.
+
+Makes mutants of each automation file (a `to:` state flipped, two `choose`
+options swapped, a condition negated, a time comparison shifted, see
+tests/helpers/mutation.py) and runs the tests that load the file against
+each of them. A mutant the tests still pass with survived: the tests do not
+notice that mistake. Surviving mutants are listed per file.
+
+Home Assistant and the test plugins are imported once, as by the fork
+server; each mutant's tests then run in a forked child, several at a time.
+
+    python scripts/mutate.py                          # every automation file
+    python scripts/mutate.py house/mode.yaml -j 4     # one file, 4 at a time
+    python scripts/mutate.py study/lamp.yaml --list   # only list the mutants
+
+Exits with 1 if a mutant survived.
+"""
+
+import argparse
+import os
+import signal
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import NamedTuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(1, str(PROJECT_ROOT))
+
+from forkserver import warm  # noqa: E402
+
+# Before the test helpers, as in a test run: the plugin patches Home
+# Assistant's recorder before anything imports it
+import pytest_homeassistant_custom_component.plugins  # noqa: E402, F401, I001
+from tests.helpers.automation_helpers import automation_files  # noqa: E402
+from tests.helpers.mutation import (  # noqa: E402
+    Mutant,
+    MutantPlugin,
+    generate_mutants,
+    relevant_tests,
+)
+
+# Stop at the first failure, a single one kills the mutant
+PYTEST_ARGS = [
+    "-x",
+    "-q",
+    "-m",
+    "not slow",
+    "-p",
+    "no:cacheprovider",
+    # The warm plugins were imported before pytest could rewrite their asserts
+    "-W",
+    "ignore::pytest.PytestAssertRewriteWarning",
+]
+
+# Seconds a mutant's tests may run; a mutant making a run hang is killed
+DEFAULT_TIMEOUT = 120.0
+
+KILLED = "killed"
+SURVIVED = "survived"
+TIMED_OUT = "timed out"
+ERROR = "error"
+
+
+class Job(NamedTuple):
+    """Tests to run against a mutant (None for the unmutated automations)."""
+
+    tests: list[str]
+    mutant: Mutant | None
+
+
+class Outcome(NamedTuple):
+    """How a job's test run ended."""
+
+    job: Job
+    status: str
+    seconds: float
+
+
+def _start(job: Job) -> int:
+    """Fork a child running the job's tests with its mutant active.
+
+    Args:
+        job: Tests and mutant to run
+
+    Returns:
+        The child's pid
+    """
+    # Output buffered before the fork would be written by the child as well
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid:
+        return pid
+    code = 3
+    try:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, 1)
+        os.dup2(devnull, 2)
+        import pytest
+
+        plugins = [] if job.mutant is None else [MutantPlugin(job.mutant)]
+        code = int(pytest.main([*job.tests, *PYTEST_ARGS], plugins=plugins))
+    finally:
+        os._exit(code)
+
+
+def _status(wait_status: int) -> str:
+    """Return the outcome of a child from its wait status.
+
+    Args:
+        wait_status: Status as returned by os.waitpid()
+    """
+    if not os.WIFEXITED(wait_status):
+        return ERROR
+    code = os.WEXITSTATUS(wait_status)
+    # pytest: 0 all passed, 1 tests failed, anything else did not run properly
+    return {0: SURVIVED, 1: KILLED}.get(code, ERROR)
+
+
+def run_jobs(
+    jobs: list[Job],
+    parallel: int,
+    timeout: float,
+    done: Callable[[Outcome], None],
+) -> None:
+    """Run jobs in forked children, several at a time.
+
+    Args:
+        jobs: Jobs to run
+        parallel: Children running at once
+        timeout: Seconds after which a child is killed
+        done: Called with each job's outcome as it finishes
+    """
+    pending = list(reversed(jobs))
+    running: dict[int, tuple[Job, float]] = {}
+    timed_out: set[int] = set()
+    while pending or running:
+        while pending and len(running) < parallel:
+            job = pending.pop()
+            running[_start(job)] = (job, time.monotonic())
+
+        pid, wait_status = os.waitpid(-1, os.WNOHANG)
+        if pid == 0:
+            now = time.monotonic()
+            for child, (_, started) in running.items():
+                if now - started > timeout and child not in timed_out:
+                    os.kill(child, signal.SIGKILL)
+                    timed_out.add(child)
+            time.sleep(0.02)
+            continue
+
+        job, started = running.pop(pid)
+        status = TIMED_OUT if pid in timed_out else _status(wait_status)
+        timed_out.discard(pid)
+        done(Outcome(job, status, time.monotonic() - started))
+
+
+def report(file: str, outcomes: list[Outcome], seconds: float) -> str:
+    """Return a file's mutant counts and its surviving mutants."""
+    counts = {status: 0 for status in (KILLED, SURVIVED, TIMED_OUT, ERROR)}
+    for outcome in outcomes:
+        counts[outcome.status] += 1
+    lines = [
+        f"{file}: {len(outcomes)} mutants, "
+        + ", ".join(f"{count} {status}" for status, count in counts.items() if count)
+        + f" ({seconds:.1f}s)"
+    ]
+    lines += [
+        f"  {outcome.status}: {outcome.job.mutant.description}"
+        for outcome in outcomes
+        if outcome.status in (SURVIVED, ERROR)
+    ]
+    return "\n".join(lines)
+
+
+def main() -> int:
+    """Parse the command line, then generate and run the mutants."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "files",
+        nargs="*",
+        help="Automation files relative to automations/ (default: all)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Mutants tested at once (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help=f"Seconds a mutant's tests may take (default: {DEFAULT_TIMEOUT:g})",
+    )
+    parser.add_argument("--list", action="store_true", help="List the mutants and exit")
+    options = parser.parse_args()
+    os.chdir(PROJECT_ROOT)
+
+    files = options.files or automation_files()
+    mutants = {file: generate_mutants(file) for file in files}
+    if options.list:
+        for file, file_mutants in mutants.items():
+            print(f"{file}: {len(file_mutants)} mutants")
+            for mutant in file_mutants:
+                print(f"  {mutant.description}")
+        return 0
+
+    tests = {file: relevant_tests(file) for file in files}
+    warm()
+
+    # The tests must pass before anything is mutated
+    baseline = Job(sorted({test for file_tests in tests.values() for test in file_tests}), None)
+    outcomes: list[Outcome] = []
+    run_jobs([baseline], 1, options.timeout, outcomes.append)
+    if outcomes[0].status != SURVIVED:
+        print(f"The tests do not pass without mutants ({outcomes[0].status}):", file=sys.stderr)
+        print(f"  pytest {' '.join(baseline.tests)} {' '.join(PYTEST_ARGS)}", file=sys.stderr)
+        return 2
+
+    for file in files:
+        if not mutants[file]:
+            print(f"{file}: no mutants")
+    started = time.monotonic()
+    by_file: dict[str, list[Outcome]] = {file: [] for file in files}
+    survived = 0
+
+    def _done(outcome: Outcome) -> None:
+        nonlocal survived
+        file = outcome.job.mutant.file
+        by_file[file].append(outcome)
+        survived += outcome.status == SURVIVED
+        if len(by_file[file]) == len(mutants[file]):
+            print(report(file, by_file[file], time.monotonic() - started), flush=True)
+
+    run_jobs(
+        [Job(tests[file], mutant) for file in files for mutant in mutants[file]],
+        options.jobs,
+        options.timeout,
+        _done,
+    )
+    total = sum(len(file_mutants) for file_mutants in mutants.values())
+    print(
+        f"\n{total} mutants, {survived} survived "
+        f"in {time.monotonic() - started:.1f}s with {options.jobs} job(s)"
+    )
+    return 1 if survived else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Reload only the automations whose configuration changed since the last reload.
+
+Hashes each automation's configuration, loaded the way Home Assistant
+loads it, and compares the hashes with those kept at the last reload in
+.automation_hashes.json (see scripts/automation_hashes.py). Edits
+that change no automation reload nothing, a single changed automation is
+reloaded by id, several with one full reload:
+
+    python scripts/reload_automations.py --init       # after a restart
+    python scripts/reload_automations.py --dry-run    # list what changed
+    python scripts/reload_automations.py              # reload it
+
+Home Assistant is called through its REST API, at $HASS_SERVER with the
+long-lived access token in $HASS_TOKEN (or --url and --token). Without
+hashes from an earlier run, everything is reloaded.
+"""
+
+import argparse
+import json
+import os
+import sys
+import urllib.request
+from pathlib import Path
+
+# Next to this script, and free of the test tooling
+from automation_hashes import (
+    CONFIG_PATH,
+    automation_hashes,
+    plan_reload,
+    read_manifest,
+    write_manifest,
+)
+
+DEFAULT_URL = "http://homeassistant.local:8123"
+
+
+def call_reload(url: str, token: str, data: dict) -> None:
+    """Call `automation.reload` through the REST API.
+
+    Args:
+        url: Home Assistant's base URL
+        token: Long-lived access token
+        data: Service data, an `id` for a single automation
+    """
+    request = urllib.request.Request(
+        f"{url.rstrip('/')}/api/services/automation/reload",
+        data=json.dumps(data).encode(),
+        headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(request, timeout=60) as response:
+        response.read()
+
+
+def main() -> int:
+    """Reload what changed, and keep the hashes for the next run."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--config",
+        type=Path,
+        default=CONFIG_PATH,
+        help="Configuration tree (default: this repository)",
+    )
+    parser.add_argument(
+        "--url",
+        default=os.environ.get("HASS_SERVER", DEFAULT_URL),
+        help=f"Home Assistant URL (default $HASS_SERVER or {DEFAULT_URL})",
+    )
+    parser.add_argument(
+        "--token",
+        default=os.environ.get("HASS_TOKEN"),
+        help="Long-lived access token (default $HASS_TOKEN)",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="List what changed, reload nothing"
+    )
+    parser.add_argument(
+        "--init",
+        action="store_true",
+        help="Only keep the current hashes, when Home Assistant runs this configuration",
+    )
+    args = parser.parse_args()
+
+    current = automation_hashes(args.config)
+    if args.init:
+        write_manifest(current, args.config)
+        print(f"{len(current)} automations hashed")
+        return 0
+
+    previous = read_manifest(args.config)
+    if previous is None:
+        print("No hashes of an earlier reload, reloading everything")
+        calls = [{}]
+    else:
+        plan = plan_reload(previous, current)
+        for label, keys in zip(("changed", "added", "removed"), plan, strict=True):
+            for key in keys:
+                print(f"{label:<8} {key}")
+        calls = plan.service_calls()
+    if not calls:
+        print("No automation changed, nothing to reload")
+    for data in calls:
+        print(f"automation.reload {json.dumps(data)}")
+
+    if args.dry_run or not calls:
+        return 0
+    if not args.token:
+        print("No access token, set $HASS_TOKEN or pass --token", file=sys.stderr)
+        return 1
+    for data in calls:
+        call_reload(args.url, args.token, data)
+    write_manifest(current, args.config)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
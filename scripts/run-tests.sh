@@ -31,7 +31,7 @@ echo ""
 
 # Run pytest with arguments passed to script, or default arguments
 if [ $# -eq 0 ]; then
-    pytest tests/ -v --cov --cov-report=term-missing
+    pytest tests/ -v -n auto --branch-coverage
 else
     pytest "$@"
 fi
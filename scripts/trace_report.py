@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""Step durations per automation, from exported or saved traces.
+
+Reads the JSON Lines written by `pytest --export-traces` (see
+tests/helpers/trace_export.py), or the traces Home Assistant saves on
+shutdown in `.storage/trace.saved_traces`, and lists for each automation
+its run times and the steps that took the longest in total:
+
+    python scripts/trace_report.py traces.jsonl
+    python scripts/trace_report.py traces.jsonl -a house_mode_control
+    python scripts/trace_report.py /config/.storage/trace.saved_traces --top 5
+
+A step's time includes the steps nested in it, its self time does not, so
+the step doing the work has the largest self time. Saved traces only have
+the time each step started: a step is taken to end when the next step
+outside it starts, or when the run finishes.
+"""
+
+import argparse
+import json
+import re
+import statistics
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, NamedTuple
+
+# Trace paths of action steps, as opposed to conditions and triggers
+STEP_PATH = re.compile(r"(^action|/sequence|/then|/else|/default|/parallel)/\d+$")
+
+DEFAULT_TOP = 10
+
+
+class StepStats(NamedTuple):
+    """Durations of one step of an automation, over every run that ran it."""
+
+    path: str
+    durations: list[float]
+    self_times: list[float]
+
+    @property
+    def total(self) -> float:
+        """Return the total self time in milliseconds."""
+        return sum(self.self_times)
+
+
+def load_runs(path: Path) -> list[dict[str, Any]]:
+    """Return the runs in an export file or a saved traces file.
+
+    Args:
+        path: JSON Lines written by the exporter, or trace.saved_traces
+    """
+    text = path.read_text()
+    try:
+        saved = json.loads(text)
+    except json.JSONDecodeError:
+        saved = None
+    if isinstance(saved, dict) and saved.get("key") == "trace.saved_traces":
+        return saved_trace_runs(saved)
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def saved_trace_runs(saved: dict[str, Any]) -> list[dict[str, Any]]:
+    """Return the automation runs in Home Assistant's saved traces, as exported.
+
+    Args:
+        saved: Contents of .storage/trace.saved_traces
+    """
+    runs = []
+    for key, traces in saved["data"].items():
+        if not key.startswith("automation."):
+            continue
+        for trace in traces:
+            trace = trace["extended_dict"]
+            origin = _time(trace["timestamp"]["start"])
+            finish = _time(trace["timestamp"]["finish"] or trace["timestamp"]["start"])
+            elements = sorted(
+                (element for elements in trace["trace"].values() for element in elements),
+                key=lambda element: element["timestamp"],
+            )
+            steps = [element for element in elements if STEP_PATH.search(element["path"])]
+            exported_steps = []
+            for index, step in enumerate(steps):
+                start = _time(step["timestamp"])
+                end = _step_end(step, steps[index + 1 :], finish)
+                exported_steps.append(
+                    {
+                        "path": step["path"],
+                        "start_ms": (start - origin) * 1000,
+                        "end_ms": (end - origin) * 1000,
+                        "duration_ms": (end - start) * 1000,
+                    }
+                )
+            runs.append(
+                {
+                    "automation": trace["item_id"],
+                    "alias": (trace.get("config") or {}).get("alias"),
+                    "run_id": trace["run_id"],
+                    "start": trace["timestamp"]["start"],
+                    "execution": trace.get("script_execution"),
+                    "trigger": trace.get("trigger"),
+                    "duration_ms": (finish - origin) * 1000,
+                    "steps": exported_steps,
+                }
+            )
+    return runs
+
+
+def _time(timestamp: str) -> float:
+    """Return a saved ISO timestamp in seconds since the epoch."""
+    return datetime.fromisoformat(timestamp).timestamp()
+
+
+def _step_end(step: dict[str, Any], later: list[dict[str, Any]], finish: float) -> float:
+    """Return when a saved step ended: the start of the next step outside it.
+
+    Args:
+        step: The step's trace element
+        later: Trace elements of the steps that started after it
+        finish: When the run finished
+    """
+    for other in later:
+        if not other["path"].startswith(step["path"] + "/"):
+            return _time(other["timestamp"])
+    return finish
+
+
+def self_times(steps: list[dict[str, Any]]) -> list[float]:
+    """Return each step's duration less that of the steps nested directly in it.
+
+    Args:
+        steps: A run's steps, as exported
+    """
+    times = []
+    for step in steps:
+        prefix = step["path"] + "/"
+        nested = [other for other in steps if other["path"].startswith(prefix)]
+        # Directly nested: not inside another nested step
+        direct = [
+            other
+            for other in nested
+            if not any(
+                other is not outer and other["path"].startswith(outer["path"] + "/")
+                for outer in nested
+            )
+        ]
+        times.append(max(step["duration_ms"] - sum(other["duration_ms"] for other in direct), 0.0))
+    return times
+
+
+def aggregate(runs: list[dict[str, Any]]) -> dict[str, tuple[list[float], list[StepStats]]]:
+    """Return the run durations and step stats of each automation.
+
+    Steps are sorted by total self time, longest first.
+
+    Args:
+        runs: Runs as exported
+    """
+    durations: dict[str, list[float]] = {}
+    steps: dict[str, dict[str, StepStats]] = {}
+    for run in runs:
+        automation = _name(run)
+        durations.setdefault(automation, []).append(run["duration_ms"])
+        automation_steps = steps.setdefault(automation, {})
+        for step, self_time in zip(run["steps"], self_times(run["steps"])):
+            stats = automation_steps.setdefault(step["path"], StepStats(step["path"], [], []))
+            stats.durations.append(step["duration_ms"])
+            stats.self_times.append(self_time)
+    return {
+        automation: (
+            durations[automation],
+            sorted(steps[automation].values(), key=lambda stats: -stats.total),
+        )
+        for automation in durations
+    }
+
+
+def _name(run: dict[str, Any]) -> str:
+    """Return an automation's id, followed by its alias if it has one."""
+    alias = run.get("alias")
+    return f'{run["automation"]} "{alias}"' if alias else run["automation"]
+
+
+def p95(values: list[float]) -> float:
+    """Return the 95th percentile, or the only value."""
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=20, method="inclusive")[-1]
+
+
+def report(runs: list[dict[str, Any]], automation: str | None = None, top: int = DEFAULT_TOP) -> str:
+    """Return the run times and slowest steps of each automation.
+
+    Automations are sorted by total run time, longest first.
+
+    Args:
+        runs: Runs as exported
+        automation: Only report this automation id
+        top: Steps listed per automation
+    """
+    lines = []
+    if automation is not None:
+        runs = [run for run in runs if run["automation"] == automation]
+    stats = aggregate(runs)
+    for name, (durations, steps) in sorted(stats.items(), key=lambda item: -sum(item[1][0])):
+        lines.append(
+            f"{name}: {len(durations)} runs, {sum(durations):.1f}ms total, "
+            f"mean {statistics.mean(durations):.3f}ms, p95 {p95(durations):.3f}ms, "
+            f"max {max(durations):.3f}ms"
+        )
+        if steps:
+            lines.append(
+                f"  {'step':<52} {'runs':>5} {'self ms':>9} {'mean ms':>9} "
+                f"{'p95 ms':>9} {'max ms':>9}"
+            )
+        for step in steps[:top]:
+            lines.append(
+                f"  {step.path:<52} {len(step.durations):>5} {step.total:>9.2f} "
+                f"{statistics.mean(step.durations):>9.3f} {p95(step.durations):>9.3f} "
+                f"{max(step.durations):>9.3f}"
+            )
+    return "\n".join(lines)
+
+
+def main() -> int:
+    """Report the step durations of the runs in a trace file."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("path", type=Path, help="Exported JSON Lines or trace.saved_traces")
+    parser.add_argument("-a", "--automation", help="Only report this automation id")
+    parser.add_argument(
+        "--top", type=int, default=DEFAULT_TOP, help=f"Steps listed per automation (default {DEFAULT_TOP})"
+    )
+    args = parser.parse_args()
+
+    runs = load_runs(args.path)
+    if not runs:
+        print(f"No automation runs in {args.path}", file=sys.stderr)
+        return 1
+    print(report(runs, args.automation, args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
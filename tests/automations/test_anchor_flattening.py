@@ -0,0 +1,53 @@
+"""Tests that no automation keeps the payloads of its YAML anchors in its variables.
+
+The anchors of mode.yaml, camera.yaml, donut_lamp.yaml, living_room/lamp.yaml,
+living_room/scene_button.yaml and study/lamp.yaml used to be defined in a
+list under `variables: anchors:`, which every run rendered and every trace
+stored. They are now defined where they are first used (or inlined, when
+used once), so the YAML loader resolves them and nothing is left for the
+run. The files as they were are kept in tests/fixtures/anchor_variables.
+mode.yaml's conditions have been ordered cheap-first since, so both sides
+are compared in that order (see tests/helpers/condition_order.py), and its
+end-of-day trigger watches a timer, so triggers (which held no anchors)
+are left out.
+"""
+
+import json
+
+import pytest
+
+from tests.helpers.automation_helpers import load_house_automations
+from tests.helpers.condition_order import reorder
+
+FLATTENED = [
+    ("house", "mode.yaml", "house_mode"),
+    ("living_room", "camera.yaml", "living_room_camera"),
+    ("living_room", "donut_lamp.yaml", "living_room_donut_lamp"),
+    ("living_room", "lamp.yaml", "living_room_lamp"),
+    ("living_room", "scene_button.yaml", "living_room_scene_button"),
+    ("study", "lamp.yaml", "study_lamp"),
+]
+
+
+def test_no_automation_defines_anchors_in_variables():
+    """Test that anchors are resolved by the loader, not carried in variables."""
+    for automation in load_house_automations():
+        assert "anchors" not in (automation.get("variables") or {}), automation["alias"]
+
+
+@pytest.mark.parametrize(("category", "filename", "fixture"), FLATTENED)
+def test_flattened_automation_loads_the_same(
+    load_automation, load_fixture, category, filename, fixture
+):
+    """Test that the flattened file loads to what it did, less the anchors variable."""
+    before = load_fixture("anchor_variables", fixture)
+    variables = dict(before.pop("variables"))
+    del variables["anchors"]
+    if variables:
+        before["variables"] = variables
+
+    after = load_automation(category, filename)
+    if (category, filename) == ("house", "mode.yaml"):
+        del before["triggers"], after["triggers"]
+
+    assert json.dumps(reorder(after), sort_keys=True) == json.dumps(reorder(before), sort_keys=True)
@@ -0,0 +1,80 @@
+"""Tests that repeated automation runs do not leak memory, with the whole house loaded.
+
+Each automation is run past its 25 stored traces, then run again; what those
+runs retain (leaked listeners, timers, traces) must not keep growing.
+"""
+
+import pytest
+from homeassistant.util import slugify
+
+from tests.helpers.automation_helpers import load_house_automations
+from tests.helpers.memory_tracker import STORED_TRACES
+from tests.helpers.virtual_time import async_settle
+
+# Bytes a run may retain on average (cache noise), a leaked condition or
+# listener retains well over 700 bytes per run
+MAX_RETAINED_PER_RUN = 512
+
+# Runs before measuring: automations triggered along the way (mode -> scenes,
+# camera -> away mode control) fill their own trace stores more slowly
+WARMUP_RUNS = 4 * STORED_TRACES
+
+# Virtual seconds let pass per step while waiting for a run to finish: small
+# steps, so mode.yaml's half-hourly runs (and their traces, still filling up)
+# land in one measured window at most
+RUN_STEP_SECONDS = 1
+MAX_RUN_STEPS = 600
+
+# Devices the automations read, so runs do not fail on unknown entities
+DEVICES = {
+    "light.living_room_lamp": "off",
+    "light.study_lamp": "off",
+    "sensor.living_room_cam_power": "off",
+    "binary_sensor.study_motion_sensor_occupancy": "off",
+    "sensor.study_motion_sensor_illuminance": "120",
+    "climate.living_room_aircon": "off",
+}
+
+HOUSE_AUTOMATIONS = [
+    f"automation.{slugify(automation['alias'])}" for automation in load_house_automations()
+]
+
+
+def running(hass, entity_id: str) -> bool:
+    """Return whether the automation, or a timer it started, is still running."""
+    # The end-of-day detector's run ends at once, its 5-minute signal timer
+    # would outlive the test
+    return bool(hass.states.get(entity_id).attributes.get("current")) or any(
+        timer.state == "active" for timer in hass.states.async_all("timer")
+    )
+
+
+async def run_to_completion(automation_test, entity_id: str) -> None:
+    """Trigger an automation and let virtual time pass until it and its timers have finished."""
+    hass = automation_test.hass
+    # The recorder reuses its slots once cleared, so it does not grow
+    automation_test.recorder.clear()
+    await hass.services.async_call(
+        "automation", "trigger", {"entity_id": entity_id, "skip_condition": True}
+    )
+    await async_settle(hass)
+    for _ in range(MAX_RUN_STEPS):
+        if not running(hass, entity_id):
+            return
+        await automation_test.elapse(RUN_STEP_SECONDS)
+    pytest.fail(f"{entity_id} still running after {RUN_STEP_SECONDS * MAX_RUN_STEPS}s")
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("entity_id", HOUSE_AUTOMATIONS)
+async def test_repeated_runs_do_not_leak(automation_test, memory_tracker, entity_id):
+    """Test that running an automation again and again retains no memory."""
+    await automation_test.setup_house(entities=DEVICES)
+
+    growth = await memory_tracker.measure_growth(
+        entity_id, lambda: run_to_completion(automation_test, entity_id), warmup=WARMUP_RUNS
+    )
+
+    assert growth.per_run < MAX_RETAINED_PER_RUN, "\n".join(
+        [f"{entity_id} retained {growth.per_run:.0f} bytes per run:", *growth.top]
+    )
@@ -1,4 +1,6 @@
-"""Tests for Bedroom Lights automation (blueprint-based)."""
+"""Tests for Bedroom Lights automation (IKEA E1743 controller)."""
+
+from homeassistant.setup import async_setup_component
 
 
 async def test_button_up_turns_lights_on(automation_test):
@@ -7,7 +9,6 @@ async def test_button_up_turns_lights_on(automation_test):
         automation=("bedroom", "lights.yaml"),
         entities={
             "switch.bedroom_lights_switch": "off",
-            "input_text.sam_bedroom_switch": "",
         },
         mock_service=("switch", "turn_on"),
         automation_entity_id="automation.study_lights",
@@ -22,8 +23,8 @@ async def test_button_up_turns_lights_on(automation_test):
         },
     )
 
-    # Note: In a real scenario with the full blueprint logic, this would trigger
-    # For now, this test serves as a template for blueprint testing
+    automation_test.assert_service_call_count(1)
+    assert automation_test.service_calls[0].entity_ids == ("switch.bedroom_lights_switch",)
 
 
 async def test_button_down_turns_lights_off(automation_test):
@@ -32,7 +33,6 @@ async def test_button_down_turns_lights_off(automation_test):
         automation=("bedroom", "lights.yaml"),
         entities={
             "switch.bedroom_lights_switch": "on",
-            "input_text.sam_bedroom_switch": "",
         },
         mock_service=("switch", "turn_off"),
         automation_entity_id="automation.study_lights",
@@ -47,5 +47,115 @@ async def test_button_down_turns_lights_off(automation_test):
         },
     )
 
-    # Note: In a real scenario with the full blueprint logic, this would trigger
-    # For now, this test serves as a template for blueprint testing
+    automation_test.assert_service_call_count(1)
+    assert automation_test.service_calls[0].entity_ids == ("switch.bedroom_lights_switch",)
+
+
+REMOTE = "7b82711377bc14f56b57e69c5d16159f"
+HOLD_UP = {"device_id": REMOTE, "command": "move_with_on_off", "args": [0, 83]}
+HOLD_DOWN = {"device_id": REMOTE, "command": "move", "args": [1, 83]}
+RELEASE = {"device_id": REMOTE, "command": "stop", "args": []}
+LAMP = "light.bedroom_lamp_light"
+
+
+async def setup_long_press(automation_test, lights: list[str] | None = None):
+    """Set up the automation with a real controller event helper.
+
+    Args:
+        automation_test: Test context
+        lights: Lights to step while a button is held, the bedroom lamp by default
+    """
+    hass = automation_test.hass
+    assert await async_setup_component(
+        hass, "input_text", {"input_text": {"sam_bedroom_switch": {"max": 255}}}
+    )
+    await automation_test.setup(
+        automation=("bedroom", "lights.yaml"),
+        mock_service=("light", "turn_on"),
+        automation_entity_id="automation.study_lights",
+        variables={"long_press_lights": [LAMP] if lights is None else lights},
+    )
+
+
+async def hold(automation_test, seconds: float):
+    """Let time pass in small steps, so every loop iteration falls due."""
+    for _ in range(round(seconds / 0.1)):
+        await automation_test.elapse(0.1)
+
+
+def state_writes(automation_test) -> int:
+    """Return the number of writes to the controller event helper."""
+    return automation_test.recorder.count("input_text", "set_value")
+
+
+async def test_long_press_is_rate_capped(automation_test):
+    """Test that holding the button steps the lamp at most twice a second."""
+    await setup_long_press(automation_test)
+
+    await automation_test.fire_event("zha_event", HOLD_UP, wait=False)
+    for tenths in range(1, 29):
+        await hold(automation_test, 0.1)
+        assert len(automation_test.service_calls) <= 2 * tenths / 10 + 1
+
+    await automation_test.fire_event("zha_event", RELEASE, wait=False)
+    await hold(automation_test, 5)
+
+    assert len(automation_test.service_calls) == 6
+    assert {call.data["brightness_step_pct"] for call in automation_test.service_calls} == {10}
+    assert state_writes(automation_test) == 2
+
+
+async def test_long_press_is_capped_at_max_iterations(automation_test):
+    """Test that a button held down for a minute sends at most 10 commands."""
+    await setup_long_press(automation_test)
+
+    await automation_test.fire_event("zha_event", HOLD_DOWN, wait=False)
+    await hold(automation_test, 60)
+
+    assert len(automation_test.service_calls) == 10
+    assert automation_test.service_calls[0].data["brightness_step_pct"] == -10
+    # Only the start is written while the button is held
+    assert state_writes(automation_test) == 1
+
+    await automation_test.fire_event("zha_event", RELEASE, wait=False)
+    assert state_writes(automation_test) == 2
+
+
+async def test_long_press_steps_no_light_by_default(automation_test):
+    """Test that holding a button only records the press unless lights are set."""
+    await setup_long_press(automation_test, lights=[])
+
+    await automation_test.fire_event("zha_event", HOLD_UP, wait=False)
+    await hold(automation_test, 3)
+    await automation_test.fire_event("zha_event", RELEASE, wait=False)
+
+    assert automation_test.service_calls == []
+    assert state_writes(automation_test) == 2
+
+
+async def test_release_without_long_press_writes_nothing(automation_test):
+    """Test that short presses and stray releases do not write the helper."""
+    await setup_long_press(automation_test)
+
+    for event in (RELEASE, {"device_id": REMOTE, "command": "on", "args": []}, RELEASE):
+        await automation_test.fire_event("zha_event", event, wait=False)
+        await automation_test.elapse(1)
+
+    assert state_writes(automation_test) == 0
+
+
+async def test_any_remote_event_stops_a_long_press(automation_test):
+    """Test that an event no button is mapped to still restarts the run."""
+    await setup_long_press(automation_test)
+
+    await automation_test.fire_event("zha_event", HOLD_UP, wait=False)
+    await hold(automation_test, 1.2)
+    steps = len(automation_test.service_calls)
+    await automation_test.fire_event(
+        "zha_event", {"device_id": REMOTE, "command": "stop_with_on_off", "args": []}, wait=False
+    )
+    await hold(automation_test, 5)
+
+    assert len(automation_test.service_calls) == steps
+    # Not a release of the long press
+    assert state_writes(automation_test) == 1
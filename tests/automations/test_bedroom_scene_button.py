@@ -58,3 +58,27 @@ async def test_button_off_changes_mode_to_sleep(automation_test):
 
     # Verify house mode was changed to sleep
     automation_test.assert_option_selected("sleep")
+
+
+async def test_button_burst_only_applies_last_press(automation_test):
+    """Test that mashing the button only applies the final press."""
+    await automation_test.setup(
+        automation=("bedroom", "scene_button.yaml"),
+        entities={
+            "input_select.house_mode": "relaxation",
+        },
+        mock_services=[("scene", "turn_on"), ("input_select", "select_option")],
+    )
+
+    for command in ("on", "off", "on", "off", "on", "off"):
+        await automation_test.fire_event(
+            "zha_event",
+            {"device_id": "91cf3416653ada66678a711fa944bab6", "command": command},
+            wait=False,
+        )
+        await automation_test.elapse(0.1)
+
+    await automation_test.elapse(2)
+
+    assert automation_test.service_calls_for("scene", "turn_on") == []
+    automation_test.assert_option_selected("sleep")
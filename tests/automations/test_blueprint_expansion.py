@@ -0,0 +1,140 @@
+"""Tests that the expanded remote automations behave like their blueprints.
+
+bedroom/lights.yaml and living_room/lamp.yaml were expanded from blueprint
+instances (kept in tests/fixtures/blueprint_instances). Both forms are
+replayed the same button presses and must make the same device calls.
+"""
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from tests.helpers.automation_helpers import setup_automation
+from tests.helpers.virtual_time import VirtualClock, async_settle
+
+BEDROOM_REMOTE = "7b82711377bc14f56b57e69c5d16159f"
+LIVING_ROOM_REMOTE = "0bcce5e44bede1b27d565eba97c2ac56"
+
+DEVICE_SERVICES = [
+    ("switch", "turn_on"),
+    ("switch", "turn_off"),
+    ("light", "turn_on"),
+    ("light", "turn_off"),
+]
+
+
+def living_room_event(command: str, cluster_id: int, args: list | None = None) -> dict:
+    """Return the zha_event data the four button remote sends."""
+    return {
+        "device_id": LIVING_ROOM_REMOTE,
+        "command": command,
+        "cluster_id": cluster_id,
+        "endpoint_id": 1,
+        "args": args or [],
+    }
+
+
+# (event data, seconds to let pass afterwards)
+# The instance maps no long press action, and the expansion steps no light
+# while a button is held by default (see test_bedroom_lights)
+BEDROOM_PRESSES = [
+    ({"device_id": BEDROOM_REMOTE, "command": "on", "args": []}, 1),
+    ({"device_id": BEDROOM_REMOTE, "command": "move_with_on_off", "args": [0, 83]}, 2),
+    ({"device_id": BEDROOM_REMOTE, "command": "stop", "args": []}, 1),
+    ({"device_id": BEDROOM_REMOTE, "command": "off", "args": []}, 1),
+]
+
+LIVING_ROOM_PRESSES = [
+    (living_room_event("on", 6), 1),
+    (living_room_event("move_with_on_off", 8, [0, 83]), 1.2),
+    (living_room_event("stop_with_on_off", 8), 3),
+    (living_room_event("move", 8, [1, 83]), 0.7),
+    (living_room_event("stop", 8), 3),
+    # A button with no action still restarts the run, which stops the hold loop
+    (living_room_event("move_with_on_off", 8, [0, 83]), 1.2),
+    (living_room_event("hold", 5, [3329, 0]), 3),
+    (living_room_event("press", 5, [257, 13, 0]), 1),
+    (living_room_event("press", 5, [256, 13, 0]), 1),
+    (living_room_event("off", 6), 1),
+]
+
+
+async def setup_both(hass: HomeAssistant, blueprint: dict, expanded: dict) -> None:
+    """Set up both forms side by side, as automation.blueprint and automation.expanded."""
+    assert await setup_automation(
+        hass,
+        [
+            {**blueprint, "id": "blueprint", "alias": "Blueprint"},
+            {**expanded, "id": "expanded", "alias": "Expanded"},
+        ],
+    )
+
+
+async def replay(
+    hass: HomeAssistant, service_recorder, clock: VirtualClock, form: str, presses
+) -> list:
+    """Replay button presses against one form and return its device calls.
+
+    Args:
+        hass: Home Assistant instance
+        service_recorder: Recorder with the device services mocked
+        clock: Virtual clock stepping through the hold loops' delays
+        form: "blueprint" or "expanded", the other form is turned off
+        presses: (event data, seconds to let pass afterwards) tuples
+    """
+    other = "expanded" if form == "blueprint" else "blueprint"
+    await hass.services.async_call(
+        "automation", "turn_off", {"entity_id": f"automation.{other}"}, blocking=True
+    )
+    await hass.services.async_call(
+        "automation", "turn_on", {"entity_id": f"automation.{form}"}, blocking=True
+    )
+    service_recorder.clear()
+
+    for event_data, seconds in presses:
+        hass.bus.async_fire("zha_event", event_data)
+        await async_settle(hass)
+        # Step through the hold loops' delays
+        for _ in range(round(seconds / 0.1)):
+            await clock.advance(0.1)
+
+    return [
+        (call.domain, call.service, call.data)
+        for call in service_recorder.calls()
+        if (call.domain, call.service) in DEVICE_SERVICES
+    ]
+
+
+@pytest.mark.parametrize(
+    ("category", "filename", "instance", "presses"),
+    [
+        ("bedroom", "lights.yaml", "bedroom_lights", BEDROOM_PRESSES),
+        ("living_room", "lamp.yaml", "living_room_lamp", LIVING_ROOM_PRESSES),
+    ],
+)
+async def test_expanded_matches_blueprint(
+    hass: HomeAssistant,
+    service_recorder,
+    repo_config_dir,
+    load_automation,
+    load_fixture,
+    category,
+    filename,
+    instance,
+    presses,
+):
+    """Test that the expanded automation makes the same calls as the blueprint."""
+    service_recorder.mock(*DEVICE_SERVICES, ("input_text", "set_value"))
+    hass.states.async_set("input_text.sam_bedroom_switch", "")
+    await setup_both(
+        hass,
+        load_fixture("blueprint_instances", instance),
+        load_automation(category, filename),
+    )
+
+    clock = VirtualClock(hass)
+    blueprint_calls = await replay(hass, service_recorder, clock, "blueprint", presses)
+    expanded_calls = await replay(hass, service_recorder, clock, "expanded", presses)
+    clock.stop()
+
+    assert blueprint_calls
+    assert expanded_calls == blueprint_calls
@@ -213,6 +213,45 @@ async def test_unmapped_mode_does_not_activate_scenes(automation_test):
     automation_test.assert_no_service_calls()
 
 
+async def test_restored_mode_does_not_activate_scenes(automation_test):
+    """Test that the mode coming back after the helper was unavailable applies nothing."""
+    await automation_test.setup(
+        automation=("house", "apply_mode_scenes.yaml"),
+        entities={
+            "input_select.house_mode": "sleep",
+        },
+        mock_service=("scene", "turn_on"),
+    )
+
+    # The helper reloaded, coming back with the mode it had
+    await automation_test.state_change("input_select.house_mode", "unavailable", "sleep")
+    await automation_test.state_change("input_select.house_mode", "sleep")
+    # An attribute change alone
+    automation_test.hass.states.async_set("input_select.house_mode", "sleep", {"icon": "mdi:home"})
+    await automation_test.hass.async_block_till_done()
+
+    automation_test.assert_no_service_calls()
+
+
+async def test_manual_run_applies_the_current_mode(automation_test):
+    """Test that running the automation by hand applies the current mode's scenes."""
+    await automation_test.setup(
+        automation=("house", "apply_mode_scenes.yaml"),
+        entities={
+            "input_select.house_mode": "bedtime",
+        },
+        mock_service=("scene", "turn_on"),
+    )
+
+    # No state trigger, so no to_state to read the mode from
+    await automation_test.trigger_automation()
+    await automation_test.elapse(1)
+
+    assert [call.entity_ids for call in automation_test.service_calls] == [
+        ("scene.bedroom_bed_time",)
+    ]
+
+
 async def test_scene_activation_includes_transition(automation_test):
     """Test that scene activation includes transition time."""
     await automation_test.setup(
@@ -230,3 +269,51 @@ async def test_scene_activation_includes_transition(automation_test):
     assert len(automation_test.service_calls) >= 1
     call = automation_test.service_calls[0]
     assert call.data.get("transition") == 2.5
+
+
+async def test_rapid_mode_changes_only_apply_final_mode(automation_test):
+    """Test that a burst of mode changes only applies the final mode's scenes."""
+    await automation_test.setup(
+        automation=("house", "apply_mode_scenes.yaml"),
+        entities={
+            "input_select.house_mode": "away",
+            "input_boolean.sam_home": "on",
+            "input_boolean.maddy_home": "off",
+        },
+        mock_service=("scene", "turn_on"),
+    )
+
+    # Returning home at wake up time: away -> default -> sleep -> work
+    for mode in ("default", "sleep", "work"):
+        await automation_test.state_change("input_select.house_mode", mode, wait=False)
+        await automation_test.elapse(0.05)
+
+    # Time to settle: the final mode is applied once the 500ms delay passes
+    settled_after = 0.0
+    while not automation_test.service_calls and settled_after < 2:
+        await automation_test.elapse(0.05)
+        settled_after += 0.05
+    await automation_test.elapse(2)
+
+    assert settled_after <= 0.5
+    assert len(automation_test.service_calls) == 1
+    assert automation_test.service_calls[0].entity_ids == ("scene.study_work",)
+
+
+async def test_spaced_mode_changes_each_apply(automation_test):
+    """Test that mode changes further apart than the settle delay are all applied."""
+    await automation_test.setup(
+        automation=("house", "apply_mode_scenes.yaml"),
+        entities={"input_select.house_mode": "default"},
+        mock_service=("scene", "turn_on"),
+    )
+
+    await automation_test.state_change("input_select.house_mode", "bedtime", wait=False)
+    await automation_test.elapse(1)
+    await automation_test.state_change("input_select.house_mode", "sleep", wait=False)
+    await automation_test.elapse(1)
+
+    assert [call.entity_ids[0] for call in automation_test.service_calls] == [
+        "scene.bedroom_bed_time",
+        "scene.living_room_sleep",
+    ]
@@ -0,0 +1,73 @@
+"""Tests for House End of Day Detector, with the whole house loaded.
+
+The signal is a 5-minute timer: a run starts it and ends at once, so
+nothing waits in the queue, and a signal while the timer is active is
+left out, so mode.yaml sees one signal.
+"""
+
+from datetime import datetime
+from homeassistant.util import dt as dt_util
+
+DETECTOR = "automation.house_end_of_day_detector"
+SIGNAL = "timer.end_of_day_signal"
+
+# Monday, in the bedtime window
+EVENING = datetime(2025, 1, 20, 21, 30, 0, tzinfo=dt_util.DEFAULT_TIME_ZONE)
+
+RELAXING = {
+    "input_select.house_mode": "relaxation",
+    "input_boolean.house_mode_away": "off",
+    "input_boolean.holidays": "off",
+    "media_player.lounge_room": "on",
+}
+
+
+def runs_in_progress(automation_test) -> int:
+    """Return the detector's runs in progress, running or queued."""
+    return automation_test.hass.states.get(DETECTOR).attributes["current"]
+
+
+def bedtime_selections(automation_test) -> int:
+    """Return the number of times bedtime mode was selected."""
+    return sum(
+        call.data.get("option") == "bedtime"
+        for call in automation_test.recorder.calls("input_select", "select_option")
+    )
+
+
+async def test_signal_is_a_pulse_and_the_run_ends_at_once(automation_test):
+    """Test that a signal starts the timer without a run waiting for it to end."""
+    await automation_test.setup_house(entities=RELAXING, time=EVENING)
+
+    await automation_test.state_change("media_player.lounge_room", "off", wait=False)
+
+    assert runs_in_progress(automation_test) == 0
+    assert automation_test.hass.states.get(SIGNAL).state == "active"
+    assert automation_test.hass.states.get("input_select.house_mode").state == "bedtime"
+
+    await automation_test.elapse(5 * 60)
+    assert automation_test.hass.states.get(SIGNAL).state == "idle"
+
+
+async def test_repeated_signals_coalesce(automation_test):
+    """Test that signals while the timer is active queue nothing and signal once."""
+    await automation_test.setup_house(entities=RELAXING, time=EVENING)
+
+    for _ in range(4):
+        await automation_test.state_change("media_player.lounge_room", "off", wait=False)
+        assert runs_in_progress(automation_test) == 0
+        await automation_test.elapse(60)
+        await automation_test.state_change("media_player.lounge_room", "on", wait=False)
+
+    assert automation_test.recorder.count("timer", "start") == 1
+    assert bedtime_selections(automation_test) == 1
+
+    # 5 minutes after the first signal, the next one is a new end of day
+    await automation_test.elapse(60)
+    assert automation_test.hass.states.get(SIGNAL).state == "idle"
+    await automation_test.state_change("media_player.lounge_room", "off", wait=False)
+    assert automation_test.hass.states.get(SIGNAL).state == "active"
+
+    # Let the new signal end, so its timer does not outlive the test
+    await automation_test.elapse(5 * 60)
+    assert automation_test.hass.states.get(SIGNAL).state == "idle"
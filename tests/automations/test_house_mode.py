@@ -10,7 +10,7 @@ def get_default_entities():
         "input_select.house_mode": "default",
         "input_boolean.house_mode_away": "off",
         "input_boolean.holidays": "off",
-        "input_boolean.end_of_day_signal": "off",
+        "timer.end_of_day_signal": "idle",
         # Input datetime helpers with default schedule values
         "input_datetime.wake_up_weekday_start": "06:00:00",
         "input_datetime.wake_up_weekday_end": "08:00:00",
@@ -39,7 +39,7 @@ async def test_bedtime_mode_when_end_of_day_signal_at_night(automation_test):
     )
 
     # Trigger end-of-day signal
-    await automation_test.state_change("input_boolean.end_of_day_signal", "on", "off")
+    await automation_test.state_change("timer.end_of_day_signal", "active", "idle")
 
     # Verify bedtime mode was selected
     automation_test.assert_option_selected("bedtime")
@@ -55,7 +55,7 @@ async def test_no_bedtime_mode_when_end_of_day_signal_during_day(automation_test
     )
 
     # Trigger end-of-day signal during the day
-    await automation_test.state_change("input_boolean.end_of_day_signal", "on", "off")
+    await automation_test.state_change("timer.end_of_day_signal", "active", "idle")
 
     # Bedtime should NOT be triggered
     automation_test.assert_option_not_selected("bedtime")
@@ -374,5 +374,5 @@ async def test_full_weekday_mode_transitions(automation_test):
 
     # 22:00 - End-of-day signal triggers -> Bedtime mode (21:00-00:00)
     await automation_test.advance_time(datetime(2025, 1, 20, 22, 0, 0, tzinfo=dt_util.DEFAULT_TIME_ZONE))
-    await automation_test.state_change("input_boolean.end_of_day_signal", "on", "off")
+    await automation_test.state_change("timer.end_of_day_signal", "active", "idle")
     assert automation_test.hass.states.get("input_select.house_mode").state == "bedtime"
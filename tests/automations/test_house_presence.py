@@ -0,0 +1,115 @@
+"""Tests for House Presence, the table-driven presence engine."""
+
+import pytest
+
+SERVICES = [("light", "turn_off"), ("scene", "turn_on")]
+
+# Presence entity, the lights turned off when leaving, the scene applied when arriving
+OCCUPANTS = [
+    ("input_boolean.sam_home", ("light.study_lights", "light.study_lamp"), "scene.study_work"),
+    ("input_boolean.maddy_home", ("light.maddys_desk_lamp_light",), "scene.dining_room_work"),
+]
+
+
+def test_every_occupant_mode_passes_the_state_check(load_automation):
+    """Test that the state check ahead of the template lets every row's modes through."""
+    presence = load_automation("house", "presence.yaml")
+    mode_check = presence["conditions"][0]
+    rows = [trigger["variables"] for trigger in presence["triggers"]]
+
+    assert mode_check["condition"] == "state"
+    assert all(set(row) == {"modes", "lights", "scene"} for row in rows)
+    assert set(mode_check["state"]) == {mode for row in rows for mode in row["modes"]}
+
+
+@pytest.mark.parametrize(("entity_id", "lights", "scene"), OCCUPANTS)
+async def test_leaving_during_work_turns_off_their_lights(
+    automation_test, entity_id, lights, scene
+):
+    """Test that an occupant leaving in work mode turns their lights off."""
+    await automation_test.setup(
+        automation=("house", "presence.yaml"),
+        entities={"input_select.house_mode": "work", entity_id: "on"},
+        mock_services=SERVICES,
+    )
+
+    await automation_test.state_change(entity_id, "off")
+
+    [call] = automation_test.service_calls
+    assert (call.domain, call.service) == ("light", "turn_off")
+    assert call.entity_ids == lights
+
+
+@pytest.mark.parametrize(("entity_id", "lights", "scene"), OCCUPANTS)
+async def test_arriving_during_work_applies_their_scene(
+    automation_test, entity_id, lights, scene
+):
+    """Test that an occupant arriving in work mode gets their scene."""
+    await automation_test.setup(
+        automation=("house", "presence.yaml"),
+        entities={"input_select.house_mode": "work", entity_id: "off"},
+        mock_services=SERVICES,
+    )
+
+    await automation_test.state_change(entity_id, "on")
+
+    [call] = automation_test.service_calls
+    assert (call.domain, call.service) == ("scene", "turn_on")
+    assert call.entity_ids == (scene,)
+    assert call.data["transition"] == 2.5
+
+
+@pytest.mark.parametrize("house_mode", ["default", "sleep", "away"])
+async def test_outside_their_modes_does_nothing(automation_test, house_mode):
+    """Test that presence changes outside an occupant's modes leave the lights alone."""
+    await automation_test.setup(
+        automation=("house", "presence.yaml"),
+        entities={"input_select.house_mode": house_mode, "input_boolean.sam_home": "on"},
+        mock_services=SERVICES,
+    )
+
+    await automation_test.state_change("input_boolean.sam_home", "off")
+    await automation_test.state_change("input_boolean.sam_home", "on")
+
+    automation_test.assert_no_service_calls()
+
+
+async def test_occupants_are_handled_independently(automation_test):
+    """Test that one occupant leaving as another arrives only affects each one's room."""
+    await automation_test.setup(
+        automation=("house", "presence.yaml"),
+        entities={
+            "input_select.house_mode": "work",
+            "input_boolean.sam_home": "on",
+            "input_boolean.maddy_home": "off",
+        },
+        mock_services=SERVICES,
+    )
+
+    automation_test.hass.states.async_set("input_boolean.sam_home", "off")
+    await automation_test.state_change("input_boolean.maddy_home", "on")
+
+    assert sorted((call.service, call.entity_ids) for call in automation_test.service_calls) == [
+        ("turn_off", ("light.study_lights", "light.study_lamp")),
+        ("turn_on", ("scene.dining_room_work",)),
+    ]
+
+
+async def test_flapping_presence_applies_the_last_change_last(automation_test):
+    """Test that a flapping presence sensor's runs follow its changes in order."""
+    await automation_test.setup(
+        automation=("house", "presence.yaml"),
+        entities={"input_select.house_mode": "work", "input_boolean.sam_home": "on"},
+        mock_services=SERVICES,
+    )
+
+    for state in ("off", "on", "off", "on"):
+        automation_test.hass.states.async_set("input_boolean.sam_home", state)
+    await automation_test.hass.async_block_till_done()
+
+    assert [call.service for call in automation_test.service_calls] == [
+        "turn_off",
+        "turn_on",
+        "turn_off",
+        "turn_on",
+    ]
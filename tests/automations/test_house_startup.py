@@ -0,0 +1,176 @@
+"""Tests for House Startup, with the whole house loaded and started."""
+
+from datetime import datetime
+from homeassistant.core import State
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import mock_restore_cache
+
+# Monday, during work hours
+WORK_HOURS = datetime(2025, 1, 20, 10, 0, 0, tzinfo=dt_util.DEFAULT_TIME_ZONE)
+
+# Everything already matches: work mode during work hours, camera and lamp off
+RECONCILED = {
+    "input_select.house_mode": "work",
+    "input_boolean.house_mode_away": "off",
+    "input_boolean.holidays": "off",
+    "input_boolean.living_room_camera_state": "off",
+    "sensor.living_room_cam_power": "off",
+    "binary_sensor.study_motion_sensor_occupancy": "off",
+    "sensor.study_motion_sensor_illuminance": "120",
+    "light.study_lamp": "off",
+}
+
+# Monday, in the middle of the night
+NIGHT = datetime(2025, 1, 20, 3, 0, 0, tzinfo=dt_util.DEFAULT_TIME_ZONE)
+
+# The house as a restart finds it, less the house mode
+RESTARTED = {key: value for key, value in RECONCILED.items() if key != "input_select.house_mode"}
+
+RECONCILE_ORDER = [
+    "automation.house_mode_control",
+    "automation.living_room_camera",
+    "automation.study_lamp",
+]
+
+OUTBOUND_DOMAINS = ("shell_command", "light", "scene")
+
+
+def reconciled(automation_test) -> list[str]:
+    """Return the automations run by the startup phase, in order."""
+    return [
+        call.entity_ids[0]
+        for call in automation_test.recorder.calls("automation", "trigger")
+    ]
+
+
+async def restart(automation_test, house_mode: str | None) -> None:
+    """Start the house at night as after a restart, with the house mode it had before.
+
+    Args:
+        automation_test: Test context
+        house_mode: House mode saved at shutdown, None for a first start
+    """
+    if house_mode:
+        mock_restore_cache(automation_test.hass, [State("input_select.house_mode", house_mode)])
+    await automation_test.setup_house(entities=RESTARTED, time=NIGHT, started=False)
+    await automation_test.start_house()
+    # Reconciled, then past apply_mode_scenes.yaml's settle delay
+    await automation_test.elapse(10)
+    await automation_test.elapse(1)
+
+
+def outbound_calls(automation_test) -> int:
+    """Return the number of calls made to devices outside Home Assistant."""
+    return sum(automation_test.recorder.count(domain) for domain in OUTBOUND_DOMAINS)
+
+
+async def test_start_reconciles_once_in_order(automation_test):
+    """Test that a start evaluates each automation once, in a defined order."""
+    await automation_test.setup_house(entities=RECONCILED, time=WORK_HOURS, started=False)
+
+    await automation_test.start_house()
+    assert reconciled(automation_test) == []
+
+    await automation_test.elapse(10)
+
+    assert reconciled(automation_test) == RECONCILE_ORDER
+
+
+async def test_start_skips_outbound_calls_when_state_matches(automation_test):
+    """Test that no device is commanded on start when everything already matches."""
+    await automation_test.setup_house(entities=RECONCILED, time=WORK_HOURS, started=False)
+
+    await automation_test.start_house()
+    await automation_test.elapse(10)
+
+    assert outbound_calls(automation_test) == 0
+    assert automation_test.recorder.count("input_select", "select_option") == 1
+    assert automation_test.hass.states.get("input_select.house_mode").state == "work"
+
+
+async def test_start_waits_for_dependent_entities(automation_test):
+    """Test that reconciling waits until the camera power sensor is available."""
+    await automation_test.setup_house(
+        entities={**RECONCILED, "sensor.living_room_cam_power": "unavailable"},
+        time=WORK_HOURS,
+        started=False,
+    )
+
+    await automation_test.start_house()
+    await automation_test.elapse(30)
+    assert reconciled(automation_test) == []
+
+    await automation_test.state_change("sensor.living_room_cam_power", "off", wait=False)
+    await automation_test.elapse(0)
+
+    assert reconciled(automation_test) == RECONCILE_ORDER
+    assert outbound_calls(automation_test) == 0
+
+
+async def test_start_gives_up_waiting_after_timeout(automation_test):
+    """Test that an entity that never becomes available does not block startup."""
+    await automation_test.setup_house(
+        entities={**RECONCILED, "sensor.living_room_cam_power": "unavailable"},
+        time=WORK_HOURS,
+        started=False,
+    )
+
+    await automation_test.start_house()
+    await automation_test.elapse(10)
+    await automation_test.elapse(120)
+
+    assert reconciled(automation_test) == RECONCILE_ORDER
+
+
+async def test_start_corrects_a_mismatched_camera(automation_test):
+    """Test that the camera is commanded on start when it does not match its state."""
+    await automation_test.setup_house(
+        entities={**RECONCILED, "input_boolean.living_room_camera_state": "on"},
+        time=WORK_HOURS,
+        started=False,
+    )
+
+    await automation_test.start_house()
+    await automation_test.elapse(10)
+
+    camera_calls = automation_test.service_calls_for("shell_command")
+    assert [call.service for call in camera_calls] == ["turn_on_living_room_camera"]
+
+
+async def test_reload_storm_reconciles_once(automation_test):
+    """Test that several automation reloads in a row only reconcile the house once."""
+    await automation_test.setup_house(entities=RECONCILED, time=WORK_HOURS)
+
+    for _ in range(5):
+        await automation_test.fire_event("automation_reloaded", wait=False)
+        await automation_test.elapse(1)
+    await automation_test.elapse(10)
+
+    assert reconciled(automation_test) == RECONCILE_ORDER
+    assert outbound_calls(automation_test) == 0
+
+
+async def test_restart_restores_the_house_mode_and_applies_no_scenes(automation_test):
+    """Test that a restart in sleep mode keeps it, without applying any scene."""
+    await restart(automation_test, "sleep")
+
+    assert automation_test.hass.states.get("input_select.house_mode").state == "sleep"
+    assert automation_test.recorder.count("scene", "turn_on") == 0
+
+
+async def test_restart_applies_scenes_once_when_the_mode_changed(automation_test):
+    """Test that a mode due to change while Home Assistant was down changes once."""
+    await restart(automation_test, "relaxation")
+
+    assert automation_test.hass.states.get("input_select.house_mode").state == "sleep"
+    scene_calls = automation_test.recorder.calls("scene", "turn_on")
+    assert len(scene_calls) == 1
+    assert "scene.bedroom_sleep" in scene_calls[0].entity_ids
+
+
+async def test_first_start_applies_scenes_once(automation_test):
+    """Test that with no mode to restore, the mode is computed and applied once."""
+    await restart(automation_test, None)
+
+    assert automation_test.hass.states.get("input_select.house_mode").state == "sleep"
+    assert automation_test.recorder.count("scene", "turn_on") == 1
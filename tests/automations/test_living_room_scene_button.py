@@ -0,0 +1,63 @@
+"""Tests for Living Room Scene Button automation."""
+
+DEVICE_ID = "1219c944e5f66a01ca67e023d01abb3a"
+
+
+async def press(automation_test, command: str):
+    """Press the button without waiting for the debounce to pass."""
+    await automation_test.fire_event(
+        "zha_event", {"device_id": DEVICE_ID, "command": command}, wait=False
+    )
+
+
+async def test_button_on_activates_scene_based_on_house_mode(automation_test):
+    """Test that pressing button on activates the scene for the house mode."""
+    await automation_test.setup(
+        automation=("living_room", "scene_button.yaml"),
+        entities={"input_select.house_mode": "dinner"},
+        mock_service=("scene", "turn_on"),
+    )
+
+    await press(automation_test, "on")
+    await automation_test.elapse(1)
+
+    assert automation_test.service_calls[-1].entity_ids == ("scene.living_room_dinner_lights",)
+
+
+async def test_button_burst_only_applies_last_press(automation_test):
+    """Test that a burst of presses results in a single scene activation."""
+    await automation_test.setup(
+        automation=("living_room", "scene_button.yaml"),
+        entities={"input_select.house_mode": "relaxation"},
+        mock_service=("scene", "turn_on"),
+    )
+
+    for command in ("on", "off", "on", "off", "on"):
+        await press(automation_test, command)
+        await automation_test.elapse(0.1)
+
+    await automation_test.elapse(2)
+
+    assert len(automation_test.service_calls) == 1
+    assert automation_test.service_calls[-1].entity_ids == ("scene.living_room_relaxation_lights",)
+
+
+async def test_press_is_applied_within_debounce_window(automation_test):
+    """Test that a single press is applied once the 500ms debounce passes."""
+    await automation_test.setup(
+        automation=("living_room", "scene_button.yaml"),
+        entities={"input_select.house_mode": "default"},
+        mock_service=("scene", "turn_on"),
+    )
+
+    await press(automation_test, "off")
+    elapsed = 0.0
+    while not automation_test.service_calls and elapsed < 1:
+        await automation_test.elapse(0.05)
+        elapsed += 0.05
+
+    assert 0.45 < elapsed <= 0.55
+    assert automation_test.service_calls[-1].entity_ids == ("scene.living_room_lights_off",)
+
+    await automation_test.elapse(2)
+    assert len(automation_test.service_calls) == 1
@@ -0,0 +1,106 @@
+"""Tests for interactions between automations, with the whole house loaded."""
+
+from datetime import datetime
+from homeassistant.util import dt as dt_util
+
+# Monday, during work hours
+WORK_HOURS = datetime(2025, 1, 20, 10, 0, 0, tzinfo=dt_util.DEFAULT_TIME_ZONE)
+
+
+def scene_entity_ids(calls) -> list[str]:
+    """Return every scene activated by a list of scene.turn_on calls."""
+    entity_ids = []
+    for call in calls:
+        entity_id = call.data.get("entity_id")
+        entity_ids.extend(entity_id if isinstance(entity_id, list) else [entity_id])
+    return entity_ids
+
+
+async def test_all_automations_are_loaded(automation_test):
+    """Test that every automation file is set up in the same session."""
+    await automation_test.setup_house(time=WORK_HOURS)
+
+    automations = automation_test.hass.states.async_entity_ids("automation")
+    assert "automation.house_mode_control" in automations
+    assert "automation.house_apply_mode_scenes" in automations
+    assert "automation.living_room_camera_away_mode_control" in automations
+    assert "automation.living_room_camera" in automations
+    assert "automation.study_lights" in automations
+
+
+async def test_away_mode_cascades_to_scenes_and_camera(automation_test):
+    """Test away -> mode -> away scenes, and away -> camera away mode -> camera."""
+    await automation_test.setup_house(
+        entities={
+            "input_select.house_mode": "work",
+            "input_boolean.house_mode_away": "off",
+            "input_boolean.living_room_camera_state": "off",
+        },
+        time=WORK_HOURS,
+    )
+
+    await automation_test.state_change("input_boolean.house_mode_away", "on")
+
+    hass = automation_test.hass
+    assert hass.states.get("input_select.house_mode").state == "away"
+    scenes = scene_entity_ids(automation_test.service_calls_for("scene", "turn_on"))
+    assert "scene.living_room_away" in scenes
+    assert "scene.bedroom_away" in scenes
+
+    assert hass.states.get("input_boolean.living_room_camera_state").state == "on"
+    camera_calls = automation_test.service_calls_for("shell_command")
+    assert [call.service for call in camera_calls] == ["turn_on_living_room_camera"]
+
+
+async def test_returning_home_restores_work_mode_and_camera(automation_test):
+    """Test returning home during work hours selects work mode and turns the camera off."""
+    await automation_test.setup_house(
+        entities={
+            "input_select.house_mode": "away",
+            "input_boolean.house_mode_away": "on",
+            "input_boolean.living_room_camera_state": "on",
+            "input_boolean.sam_home": "on",
+            "input_boolean.maddy_home": "off",
+        },
+        time=WORK_HOURS,
+    )
+
+    await automation_test.state_change("input_boolean.house_mode_away", "off")
+
+    hass = automation_test.hass
+    assert hass.states.get("input_select.house_mode").state == "work"
+    scenes = scene_entity_ids(automation_test.service_calls_for("scene", "turn_on"))
+    assert scenes == ["scene.study_work"]
+
+    assert hass.states.get("input_boolean.living_room_camera_state").state == "off"
+    camera_calls = automation_test.service_calls_for("shell_command")
+    assert [call.service for call in camera_calls] == ["turn_off_living_room_camera"]
+
+
+async def test_bedroom_button_off_applies_sleep_scenes(automation_test):
+    """Test the bedroom off button -> sleep mode -> sleep scenes in every room."""
+    await automation_test.setup_house(
+        entities={"input_select.house_mode": "bedtime"},
+        time=datetime(2025, 1, 20, 23, 0, 0, tzinfo=dt_util.DEFAULT_TIME_ZONE),
+    )
+
+    await automation_test.fire_event(
+        "zha_event",
+        {"device_id": "91cf3416653ada66678a711fa944bab6", "command": "off"},
+    )
+
+    assert automation_test.hass.states.get("input_select.house_mode").state == "sleep"
+    scenes = scene_entity_ids(automation_test.service_calls_for("scene", "turn_on"))
+    assert "scene.living_room_sleep" in scenes
+    assert "scene.bedroom_sleep" in scenes
+
+
+async def test_living_room_lamp_drives_donut_lamp(automation_test):
+    """Test the donut lamp follows the living room lamp."""
+    await automation_test.setup_house(time=WORK_HOURS)
+
+    await automation_test.state_change("light.living_room_lamp", "on", "off")
+
+    light_calls = automation_test.service_calls_for("light", "turn_on")
+    assert len(light_calls) == 1
+    assert light_calls[0].data["entity_id"] == ["light.donut_lamp"]
@@ -0,0 +1,133 @@
+"""Benchmark the per-run cost of anchors defined under `variables: anchors:`.
+
+Each flattened automation is set up next to the file it was flattened from
+(kept in tests/fixtures/anchor_variables) and both are run the same number
+of times with `automation.trigger`. Reported for each: the time spent
+rendering variables per run, and the size of a stored trace.
+
+Run with `pytest tests/benchmarks -m slow -s` to see the report.
+"""
+
+import json
+import statistics
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from homeassistant.components.trace.const import DATA_TRACE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import ExtendedJSONEncoder
+from homeassistant.helpers.script_variables import ScriptVariables
+
+from tests.automations.test_anchor_flattening import FLATTENED
+from tests.helpers.automation_helpers import setup_automation
+from tests.helpers.virtual_time import VirtualClock
+
+RUNS = 200
+WARMUP = 20
+
+# Every service the automations call
+SERVICES = [
+    ("input_select", "select_option"),
+    ("input_boolean", "turn_on"),
+    ("input_boolean", "turn_off"),
+    ("light", "turn_on"),
+    ("light", "turn_off"),
+    ("scene", "turn_on"),
+    ("shell_command", "turn_on_living_room_camera"),
+    ("shell_command", "turn_off_living_room_camera"),
+]
+
+# Entities the automations' conditions look at
+STATES = {
+    "input_select.house_mode": "default",
+    "input_boolean.holidays": "off",
+    "input_boolean.living_room_camera_state": "off",
+    "sensor.living_room_cam_power": "off",
+    "light.living_room_lamp": "off",
+    "light.study_lamp": "off",
+    "binary_sensor.study_motion_sensor_occupancy": "off",
+    "sensor.study_motion_sensor_illuminance": "100",
+}
+
+
+@contextmanager
+def timed_rendering() -> Iterator[list[float]]:
+    """Time the rendering of variables, adding up the seconds in the list yielded."""
+    seconds = [0.0]
+    async_render = ScriptVariables.async_render
+
+    def _timed(self: ScriptVariables, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            return async_render(self, *args, **kwargs)
+        finally:
+            seconds[0] += time.perf_counter() - start
+
+    with patch.object(ScriptVariables, "async_render", _timed):
+        yield seconds
+
+
+async def run(hass: HomeAssistant, clock: VirtualClock, form: str, runs: int) -> None:
+    """Trigger an automation a number of times, skipping its conditions."""
+    for _ in range(runs):
+        await hass.services.async_call(
+            "automation",
+            "trigger",
+            {"entity_id": f"automation.{form}", "skip_condition": True},
+        )
+        # Past the scene button's debounce delay
+        await clock.advance(1)
+
+
+def trace_size(hass: HomeAssistant, form: str) -> float:
+    """Return the mean size in bytes of the stored traces of an automation."""
+    traces = hass.data[DATA_TRACE][f"automation.{form}"].values()
+    return statistics.mean(
+        len(json.dumps(trace.as_dict(), cls=ExtendedJSONEncoder)) for trace in traces
+    )
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(("category", "filename", "fixture"), FLATTENED)
+async def test_flattened_runs_render_less(
+    hass: HomeAssistant,
+    service_recorder,
+    load_automation,
+    load_fixture,
+    category,
+    filename,
+    fixture,
+):
+    """Test that runs of the flattened automation render less and store smaller traces."""
+    service_recorder.mock(*SERVICES)
+    for entity_id, state in STATES.items():
+        hass.states.async_set(entity_id, state)
+    assert await setup_automation(
+        hass,
+        [
+            {**load_fixture("anchor_variables", fixture), "id": "anchors", "alias": "Anchors"},
+            {**load_automation(category, filename), "id": "flattened", "alias": "Flattened"},
+        ],
+    )
+
+    clock = VirtualClock(hass)
+    results = {}
+    for form in ("anchors", "flattened"):
+        await run(hass, clock, form, WARMUP)
+        with timed_rendering() as seconds:
+            await run(hass, clock, form, RUNS)
+        results[form] = (seconds[0] / RUNS, trace_size(hass, form))
+    clock.stop()
+    # Turn both off to cancel their timers (mode.yaml's time_pattern)
+    await hass.services.async_call("automation", "turn_off", {"entity_id": "all"}, blocking=True)
+
+    print(f"\n{category}/{filename} over {RUNS} runs")
+    for form, (render, size) in results.items():
+        print(f"  {form:>9}: variables {render * 1e6:8.1f}us per run, trace {size:8.0f} bytes")
+
+    assert results["flattened"][0] < results["anchors"][0]
+    assert results["flattened"][1] < results["anchors"][1]
@@ -0,0 +1,104 @@
+"""Benchmark press-to-action latency of blueprint and expanded remote automations.
+
+Run with `pytest tests/benchmarks -m slow -s` to see the report.
+"""
+
+import statistics
+import time
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from tests.helpers.automation_helpers import setup_automation
+
+PRESSES = 300
+WARMUP = 20
+
+BEDROOM_PRESSES = [
+    {"device_id": "7b82711377bc14f56b57e69c5d16159f", "command": command, "args": []}
+    for command in ("on", "off")
+]
+
+LIVING_ROOM_PRESSES = [
+    {
+        "device_id": "0bcce5e44bede1b27d565eba97c2ac56",
+        "command": command,
+        "cluster_id": 6,
+        "endpoint_id": 1,
+        "args": [],
+    }
+    for command in ("on", "off")
+]
+
+
+async def press_latencies(hass: HomeAssistant, presses: list[dict]) -> list[float]:
+    """Press the buttons in turn and return the seconds until each press was handled."""
+    latencies = []
+    for index in range(WARMUP + PRESSES):
+        start = time.perf_counter()
+        hass.bus.async_fire("zha_event", presses[index % len(presses)])
+        await hass.async_block_till_done()
+        if index >= WARMUP:
+            latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def summary(latencies: list[float]) -> str:
+    """Format the median and 95th percentile in milliseconds."""
+    p95 = statistics.quantiles(latencies, n=20)[-1]
+    return f"median {statistics.median(latencies) * 1000:.3f}ms, p95 {p95 * 1000:.3f}ms"
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    ("category", "filename", "instance", "presses", "device_domain"),
+    [
+        ("bedroom", "lights.yaml", "bedroom_lights", BEDROOM_PRESSES, "switch"),
+        ("living_room", "lamp.yaml", "living_room_lamp", LIVING_ROOM_PRESSES, "light"),
+    ],
+)
+async def test_expanded_presses_are_faster(
+    hass: HomeAssistant,
+    service_recorder,
+    repo_config_dir,
+    load_automation,
+    load_fixture,
+    category,
+    filename,
+    instance,
+    presses,
+    device_domain,
+):
+    """Test that the expanded automation handles a press faster than the blueprint."""
+    service_recorder.mock(
+        (device_domain, "turn_on"), (device_domain, "turn_off"), ("input_text", "set_value")
+    )
+    hass.states.async_set("input_text.sam_bedroom_switch", "")
+    blueprint = load_fixture("blueprint_instances", instance)
+    expanded = load_automation(category, filename)
+    assert await setup_automation(
+        hass,
+        [
+            {**blueprint, "id": "blueprint", "alias": "Blueprint"},
+            {**expanded, "id": "expanded", "alias": "Expanded"},
+        ],
+    )
+
+    results = {}
+    for form, other in (("blueprint", "expanded"), ("expanded", "blueprint")):
+        await hass.services.async_call(
+            "automation", "turn_off", {"entity_id": f"automation.{other}"}, blocking=True
+        )
+        await hass.services.async_call(
+            "automation", "turn_on", {"entity_id": f"automation.{form}"}, blocking=True
+        )
+        service_recorder.clear()
+        results[form] = await press_latencies(hass, presses)
+        # Every press reached the device
+        assert service_recorder.count(device_domain) == WARMUP + PRESSES
+
+    print(f"\n{category}/{filename} press-to-action latency over {PRESSES} presses")
+    for form, latencies in results.items():
+        print(f"  {form:>9}: {summary(latencies)}")
+
+    assert statistics.median(results["expanded"]) < statistics.median(results["blueprint"])
@@ -0,0 +1,116 @@
+"""Benchmark mode.yaml's runs with its conditions ordered cheap-first.
+
+mode.yaml is set up next to the file as it was before its conditions were
+reordered (kept in tests/fixtures/condition_order), with the real helper
+entities, and both are run in the same house states and times of day with
+`automation.trigger`. Mode changes are mocked, so every run starts from
+the same state, and both must choose the same mode. Reported for each:
+the templates rendered per run, which is what cheap-first ordering saves,
+and the time per run.
+
+Run with `pytest tests/benchmarks -m slow -s` to see the report.
+"""
+
+import statistics
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.template import Template
+from homeassistant.util import dt as dt_util
+
+from tests.helpers.automation_helpers import setup_automation, setup_helper_entities
+
+RUNS = 200
+WARMUP = 20
+
+# (house mode, time of day), a Monday unless said otherwise
+SCENARIOS = [
+    ("away", datetime(2025, 1, 20, 10, 0)),
+    ("sleep", datetime(2025, 1, 20, 2, 0)),
+    ("work", datetime(2025, 1, 20, 10, 0)),
+    ("dinner", datetime(2025, 1, 20, 18, 30)),
+    ("default", datetime(2025, 1, 25, 10, 0)),  # Saturday
+]
+
+
+@contextmanager
+def counted_renders() -> Iterator[list[int]]:
+    """Count template renders, adding up in the list yielded."""
+    renders = [0]
+    async_render = Template.async_render
+
+    def _counted(self: Template, *args: Any, **kwargs: Any) -> Any:
+        renders[0] += 1
+        return async_render(self, *args, **kwargs)
+
+    with patch.object(Template, "async_render", _counted):
+        yield renders
+
+
+async def run(hass: HomeAssistant, form: str, runs: int) -> list[float]:
+    """Trigger an automation a number of times, returning the seconds of each run."""
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await hass.services.async_call(
+            "automation", "trigger", {"entity_id": f"automation.{form}"}, blocking=True
+        )
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+@pytest.mark.slow
+async def test_cheap_first_renders_fewer_templates(
+    hass: HomeAssistant, service_recorder, load_automation, load_fixture
+):
+    """Test that runs of the reordered mode.yaml render fewer templates."""
+    await setup_helper_entities(hass)
+    service_recorder.mock(("input_select", "select_option"))
+    assert await setup_automation(
+        hass,
+        [
+            {**load_fixture("condition_order", "house_mode"), "id": "before", "alias": "Before"},
+            {**load_automation("house", "mode.yaml"), "id": "after", "alias": "After"},
+        ],
+    )
+
+    print(f"\nhouse/mode.yaml over {RUNS} runs per scenario")
+    totals = {"before": 0, "after": 0}
+    for mode, now in SCENARIOS:
+        house_mode = hass.states.get("input_select.house_mode")
+        hass.states.async_set("input_select.house_mode", mode, house_mode.attributes)
+        now = now.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+        results = {}
+        chosen = {}
+        with patch("homeassistant.util.dt.now", return_value=now):
+            for form in ("before", "after"):
+                service_recorder.clear()
+                await run(hass, form, WARMUP)
+                with counted_renders() as renders:
+                    durations = await run(hass, form, RUNS)
+                results[form] = (renders[0] / RUNS, statistics.median(durations))
+                totals[form] += renders[0]
+                chosen[form] = {
+                    call.data.get("option") for call in service_recorder.calls("input_select")
+                }
+        print(
+            f"  {mode:>8} at {now:%a %H:%M}: "
+            + ", ".join(
+                f"{form} {rendered:4.1f} templates {median * 1000:6.3f}ms"
+                for form, (rendered, median) in results.items()
+            )
+        )
+        # Both take the same option
+        assert chosen["after"] == chosen["before"]
+        assert results["after"][0] <= results["before"][0]
+
+    # Turn both off to cancel their timers (mode.yaml's time_pattern)
+    await hass.services.async_call("automation", "turn_off", {"entity_id": "all"}, blocking=True)
+
+    assert totals["after"] < totals["before"]
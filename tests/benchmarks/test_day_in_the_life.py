@@ -0,0 +1,283 @@
+"""End-to-end throughput benchmark: a scripted day with the whole house loaded.
+
+The day runs through wake-up and work, both occupants leaving and coming
+back (camera away cycle included), scene button and lamp presses, the Apple
+TV end-of-day signal, bedtime and sleep. Time is virtual, so the day takes
+seconds; what is measured is how fast the house gets through it.
+
+Run with `pytest tests/benchmarks/test_day_in_the_life.py -m slow -s` to see
+the report. Each run is kept in the pytest cache, and the report compares it
+with the previous run, so a slowdown shows up as a trend between commits.
+"""
+
+import statistics
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from typing import Any, NamedTuple
+from unittest.mock import patch
+
+import pytest
+from homeassistant.components.automation import AutomationEntity
+from homeassistant.const import MATCH_ALL
+from homeassistant.core import Event, callback
+from homeassistant.util import dt as dt_util
+
+# Monday, a work day
+DAY = datetime(2025, 1, 20, tzinfo=dt_util.DEFAULT_TIME_ZONE)
+
+# Work days run back to back; the first warms up caches and is not measured.
+# The script is a work day's, so weekends pass with nothing scripted and are
+# not measured either. Throughput is taken from the fastest day, as timeit
+# does: slower days were slowed down by something else running on the machine.
+WORK_DAYS = 16
+SATURDAY = 5
+ONE_DAY = timedelta(days=1)
+
+# Cache key of earlier results, and how many are kept
+HISTORY_KEY = "benchmarks/day_in_the_life"
+HISTORY_LENGTH = 50
+
+LIVING_ROOM_BUTTON = "1219c944e5f66a01ca67e023d01abb3a"
+BEDROOM_BUTTON = "91cf3416653ada66678a711fa944bab6"
+LIVING_ROOM_LAMP_REMOTE = "0bcce5e44bede1b27d565eba97c2ac56"
+
+# Where the house is at midnight
+MIDNIGHT = {
+    "input_select.house_mode": "sleep",
+    "input_boolean.house_mode_away": "off",
+    "input_boolean.sam_home": "on",
+    "input_boolean.maddy_home": "on",
+    "input_boolean.living_room_camera_state": "off",
+    "input_boolean.holidays": "off",
+    "media_player.lounge_room": "off",
+    "light.living_room_lamp": "off",
+    "light.study_lamp": "off",
+    "sensor.living_room_cam_power": "off",
+    "binary_sensor.study_motion_sensor_motion": "off",
+    "binary_sensor.study_motion_sensor_occupancy": "off",
+    "sensor.study_motion_sensor_illuminance": "120",
+    "climate.living_room_aircon": "off",
+}
+
+# Sanity bounds: a day that does much less than this did not really run
+MIN_SERVICE_CALLS = 100
+MIN_EVENTS = 500
+
+
+class Step(NamedTuple):
+    """Something that happens in the house at a time of day."""
+
+    at: timedelta
+    kind: str  # "state", "event" or "trigger"
+    target: str  # Entity, event type or automation
+    data: Any = None
+
+
+def press(at: timedelta, device_id: str, command: str, **data) -> Step:
+    """Return a remote button press."""
+    return Step(at, "event", "zha_event", {"device_id": device_id, "command": command, **data})
+
+
+def hours(value: float) -> timedelta:
+    """Return the time of day `value` hours after midnight."""
+    return timedelta(hours=value)
+
+
+def scripted_day() -> Iterator[Step]:
+    """Yield the steps of a work day, in no particular order."""
+    # The mode control's time_pattern triggers, which only follow real time
+    for half_hour in range(48):
+        yield Step(timedelta(minutes=30 * half_hour), "trigger", "automation.house_mode_control")
+    # The aircon's 02:00 time trigger
+    yield Step(hours(2), "trigger", "automation.living_room_aircon")
+
+    # Wake up
+    yield press(hours(6.5), BEDROOM_BUTTON, "on")
+    yield press(hours(6.75), LIVING_ROOM_LAMP_REMOTE, "on", cluster_id=6, endpoint_id=1)
+    yield Step(hours(6.75), "state", "light.living_room_lamp", "on")
+    yield press(hours(7.75), LIVING_ROOM_LAMP_REMOTE, "off", cluster_id=6, endpoint_id=1)
+    yield Step(hours(7.75), "state", "light.living_room_lamp", "off")
+
+    # Working in the study: motion every quarter hour, light following the sun
+    for quarter in range(9 * 4, 17 * 4):
+        at = timedelta(minutes=15 * quarter)
+        yield Step(at, "state", "binary_sensor.study_motion_sensor_motion", "on")
+        yield Step(at, "state", "binary_sensor.study_motion_sensor_occupancy", "on")
+        yield Step(at + timedelta(minutes=1), "state", "binary_sensor.study_motion_sensor_motion", "off")
+        lux = max(5, 400 - abs(quarter * 15 - 780) // 2)
+        yield Step(at, "state", "sensor.study_motion_sensor_illuminance", str(lux))
+
+    # Presence: Maddy pops out, then both leave for lunch and the house goes away
+    yield Step(hours(10), "state", "input_boolean.maddy_home", "off")
+    yield Step(hours(11.5), "state", "input_boolean.maddy_home", "on")
+    yield Step(hours(12.25), "state", "input_boolean.sam_home", "off")
+    yield Step(hours(12.5), "state", "input_boolean.maddy_home", "off")
+    yield Step(hours(12.5), "state", "input_boolean.house_mode_away", "on")
+    yield Step(hours(12.5) + timedelta(minutes=1), "state", "sensor.living_room_cam_power", "on")
+    yield Step(hours(13.75), "state", "input_boolean.house_mode_away", "off")
+    yield Step(hours(13.75), "state", "input_boolean.sam_home", "on")
+    yield Step(hours(13.75) + timedelta(minutes=1), "state", "sensor.living_room_cam_power", "off")
+    yield Step(hours(14), "state", "input_boolean.maddy_home", "on")
+
+    # Evening: scenes, the Apple TV and the end-of-day signal, then sleep
+    yield Step(hours(17) + timedelta(minutes=5), "state", "binary_sensor.study_motion_sensor_occupancy", "off")
+    yield press(hours(18.25), LIVING_ROOM_BUTTON, "on")
+    yield Step(hours(20), "state", "media_player.lounge_room", "on")
+    yield press(hours(21.5), LIVING_ROOM_BUTTON, "off")
+    yield Step(hours(22.5), "state", "media_player.lounge_room", "off")
+    yield press(hours(23.25), BEDROOM_BUTTON, "off")
+
+
+class DayMetrics:
+    """Count events, time automation runs and track runs in flight.
+
+    A run's latency is the wall time from its trigger to its end. Delays take
+    no virtual time, but a run waiting in one finishes with the next step of
+    the day, so the latency of such runs includes the steps in between.
+    """
+
+    def __init__(self):
+        """Initialize empty metrics (collection starts with `start()`)."""
+        self.events = 0
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._measuring = False
+        self._measured = False
+
+    def start(self, hass) -> None:
+        """Count every bus event and time every automation run."""
+        metrics = self
+        async_trigger = AutomationEntity.async_trigger
+
+        async def _timed_trigger(entity, *args, **kwargs):
+            # Queued runs wait inside async_trigger, so they count as in flight
+            metrics.in_flight += 1
+            metrics.peak_in_flight = max(metrics.peak_in_flight, metrics.in_flight)
+            start = time.perf_counter()
+            try:
+                return await async_trigger(entity, *args, **kwargs)
+            finally:
+                metrics.in_flight -= 1
+                if metrics._measuring:
+                    metrics.latencies[entity.entity_id].append(time.perf_counter() - start)
+
+        @callback
+        def _count(event: Event) -> None:
+            if metrics._measuring:
+                metrics.events += 1
+
+        self._unsub = hass.bus.async_listen(MATCH_ALL, _count)
+        self._patch = patch.object(AutomationEntity, "async_trigger", _timed_trigger)
+        self._patch.start()
+
+    def stop(self) -> None:
+        """Stop collecting."""
+        self._unsub()
+        self._patch.stop()
+
+    def measure(self, measuring: bool) -> None:
+        """Start or pause recording, runs and events of unmeasured days are not kept."""
+        if measuring and not self._measured:
+            # Forget the peak of the warmup day
+            self.peak_in_flight = self.in_flight
+            self._measured = True
+        self._measuring = measuring
+
+
+async def run_day(automation_test, steps: list[Step]) -> None:
+    """Run the steps of a day in order, letting virtual time pass in between."""
+    hass = automation_test.hass
+    now = timedelta()
+    for step in steps:
+        if step.at > now:
+            await automation_test.elapse((step.at - now).total_seconds())
+            now = step.at
+        if step.kind == "state":
+            hass.states.async_set(step.target, step.data)
+        elif step.kind == "event":
+            hass.bus.async_fire(step.target, step.data)
+        else:
+            await hass.services.async_call("automation", "trigger", {"entity_id": step.target})
+    await automation_test.elapse((ONE_DAY - now).total_seconds())
+
+
+def p95(values: list[float]) -> float:
+    """Return the 95th percentile, or the only value."""
+    return statistics.quantiles(values, n=20)[-1] if len(values) > 1 else values[0]
+
+
+def format_report(result: dict[str, Any], latencies: dict[str, list[float]], previous) -> str:
+    """Render the day's throughput and per-automation run latency."""
+    lines = [
+        f"{result['days']} day(s), {result['events']} events, fastest day {result['day_seconds']:.3f}s",
+        f"  events/s          {result['events_per_second']:>10.0f}",
+        f"  service calls     {result['service_calls']:>10}",
+        f"  peak runs queued  {result['peak_queue_depth']:>10}",
+    ]
+    if previous:
+        change = result["events_per_second"] / previous["events_per_second"] - 1
+        lines.append(f"  vs previous run   {change:>+10.1%}")
+    lines.append(f"  {'automation':<48} {'runs':>5} {'p95 ms':>8}")
+    for entity_id, values in sorted(latencies.items(), key=lambda item: -p95(item[1])):
+        lines.append(f"  {entity_id:<48} {len(values):>5} {p95(values) * 1000:>8.2f}")
+    return "\n".join(lines)
+
+
+@pytest.mark.slow
+async def test_day_in_the_life(automation_test, request):
+    """Run simulated work days with the whole house loaded and report throughput."""
+    await automation_test.setup_house(entities=MIDNIGHT, time=DAY)
+    hass = automation_test.hass
+    steps = sorted(scripted_day(), key=lambda step: step.at)
+    metrics = DayMetrics()
+    metrics.start(hass)
+    try:
+        # Warm up
+        await run_day(automation_test, steps)
+        automation_test.recorder.clear()
+
+        day = DAY
+        day_seconds = []
+        while len(day_seconds) < WORK_DAYS - 1:
+            day += ONE_DAY
+            if day.weekday() >= SATURDAY:
+                await automation_test.elapse(ONE_DAY.total_seconds())
+                continue
+            metrics.measure(True)
+            start = time.perf_counter()
+            await run_day(automation_test, steps)
+            day_seconds.append(time.perf_counter() - start)
+            metrics.measure(False)
+    finally:
+        metrics.stop()
+
+    days = len(day_seconds)
+    fastest_day = min(day_seconds)
+    result = {
+        "days": days,
+        "day_seconds": fastest_day,
+        "events": metrics.events,
+        "events_per_second": metrics.events / days / fastest_day,
+        "service_calls": automation_test.recorder.total,
+        "peak_queue_depth": metrics.peak_in_flight,
+        "p95_ms": {
+            entity_id: p95(values) * 1000 for entity_id, values in metrics.latencies.items()
+        },
+    }
+    # No history without the cache (-p no:cacheprovider)
+    cache = getattr(request.config, "cache", None)
+    history = cache.get(HISTORY_KEY, []) if cache is not None else []
+    previous = history[-1] if history else None
+    print(f"\nDay in the life:\n{format_report(result, metrics.latencies, previous)}")
+    if cache is not None:
+        cache.set(HISTORY_KEY, [*history, result][-HISTORY_LENGTH:])
+
+    # The day did what a day does, every day
+    assert metrics.events >= MIN_EVENTS * days
+    assert automation_test.recorder.total >= MIN_SERVICE_CALLS * days
+    assert hass.states.get("input_select.house_mode").state == "sleep"
+    assert "automation.house_end_of_day_detector" in metrics.latencies
+    assert "automation.living_room_camera" in metrics.latencies
@@ -0,0 +1,139 @@
+"""Presence at scale: the table-driven engine against an automation per occupant.
+
+For a growing number of generated occupants, each with a room of two
+lights and a work scene, the house is set up either way:
+
+- table: house/presence.yaml, with a trigger per occupant carrying their
+  row as trigger variables, and a queue sized for the table
+- per occupant: a copy of sam_work.yaml (as it was, kept in
+  tests/fixtures/presence) for each occupant
+
+Reported for each: the automations set up, the trigger listeners they
+attach (one per trigger), the state change callbacks registered for the presence entities, the
+setup time, and the time to handle every occupant leaving and then
+arriving, in work mode.
+
+Run with `pytest tests/benchmarks/test_presence_scale.py -m slow -s` to see
+the report.
+"""
+
+import copy
+import time
+from typing import Any
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import _TRACK_STATE_CHANGE_DATA
+
+from tests.helpers.automation_helpers import setup_automation
+
+OCCUPANT_COUNTS = (2, 10, 50, 200)
+FORMS = ("table", "per occupant")
+
+SERVICES = [("light", "turn_off"), ("scene", "turn_on")]
+
+
+def occupant_entities(count: int) -> list[tuple[str, list[str], str]]:
+    """Return each generated occupant's presence entity, lights and work scene."""
+    return [
+        (
+            f"input_boolean.occupant_{index}_home",
+            [f"light.room_{index}_lights", f"light.room_{index}_lamp"],
+            f"scene.room_{index}_work",
+        )
+        for index in range(1, count + 1)
+    ]
+
+
+def table_engine(presence: dict[str, Any], count: int) -> list[dict[str, Any]]:
+    """Return presence.yaml with a trigger per generated occupant."""
+    config = copy.deepcopy(presence)
+    row_trigger = config["triggers"][0]
+    config["triggers"] = []
+    for index, (entity_id, lights, scene) in enumerate(occupant_entities(count), 1):
+        trigger = copy.deepcopy(row_trigger)
+        trigger["alias"] = f"Occupant {index}"
+        trigger["entity_id"] = entity_id
+        trigger["variables"].update(lights=lights, scene=scene)
+        config["triggers"].append(trigger)
+    # Everyone changes at once: room for a run per occupant and direction
+    config["max"] = 2 * count
+    return [config]
+
+
+def per_occupant(sam_work: dict[str, Any], count: int) -> list[dict[str, Any]]:
+    """Return a copy of sam_work.yaml per generated occupant."""
+    configs = []
+    for index, (entity_id, lights, scene) in enumerate(occupant_entities(count), 1):
+        config = copy.deepcopy(sam_work)
+        config["id"] = f"occupant-{index}-leaving-work-mode"
+        config["alias"] = f"House: Occupant {index} Presence During Work"
+        for trigger in config["triggers"]:
+            trigger["entity_id"] = [entity_id]
+        leaving, arriving = config["action"][0]["choose"]
+        leaving["sequence"][0]["target"]["entity_id"] = lights
+        arriving["sequence"][0]["target"]["entity_id"] = scene
+        configs.append(config)
+    return configs
+
+
+def listeners(hass: HomeAssistant, entity_ids: list[str]) -> tuple[int, int]:
+    """Return the trigger listeners and state change callbacks for some entities."""
+    callbacks = [
+        job
+        for entity_id in entity_ids
+        for job in hass.data[_TRACK_STATE_CHANGE_DATA].callbacks.get(entity_id, [])
+    ]
+    return len({id(job) for job in callbacks}), len(callbacks)
+
+
+async def set_everyone(hass: HomeAssistant, entity_ids: list[str], state: str) -> float:
+    """Change every presence entity at once, returning the seconds until handled."""
+    start = time.perf_counter()
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, state)
+    await hass.async_block_till_done()
+    return time.perf_counter() - start
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("form", FORMS)
+@pytest.mark.parametrize("count", OCCUPANT_COUNTS)
+async def test_presence_listeners_and_run_time(
+    hass: HomeAssistant, service_recorder, load_automation, load_fixture, form, count
+):
+    """Compare the listeners and run time of both forms as occupants are added."""
+    entity_ids = [entity_id for entity_id, _, _ in occupant_entities(count)]
+    hass.states.async_set("input_select.house_mode", "work")
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "on")
+    service_recorder.mock(*SERVICES)
+    if form == "table":
+        configs = table_engine(load_automation("house", "presence.yaml"), count)
+    else:
+        configs = per_occupant(load_fixture("presence", "sam_work"), count)
+
+    start = time.perf_counter()
+    assert await setup_automation(hass, configs)
+    setup_ms = (time.perf_counter() - start) * 1000
+    trigger_listeners, callbacks = listeners(hass, entity_ids)
+
+    leaving = await set_everyone(hass, entity_ids, "off")
+    arriving = await set_everyone(hass, entity_ids, "on")
+
+    print(
+        f"\nPresence, {count:>3} occupants, {form:>12}: "
+        f"{len(hass.states.async_entity_ids('automation')):>3} automations, "
+        f"{trigger_listeners:>3} trigger listeners, {callbacks:>3} callbacks, "
+        f"setup {setup_ms:7.1f}ms, leaving {leaving * 1000:7.1f}ms, "
+        f"arriving {arriving * 1000:7.1f}ms"
+    )
+
+    # Every occupant's lights off, and their scene back on
+    assert service_recorder.count("light", "turn_off") == count
+    assert service_recorder.count("scene", "turn_on") == count
+    if form == "table":
+        assert len(hass.states.async_entity_ids("automation")) == 1
+        assert trigger_listeners == callbacks == count
+    else:
+        assert trigger_listeners == callbacks == 2 * count
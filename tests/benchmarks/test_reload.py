@@ -0,0 +1,190 @@
+"""Reload cost: a full `automation.reload` against one targeted at what changed.
+
+An automation file is edited in a copy of the house, then reloaded either
+in full or as scripts/reload_automations.py does (see
+scripts/automation_hashes.py): by id, or not at all if the edit
+changed no automation. Two edits are made:
+
+- comment: a comment added to study/lamp.yaml, the automation is the same
+- config: study/lamp.yaml's alias changed
+
+Each reload is measured by its time, the automations it replaced, the
+automation runs and service calls it set off, and whether the end-of-day
+signal started just before (a 5-minute timer, see
+end_of_day_detector.yaml) still ends in time. The same edits are timed in
+a synthetic house of 500 automations, where the whole configuration takes
+longer to read.
+
+Run with `pytest tests/benchmarks/test_reload.py -m slow -s` to see the report.
+"""
+
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
+from homeassistant.const import EVENT_STATE_CHANGED, STATE_UNAVAILABLE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from scripts.automation_hashes import automation_hashes, plan_reload
+from tests.helpers.synthetic_house import copy_house, generate_house
+
+EDITS = ("comment", "config")
+STRATEGIES = ("full", "targeted")
+
+# Lounge TV off in the bedtime window, starting the end-of-day signal
+EVENING = datetime(2025, 1, 20, 21, 30, tzinfo=dt_util.DEFAULT_TIME_ZONE)
+
+# Entities house/startup.yaml waits for, so its reconcile is not held up
+HOUSE_ENTITIES = {
+    "media_player.lounge_room": "on",
+    "input_select.house_mode": "relaxation",
+    "input_boolean.living_room_camera_state": "off",
+    "sensor.living_room_cam_power": "0",
+    "binary_sensor.study_motion_sensor_occupancy": "off",
+    "sensor.study_motion_sensor_illuminance": "100",
+}
+
+# Past the end-of-day signal, and startup.yaml's settle delay with it
+AFTER_RELOAD = 5 * 60 + 1
+
+SYNTHETIC_SCALE = (50, 500)
+
+
+def edit(path: Path, kind: str) -> None:
+    """Edit an automation file: add a comment, or change its alias."""
+    text = path.read_text()
+    if kind == "comment":
+        text = text.replace("---\n", "---\n# Edited\n", 1)
+    else:
+        text = re.sub(r"^alias: .*$", 'alias: "Edited"', text, count=1, flags=re.MULTILINE)
+    path.write_text(text)
+
+
+def reload_calls(strategy: str, before: dict[str, str], path: Path) -> list[dict[str, Any]]:
+    """Return the `automation.reload` calls of a full or targeted reload."""
+    if strategy == "full":
+        return [{}]
+    return plan_reload(before, automation_hashes(path)).service_calls()
+
+
+async def timed_reload(
+    hass: HomeAssistant, strategy: str, before: dict[str, str], path: Path
+) -> tuple[int, float, float]:
+    """Reload the automations in full or targeted.
+
+    Returns:
+        The reloads made, the milliseconds spent hashing the configuration
+        (done by scripts/reload_automations.py, outside Home Assistant) and
+        those spent reloading
+    """
+    start = time.perf_counter()
+    calls = reload_calls(strategy, before, path)
+    hashed = time.perf_counter()
+    for data in calls:
+        await hass.services.async_call("automation", "reload", data, blocking=True)
+    return len(calls), (hashed - start) * 1000, (time.perf_counter() - hashed) * 1000
+
+
+def track_reload(hass: HomeAssistant) -> tuple[dict[str, int], Any]:
+    """Count the automations removed and the runs triggered, until unsubscribed."""
+    counts = {"replaced": 0, "runs": 0}
+
+    @callback
+    def _state_changed(event: Event) -> None:
+        # A removed automation is left unavailable until its replacement is added
+        new_state = event.data["new_state"]
+        if event.data["entity_id"].startswith("automation.") and (
+            new_state is None or new_state.state == STATE_UNAVAILABLE
+        ):
+            counts["replaced"] += 1
+
+    @callback
+    def _triggered(event: Event) -> None:
+        counts["runs"] += 1
+
+    unsubscribes = [
+        hass.bus.async_listen(EVENT_STATE_CHANGED, _state_changed),
+        hass.bus.async_listen(EVENT_AUTOMATION_TRIGGERED, _triggered),
+    ]
+
+    def unsubscribe() -> None:
+        for unsub in unsubscribes:
+            unsub()
+
+    return counts, unsubscribe
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("strategy", STRATEGIES)
+@pytest.mark.parametrize("kind", EDITS)
+async def test_reload_cost_in_house(automation_test, tmp_path, kind, strategy):
+    """Compare the side effects of a full and a targeted reload of the house."""
+    path = copy_house(tmp_path / "config")
+    hass = automation_test.hass
+    await automation_test.setup_house(entities=HOUSE_ENTITIES, time=EVENING, config_path=path)
+    await automation_test.state_change("media_player.lounge_room", "off", wait=False)
+    assert hass.states.get("timer.end_of_day_signal").state == "active"
+
+    before = automation_hashes(path)
+    edit(path / "automations" / "study" / "lamp.yaml", kind)
+    automation_test.recorder.clear()
+    counts, unsubscribe = track_reload(hass)
+    try:
+        reloads, hash_ms, reload_ms = await timed_reload(hass, strategy, before, path)
+        await automation_test.elapse(AFTER_RELOAD)
+    finally:
+        unsubscribe()
+
+    calls = [
+        f"{call.domain}.{call.service}"
+        for call in automation_test.recorder.calls()
+        if (call.domain, call.service) != ("automation", "reload")
+    ]
+    print(
+        f"\nReload, {kind} edit, {strategy}: {reloads} reloads in {reload_ms:.1f}ms "
+        f"(hashing {hash_ms:.1f}ms), {counts['replaced']} automations replaced, {counts['runs']} runs, "
+        f"{len(calls)} service calls ({', '.join(sorted(set(calls))) or 'none'})"
+    )
+
+    # The signal was left alone, and ended in time
+    assert hass.states.get("timer.end_of_day_signal").state == "idle"
+    assert counts["replaced"] == (1 if kind == "config" else 0)
+    reconciled = "automation.trigger" in calls
+    if strategy == "targeted" and kind == "comment":
+        assert reloads == 0
+        assert not reconciled
+    else:
+        assert reloads == 1
+        assert reconciled
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("strategy", STRATEGIES)
+@pytest.mark.parametrize("kind", EDITS)
+async def test_reload_time_at_scale(automation_test, tmp_path, kind, strategy):
+    """Time a full and a targeted reload of a synthetic house."""
+    rooms, automations = SYNTHETIC_SCALE
+    house = generate_house(tmp_path / "config", rooms, automations)
+    hass = automation_test.hass
+    await automation_test.setup_house(entities={}, mock_services=[], config_path=house.path)
+
+    before = automation_hashes(house.path)
+    edit(house.path / "automations" / house.rooms[0] / "motion_lights_1.yaml", kind)
+    counts, unsubscribe = track_reload(hass)
+    try:
+        reloads, hash_ms, reload_ms = await timed_reload(hass, strategy, before, house.path)
+    finally:
+        unsubscribe()
+
+    print(
+        f"\nReload at {rooms} rooms, {automations} automations, {kind} edit, {strategy}: "
+        f"{reloads} reloads in {reload_ms:.1f}ms (hashing {hash_ms:.1f}ms), "
+        f"{counts['replaced']} automations replaced"
+    )
+    assert len(hass.states.async_entity_ids("automation")) == automations
+    assert counts["replaced"] == (1 if kind == "config" else 0)
@@ -0,0 +1,201 @@
+"""Scale benchmarks: synthetic houses of growing size, laid out like this one.
+
+Each scale point generates a tree with tests/helpers/synthetic_house.py and
+measures how the repository's layout and automations behave at that size:
+
+- config load: the `!include_dir_*` loading of automations, scenes and
+  helpers, with Home Assistant's YAML loader
+- setup: the scenes, and every automation with the helper entities
+- memory: peak and retained allocations of the setup (measured in a test
+  of its own, tracing slows everything down)
+- mode fan-out: what one house mode change sets off through
+  apply_mode_scenes.yaml's `mode_map` and the rooms' own automations
+
+Run with `pytest tests/benchmarks/test_scale.py -m slow -s` to see the
+report. Each scale point's results are kept in the pytest cache, and the
+report compares them with the previous run.
+"""
+
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
+from homeassistant.core import Event, callback
+
+from tests.helpers.automation_helpers import (
+    load_helper_entities,
+    load_house_automations,
+    load_house_scenes,
+    setup_house_scenes,
+)
+from tests.helpers.fake_devices import async_setup_fake_devices
+from tests.helpers.synthetic_house import SyntheticHouse, generate_house
+
+# (rooms, automations); the first is about the size of this house
+SCALES = [(6, 15), (20, 100), (50, 500)]
+
+# Config loads timed, the fastest is kept
+LOADS = 3
+
+# Mode changes made in turn, from work with every light on
+MODE_CHANGES = ("away", "work", "sleep")
+
+# Cache key prefix of earlier results, and how many are kept per scale point
+HISTORY_KEY = "benchmarks/scale"
+HISTORY_LENGTH = 50
+
+
+def scale_id(scale: tuple[int, int]) -> str:
+    """Return the test id of a scale point, e.g. 50x500."""
+    return f"{scale[0]}x{scale[1]}"
+
+
+def generate(tmp_path: Path, rooms: int, automations: int) -> SyntheticHouse:
+    """Generate the synthetic house of a scale point."""
+    return generate_house(tmp_path / "config", rooms, automations)
+
+
+def everyone_home(house: SyntheticHouse) -> dict[str, str]:
+    """Return the house in work mode with every occupant home."""
+    return {
+        "input_select.house_mode": "work",
+        **{f"input_boolean.{occupant}_home": "on" for occupant in house.occupants},
+    }
+
+
+def all_lights(house: SyntheticHouse) -> list[str]:
+    """Return every light of the house."""
+    return [light for room in house.lights for light in room]
+
+
+def config_load_seconds(house: SyntheticHouse) -> float:
+    """Return the fastest of several loads of the automations, scenes and helpers."""
+    timings = []
+    for _ in range(LOADS):
+        start = time.perf_counter()
+        load_house_automations(house.path)
+        load_house_scenes(house.path)
+        load_helper_entities(house.path)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def remember(request, scale: str, result: dict[str, Any]) -> dict[str, Any] | None:
+    """Add a result to the scale point's history, returning the previous one.
+
+    Without the cache (`-p no:cacheprovider`) there is no history: returns None.
+    """
+    if (cache := getattr(request.config, "cache", None)) is None:
+        return None
+    key = f"{HISTORY_KEY}/{scale}"
+    history = cache.get(key, [])
+    cache.set(key, [*history, result][-HISTORY_LENGTH:])
+    return history[-1] if history else None
+
+
+def change(result: dict[str, Any], previous: dict[str, Any] | None, key: str) -> str:
+    """Format the change of a measurement since the previous run, if any."""
+    if not previous or not previous.get(key):
+        return ""
+    return f" ({result[key] / previous[key] - 1:+.0%})"
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(("rooms", "automations"), SCALES, ids=map(scale_id, SCALES))
+async def test_scale_setup_and_mode_fan_out(
+    automation_test, tmp_path, request, rooms, automations
+):
+    """Time config load, setup and house mode changes in a synthetic house."""
+    house = generate(tmp_path, rooms, automations)
+    hass = automation_test.hass
+    result: dict[str, Any] = {"config_load_ms": config_load_seconds(house) * 1000}
+
+    log = await async_setup_fake_devices(hass, {light: "on" for light in all_lights(house)})
+    start = time.perf_counter()
+    await setup_house_scenes(hass, house.path)
+    result["scene_setup_ms"] = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    await automation_test.setup_house(
+        entities=everyone_home(house), mock_services=[], config_path=house.path
+    )
+    result["house_setup_ms"] = (time.perf_counter() - start) * 1000
+    assert len(hass.states.async_entity_ids("automation")) == automations
+
+    runs = 0
+
+    @callback
+    def _count_run(event: Event) -> None:
+        nonlocal runs
+        runs += 1
+
+    unsubscribe = hass.bus.async_listen(EVENT_AUTOMATION_TRIGGERED, _count_run)
+    fan_out = {}
+    try:
+        for mode in MODE_CHANGES:
+            runs = 0
+            log.clear()
+            automation_test.recorder.clear()
+            start = time.perf_counter()
+            await automation_test.state_change("input_select.house_mode", mode, wait=False)
+            # Past apply_mode_scenes.yaml's settle delay
+            await automation_test.elapse(1)
+            fan_out[mode] = {
+                "ms": (time.perf_counter() - start) * 1000,
+                "runs": runs,
+                "scenes": len(automation_test.service_calls_for("scene", "turn_on")),
+                "commands": len(log.commands),
+            }
+    finally:
+        unsubscribe()
+    result["fan_out"] = fan_out
+    result["mode_change_ms"] = sum(mode["ms"] for mode in fan_out.values())
+
+    previous = remember(request, scale_id((rooms, automations)), result)
+    lines = [
+        f"{rooms} rooms, {automations} automations, {house.scenes} scenes, "
+        f"{len(all_lights(house))} lights",
+        f"  config load     {result['config_load_ms']:>9.1f}ms"
+        f"{change(result, previous, 'config_load_ms')}",
+        f"  scene setup     {result['scene_setup_ms']:>9.1f}ms"
+        f"{change(result, previous, 'scene_setup_ms')}",
+        f"  house setup     {result['house_setup_ms']:>9.1f}ms"
+        f"{change(result, previous, 'house_setup_ms')}",
+        f"  mode changes    {result['mode_change_ms']:>9.1f}ms"
+        f"{change(result, previous, 'mode_change_ms')}",
+    ]
+    for mode, stats in fan_out.items():
+        lines.append(
+            f"    -> {mode:<9} {stats['ms']:>9.1f}ms  {stats['runs']:>4} runs  "
+            f"{stats['scenes']:>3} scene calls  {stats['commands']:>5} device commands"
+        )
+    print("\nScale:\n" + "\n".join(lines))
+
+    # Every light goes off when away, and every sleep follower runs with apply_mode_scenes
+    followers = len(list(house.path.glob("automations/*/lights_off_at_sleep_*.yaml")))
+    assert fan_out["away"]["commands"] == len(all_lights(house))
+    assert fan_out["sleep"]["runs"] == 1 + followers
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(("rooms", "automations"), SCALES, ids=map(scale_id, SCALES))
+async def test_scale_setup_memory(automation_test, memory_tracker, tmp_path, rooms, automations):
+    """Measure the memory the scenes and automations of a synthetic house take."""
+    house = generate(tmp_path, rooms, automations)
+    hass = automation_test.hass
+    await async_setup_fake_devices(hass, {light: "on" for light in all_lights(house)})
+
+    memory_tracker.begin_cycle(scale_id((rooms, automations)))
+    await setup_house_scenes(hass, house.path)
+    await automation_test.setup_house(
+        entities=everyone_home(house), mock_services=[], config_path=house.path
+    )
+    stats = memory_tracker.end_cycle()
+
+    print(
+        f"\nScale memory, {rooms} rooms, {automations} automations:"
+        f" peak {stats.peak / 1024:.0f} KiB, retained {stats.retained / 1024:.0f} KiB,"
+        f" {stats.retained / automations / 1024:.1f} KiB per automation"
+    )
+    assert stats.retained > 0
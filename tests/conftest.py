@@ -1,5 +1,6 @@
 """Pytest configuration and fixtures for Home Assistant automation testing."""
 
+import logging
 import pytest
 from pathlib import Path
 from typing import Any
@@ -9,10 +10,148 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 from pytest_homeassistant_custom_component.syrupy import HomeAssistantSnapshotExtension
 from syrupy.assertion import SnapshotAssertion
 
+from tests.helpers import automation_helpers
+
 # Enable pytest-homeassistant-custom-component plugin
 pytest_plugins = "pytest_homeassistant_custom_component"
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the harness command line options."""
+    parser.addoption(
+        "--loop-block-ms",
+        type=float,
+        default=None,
+        metavar="MS",
+        help="Fail tests in which an event loop callback runs for MS milliseconds or more",
+    )
+    parser.addoption(
+        "--track-memory",
+        action="store_true",
+        help="Measure the memory allocated by each automation_test setup/cleanup cycle",
+    )
+    parser.addoption(
+        "--branch-coverage",
+        action="store_true",
+        help="Report the choose/if/repeat branches of the automation YAML taken by the tests",
+    )
+    parser.addoption(
+        "--export-traces",
+        default=None,
+        metavar="PATH",
+        help="Append every automation run's trace, with step timings, to PATH as JSON Lines",
+    )
+
+
+MEMORY_TRACKER = pytest.StashKey["MemoryTracker"]()
+BRANCH_COVERAGE = pytest.StashKey["BranchCoverage"]()
+TRACE_EXPORTER = pytest.StashKey["TraceExporter"]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Start the session memory tracker, shard report, coverage and trace export."""
+    # Only the controlling process, not the xdist workers, sees every test
+    if not hasattr(config, "workerinput"):
+        from tests.helpers.sharding import ShardReport
+
+        config.pluginmanager.register(ShardReport(config), "automation_shards")
+
+    if config.getoption("--track-memory"):
+        from tests.helpers.memory_tracker import MemoryTracker
+
+        config.stash[MEMORY_TRACKER] = MemoryTracker()
+        config.stash[MEMORY_TRACKER].start()
+
+    if config.getoption("--branch-coverage"):
+        from tests.helpers.branch_coverage import BranchCoverage
+
+        config.stash[BRANCH_COVERAGE] = BranchCoverage()
+        config.stash[BRANCH_COVERAGE].start()
+
+    if (export_path := config.getoption("--export-traces")) is not None:
+        from tests.helpers.trace_export import TraceExporter
+
+        # xdist workers append to the same file
+        config.stash[TRACE_EXPORTER] = TraceExporter(export_path)
+        config.stash[TRACE_EXPORTER].start()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config: pytest.Config, log):
+    """Shard tests by automation file with -n, see tests/helpers/sharding.py.
+
+    Only xdist's default `--dist load` is replaced, other modes are kept.
+    """
+    if config.getoption("dist") != "load":
+        return None
+
+    from tests.helpers.sharding import AutomationShardScheduling
+
+    return AutomationShardScheduling(config, log)
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Send an xdist worker's branch counts to the controlling process."""
+    config = session.config
+    if hasattr(config, "workerinput") and BRANCH_COVERAGE in config.stash:
+        config.workeroutput["branch_coverage"] = config.stash[BRANCH_COVERAGE].as_list()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    """Add up the branch counts of each xdist worker as it finishes."""
+    coverage = node.config.stash.get(BRANCH_COVERAGE, None)
+    if coverage is not None and "branch_coverage" in getattr(node, "workeroutput", {}):
+        coverage.merge(node.workeroutput["branch_coverage"])
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    """Report memory per automation file and branch coverage, when enabled."""
+    tracker = config.stash.get(MEMORY_TRACKER, None)
+    # Under xdist the cycles are measured in the workers
+    if tracker is not None and tracker.cycles:
+        terminalreporter.write_sep("=", "memory per setup/cleanup cycle")
+        terminalreporter.write_line(tracker.report())
+
+    if (coverage := config.stash.get(BRANCH_COVERAGE, None)) is not None:
+        terminalreporter.write_sep("=", "automation branch coverage")
+        terminalreporter.write_line(coverage.report())
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Stop the session memory tracker, branch coverage and trace export."""
+    if (tracker := config.stash.get(MEMORY_TRACKER, None)) is not None:
+        tracker.stop()
+    if (coverage := config.stash.get(BRANCH_COVERAGE, None)) is not None:
+        coverage.stop()
+    if (exporter := config.stash.get(TRACE_EXPORTER, None)) is not None:
+        exporter.stop()
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    """Run the test with event loop blocking detection, when --loop-block-ms is set.
+
+    Only the test body is timed, so the hass fixture's own setup does not count,
+    and the test's own setup work is let through unless an automation was running.
+    """
+    threshold_ms = item.config.getoption("--loop-block-ms")
+    if threshold_ms is None or item.get_closest_marker("allow_loop_blocking"):
+        return (yield)
+
+    from tests.helpers.loop_monitor import LoopBlockingDetector
+
+    detector = LoopBlockingDetector(threshold_ms, harness_tasks={item.obj.__qualname__})
+    detector.start()
+    try:
+        result = yield
+    finally:
+        detector.stop()
+    if detector.slow_callbacks:
+        pytest.fail(detector.report(), pytrace=False)
+    return result
+
+
 @pytest.fixture
 def snapshot(snapshot: SnapshotAssertion) -> SnapshotAssertion:
     """Return snapshot assertion with Home Assistant extension."""
@@ -46,14 +185,9 @@ def load_automation():
         Returns:
             Parsed automation dictionary
         """
-        automation_path = (
-            Path(__file__).parent.parent / "automations" / category / filename
-        )
-        if not automation_path.suffix:
-            automation_path = automation_path.with_suffix(".yaml")
-
-        with open(automation_path) as f:
-            return yaml.safe_load(f)
+        if not Path(filename).suffix:
+            filename = f"{filename}.yaml"
+        return automation_helpers.load_automation_file(f"{category}/{filename}")
 
     return _load_automation
 
@@ -83,6 +217,64 @@ def load_scene():
     return _load_scene
 
 
+@pytest.fixture
+def load_integration():
+    """Fixture to load an integration package from YAML file."""
+
+    def _load_integration(name: str) -> dict[str, Any]:
+        """
+        Load an integration package from YAML file.
+
+        Args:
+            name: The package filename in integrations/ (with or without .yaml extension)
+
+        Returns:
+            Parsed package dictionary (keyed by integration domain)
+        """
+        integration_path = Path(__file__).parent.parent / "integrations" / name
+        if not integration_path.suffix:
+            integration_path = integration_path.with_suffix(".yaml")
+
+        with open(integration_path) as f:
+            return yaml.safe_load(f)
+
+    return _load_integration
+
+
+@pytest.fixture
+def repo_config_dir(hass: HomeAssistant):
+    """Point the config directory at this repository, so blueprints resolve."""
+    original = hass.config.config_dir
+    hass.config.config_dir = str(Path(__file__).parent.parent)
+    yield hass.config.config_dir
+    hass.config.config_dir = original
+
+
+@pytest.fixture
+def load_fixture():
+    """Fixture to load test data from tests/fixtures."""
+
+    def _load_fixture(category: str, filename: str) -> Any:
+        """
+        Load test data from YAML file.
+
+        Args:
+            category: The subdirectory of tests/fixtures (e.g., 'blueprint_instances')
+            filename: The YAML filename (with or without .yaml extension)
+
+        Returns:
+            Parsed YAML data
+        """
+        fixture_path = Path(__file__).parent / "fixtures" / category / filename
+        if not fixture_path.suffix:
+            fixture_path = fixture_path.with_suffix(".yaml")
+
+        with open(fixture_path) as f:
+            return yaml.safe_load(f)
+
+    return _load_fixture
+
+
 @pytest.fixture
 async def setup_test_entities(hass: HomeAssistant):
     """Set up common test entities used across multiple automations."""
@@ -130,7 +322,7 @@ def common_entities():
         "input_select.house_mode": "default",
         "input_boolean.house_mode_away": "off",
         "input_boolean.holidays": "off",
-        "input_boolean.end_of_day_signal": "off",
+        "timer.end_of_day_signal": "idle",
         "media_player.lounge_room": "off",
         "binary_sensor.hallway_motion": "off",
         "switch.bedroom_lights_switch": "off",
@@ -153,7 +345,50 @@ def common_entities():
 
 
 @pytest.fixture
-async def automation_test(hass: HomeAssistant, load_automation):
+async def service_recorder(hass: HomeAssistant):
+    """Record every service call on the bus.
+
+    Example usage:
+        async def test_something(hass, service_recorder):
+            service_recorder.mock(("scene", "turn_on"), ("light", "turn_off"))
+            ...
+            assert service_recorder.count("scene", "turn_on") == 1
+            assert service_recorder.calls(entity_id="light.study_lamp")
+    """
+    from tests.helpers.service_recorder import ServiceCallRecorder
+
+    recorder = ServiceCallRecorder(hass)
+    recorder.async_start()
+    yield recorder
+    recorder.async_stop()
+
+
+@pytest.fixture
+def memory_tracker():
+    """Trace allocations for the test, see tests/helpers/memory_tracker.py.
+
+    Example usage:
+        async def test_something(automation_test, memory_tracker):
+            await automation_test.setup_house()
+            growth = await memory_tracker.measure_growth("mode", run_mode_once)
+            assert growth.per_run < 512
+    """
+    from tests.helpers.memory_tracker import MemoryTracker
+
+    # Captured log records keep their arguments (and any exception's frames)
+    # until the test ends: only log warnings and errors while measuring
+    root = logging.getLogger()
+    level = root.level
+    root.setLevel(logging.WARNING)
+    tracker = MemoryTracker()
+    tracker.start()
+    yield tracker
+    tracker.stop()
+    root.setLevel(level)
+
+
+@pytest.fixture
+async def automation_test(hass: HomeAssistant, load_automation, request):
     """Provide a simplified test context for automation testing.
 
     This fixture eliminates most test boilerplate by providing a single
@@ -169,9 +404,14 @@ async def automation_test(hass: HomeAssistant, load_automation):
             )
             await automation_test.trigger_automation()
             automation_test.assert_option_selected("work")
+
+    With --track-memory, each setup/cleanup cycle's peak and retained memory
+    is reported per automation file at the end of the session.
     """
     from tests.helpers.test_context import AutomationTestContext
 
-    context = AutomationTestContext(hass, load_automation)
+    context = AutomationTestContext(
+        hass, load_automation, memory=request.config.stash.get(MEMORY_TRACKER, None)
+    )
     yield context
     await context.cleanup()
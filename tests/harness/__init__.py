@@ -0,0 +1 @@
+"""Test harness tests."""
@@ -0,0 +1,110 @@
+"""Tests for scripts/automation_hashes.py and scripts/reload_automations.py."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from scripts.automation_hashes import (
+    MANIFEST,
+    ReloadPlan,
+    automation_hashes,
+    plan_reload,
+)
+from tests.helpers.synthetic_house import copy_house
+
+RELOAD_AUTOMATIONS = Path(__file__).parent.parent.parent / "scripts" / "reload_automations.py"
+
+STUDY_LAMP = "a9831ca7-3357-48bb-a066-3a226843530f"
+
+
+@pytest.fixture
+def house(tmp_path) -> Path:
+    """Return a copy of the house to edit."""
+    return copy_house(tmp_path / "config")
+
+
+def reload_automations(house: Path, *args: str) -> str:
+    """Run scripts/reload_automations.py on a tree and return what it printed."""
+    return subprocess.run(
+        [sys.executable, str(RELOAD_AUTOMATIONS), "--config", str(house), *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=60,
+    ).stdout
+
+
+def test_comments_and_formatting_change_nothing(house):
+    """Test that only a change to the loaded configuration changes a hash."""
+    before = automation_hashes(house)
+    lamp = house / "automations" / "study" / "lamp.yaml"
+    lamp.write_text(lamp.read_text().replace("---\n", "---\n# A comment\n\n", 1))
+
+    assert plan_reload(before, automation_hashes(house)).automations == []
+
+
+def test_plan_lists_changed_added_and_removed_automations(house):
+    """Test that each edited, new and deleted file is planned by automation id."""
+    before = automation_hashes(house)
+    lamp = house / "automations" / "study" / "lamp.yaml"
+    lamp.write_text(lamp.read_text().replace("mode: ", "max_exceeded: silent\nmode: ", 1))
+    (house / "automations" / "bedroom" / "lights.yaml").unlink()
+    (house / "automations" / "study" / "new.yaml").write_text(
+        '---\nid: "new"\nalias: "New"\ntriggers: []\nactions: []\n'
+    )
+
+    plan = plan_reload(before, automation_hashes(house))
+
+    assert plan == ReloadPlan(changed=[STUDY_LAMP], added=["new"], removed=["1710558233459"])
+
+
+def test_one_change_is_reloaded_by_id_and_several_in_full():
+    """Test the service calls applying a plan."""
+    assert ReloadPlan([], [], []).service_calls() == []
+    assert ReloadPlan([STUDY_LAMP], [], []).service_calls() == [{"id": STUDY_LAMP}]
+    assert ReloadPlan([], [], ["gone"]).service_calls() == [{"id": "gone"}]
+    assert ReloadPlan([STUDY_LAMP], ["new"], []).service_calls() == [{}]
+    # An automation without an id cannot be reloaded on its own
+    assert ReloadPlan(["alias:Unnamed"], [], []).service_calls() == [{}]
+
+
+def test_script_reloads_what_changed_since_the_kept_hashes(house):
+    """Test that the script compares with the hashes kept by --init."""
+    assert reload_automations(house, "--init") == "14 automations hashed\n"
+    assert (house / MANIFEST).exists()
+    assert "nothing to reload" in reload_automations(house, "--dry-run")
+
+    lamp = house / "automations" / "study" / "lamp.yaml"
+    lamp.write_text(lamp.read_text().replace("alias:", "# Renamed\nalias:", 1))
+    assert "nothing to reload" in reload_automations(house, "--dry-run")
+
+    lamp.write_text(lamp.read_text().replace('alias: "', 'alias: "Renamed ', 1))
+    output = reload_automations(house, "--dry-run")
+    assert output.splitlines() == [
+        f"changed  {STUDY_LAMP}",
+        f'automation.reload {{"id": "{STUDY_LAMP}"}}',
+    ]
+
+
+def test_script_does_not_need_the_test_tooling():
+    """Test that the script runs on a Home Assistant host, without the test plugin."""
+    imported = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; import reload_automations; print(*sorted(sys.modules))",
+        ],
+        cwd=RELOAD_AUTOMATIONS.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=60,
+    ).stdout.split()
+
+    assert not [
+        module
+        for module in imported
+        if module.split(".")[0] in ("tests", "pytest", "pytest_homeassistant_custom_component")
+    ]
@@ -0,0 +1,101 @@
+"""Tests for the automation branch coverage collected from traces."""
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from tests.helpers.automation_helpers import setup_automation
+from tests.helpers.branch_coverage import REPEAT, BranchCoverage, automation_branches
+from tests.helpers.automation_helpers import AUTOMATIONS_PATH
+
+
+@pytest.fixture
+def coverage():
+    """Count branches for the duration of the test."""
+    coverage = BranchCoverage()
+    coverage.start()
+    yield coverage
+    coverage.stop()
+
+
+def line_of(file: str, text: str) -> int:
+    """Return the first line of an automation file containing text."""
+    lines = (AUTOMATIONS_PATH / file).read_text().splitlines()
+    return next(number for number, line in enumerate(lines, 1) if text in line)
+
+
+def test_lists_choose_options_and_default_with_their_lines():
+    """Test that every mode.yaml priority branch is listed at its line."""
+    branches = automation_branches("house/mode.yaml")
+
+    first, last = branches[0], branches[-1]
+    assert first.path == "action/0"
+    assert first.choice == 0
+    assert first.label == '"Away mode turned ON"'
+    assert first.line == line_of("house/mode.yaml", '- alias: "Away mode turned ON"')
+    assert last.choice == "default"
+    assert [branch.choice for branch in branches] == [*range(11), "default"]
+
+
+def test_lists_nested_branches():
+    """Test that branches inside option sequences and repeats are listed."""
+    branches = {
+        (branch.path, branch.choice) for branch in automation_branches("bedroom/lights.yaml")
+    }
+
+    assert any(choice == REPEAT and "/choose/" in path for path, choice in branches)
+
+
+async def test_reports_branches_taken_and_never_taken(automation_test, coverage):
+    """Test that a run counts the option it took and the others show as missed."""
+    await automation_test.setup(
+        automation=("living_room", "camera_away_mode.yaml"),
+        entities={"input_boolean.house_mode_away": "off"},
+        mock_service=("input_boolean", "turn_on"),
+    )
+
+    await automation_test.state_change("input_boolean.house_mode_away", "on")
+
+    report = coverage.report(["living_room/camera_away_mode.yaml"])
+    away_off = line_of("living_room/camera_away_mode.yaml", "Turn off camera") - 4
+    assert report.splitlines()[0].split() == ["living_room/camera_away_mode.yaml", "1/2", "50%"]
+    assert f"line {away_off:>4}: choose option 1 never taken" in report
+    assert "choose option 0" not in report
+
+
+async def test_counts_repeat_iterations(hass: HomeAssistant, coverage):
+    """Test that each iteration of a repeat and the branches inside it are counted."""
+    assert await setup_automation(
+        hass,
+        {
+            "id": "coverage",
+            "triggers": [{"trigger": "event", "event_type": "test_event"}],
+            "actions": [
+                {
+                    "repeat": {
+                        "count": 3,
+                        "sequence": [{"choose": [{"conditions": [], "sequence": []}]}],
+                    }
+                }
+            ],
+        },
+    )
+
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+
+    assert coverage.counts[("coverage", "action/0", REPEAT)] == 3
+    assert coverage.counts[("coverage", "action/0/repeat/sequence/0", 0)] == 3
+
+
+def test_merges_counts_from_other_processes():
+    """Test that counts sent by xdist workers add up."""
+    worker = BranchCoverage()
+    worker.counts[("mode", "action/0", 0)] = 2
+    worker.counts[("mode", "action/0", "default")] = 1
+    controller = BranchCoverage()
+    controller.counts[("mode", "action/0", 0)] = 1
+
+    controller.merge(worker.as_list())
+
+    assert controller.counts[("mode", "action/0", 0)] == 3
+    assert controller.counts[("mode", "action/0", "default")] == 1
@@ -0,0 +1,95 @@
+"""Tests for tests/helpers/condition_order.py and scripts/condition_order.py."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from tests.helpers.condition_order import (
+    condition_cost,
+    file_reorderings,
+    reorder,
+    reorderings,
+)
+from tests.helpers.automation_helpers import automation_files
+
+CONDITION_ORDER = Path(__file__).parent.parent.parent / "scripts" / "condition_order.py"
+FIXTURE = Path(__file__).parent.parent / "fixtures" / "condition_order" / "house_mode.yaml"
+
+
+def test_cheap_checks_cost_less_than_templates():
+    """Test the ranking of the kinds of condition."""
+    trigger = {"condition": "trigger", "id": "arrived"}
+    state = {"condition": "state", "entity_id": "input_boolean.holidays", "state": "on"}
+    time = {"condition": "time", "after": "07:00:00"}
+    template = {"condition": "template", "value_template": "{{ is_state('sun.sun', 'up') }}"}
+
+    assert condition_cost(trigger) < condition_cost(state) < condition_cost(time)
+    assert condition_cost(time) < condition_cost(template)
+    # A template calling more functions costs more, shorthand or not
+    assert condition_cost("{{ now().hour > 7 and is_state('sun.sun', 'up') }}") > condition_cost(
+        template
+    )
+    # Nested conditions cost as much as all of them
+    assert condition_cost({"or": [state, template]}) == condition_cost(
+        state
+    ) + condition_cost(template)
+
+
+def test_reorder_moves_cheap_conditions_first_and_keeps_ties():
+    """Test that reordering is a stable sort of each list, nested ones included."""
+    template = "{{ states('sensor.x') | int > 3 }}"
+    first = {"condition": "state", "entity_id": "light.a", "state": "on"}
+    second = {"condition": "state", "entity_id": "light.b", "state": "on"}
+    config = {
+        "alias": "Test",
+        "conditions": [template, first, {"or": [template, second]}, second],
+        "actions": [{"choose": [{"conditions": [template, first], "sequence": []}]}],
+    }
+
+    found = reorderings(config)
+    reordered = reorder(config)
+
+    assert [reordering.path for reordering in found] == [
+        "conditions",
+        "conditions/2/or",
+        "actions/0/choose/0/conditions",
+    ]
+    assert reordered["conditions"] == [first, second, template, {"or": [second, template]}]
+    assert reordered["actions"][0]["choose"][0]["conditions"] == [first, template]
+    assert reorderings(reordered) == []
+
+
+def test_mode_is_the_fixture_reordered(load_automation, load_fixture):
+    """Test that mode.yaml is its former self with the conditions reordered, nothing else."""
+    before = load_fixture("condition_order", "house_mode")
+    after = load_automation("house", "mode.yaml")
+    # The end-of-day trigger has watched a timer since
+    del before["triggers"], after["triggers"]
+
+    assert reorderings(before)
+    assert after == reorder(before)
+
+
+@pytest.mark.parametrize("file", automation_files())
+def test_automation_conditions_are_cheap_first(file):
+    """Test that no automation has a list of conditions to reorder."""
+    assert file_reorderings(file) == []
+
+
+def test_script_lists_reorderings_and_fails():
+    """Test the script's report and exit code."""
+    result = subprocess.run(
+        [sys.executable, str(CONDITION_ORDER), "house/mode.yaml", str(FIXTURE)],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert result.returncode == 1
+    lines = result.stdout.splitlines()
+    assert lines[0] == f"{FIXTURE}: 9 to reorder"
+    assert lines[1].startswith("  action/0/choose/1/conditions/and ")
+    assert lines[2].endswith('"Not caused by returning home" (20), "House mode is away" (2)')
+    assert lines[3].endswith('"House mode is away" (2), "Not caused by returning home" (20)')
@@ -0,0 +1,70 @@
+"""Tests for the fork server in scripts/forkserver.py."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+FORKSERVER = Path(__file__).parent.parent.parent / "scripts" / "forkserver.py"
+PROJECT_ROOT = FORKSERVER.parent.parent
+
+TEST = "tests/automations/test_house_mode.py::test_work_mode_on_weekday_morning"
+
+
+def forkserver(socket_path: Path, *args: str, **kwargs) -> subprocess.CompletedProcess:
+    """Run a forkserver.py command and return the result."""
+    return subprocess.run(
+        [sys.executable, str(FORKSERVER), "--socket", str(socket_path), *args],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def server(tmp_path: Path):
+    """Start a fork server on a temporary socket and stop it afterwards."""
+    socket_path = tmp_path / "forkserver.sock"
+    process = subprocess.Popen(
+        [sys.executable, str(FORKSERVER), "--socket", str(socket_path), "serve"],
+        cwd=PROJECT_ROOT,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    # Ready once the warm imports are done
+    assert "forkserver ready" in process.stderr.readline()
+    yield socket_path
+    forkserver(socket_path, "stop")
+    process.wait(timeout=30)
+
+
+@pytest.mark.slow
+def test_runs_tests_in_a_forked_child(server):
+    """Test that a run reports pytest's output and exit code."""
+    result = forkserver(server, "run", "-q", "-p", "no:logging", TEST)
+
+    assert result.returncode == 0
+    assert "1 passed" in result.stdout
+    assert "PytestAssertRewriteWarning" not in result.stdout
+
+
+@pytest.mark.slow
+def test_each_run_gets_a_fresh_child(server):
+    """Test that consecutive runs do not share state and keep their exit codes."""
+    assert forkserver(server, "run", "-q", "-p", "no:logging", TEST).returncode == 0
+
+    result = forkserver(server, "run", "-q", "-p", "no:logging", TEST, "-k", "no_such_test")
+
+    assert result.returncode == pytest.ExitCode.NO_TESTS_COLLECTED
+
+
+@pytest.mark.slow
+def test_runs_directly_without_a_server(tmp_path: Path):
+    """Test that run falls back to plain pytest when no server is listening."""
+    result = forkserver(tmp_path / "missing.sock", "run", "-q", "-p", "no:logging", TEST)
+
+    assert result.returncode == 0
+    assert "1 passed" in result.stdout
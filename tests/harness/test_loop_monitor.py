@@ -0,0 +1,145 @@
+"""Tests for the event loop blocking detector."""
+
+import asyncio
+import time
+
+import pytest
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+
+from tests.helpers.automation_helpers import setup_automation
+from tests.helpers.loop_monitor import LoopBlockingDetector
+from tests.helpers.virtual_time import async_settle
+
+# These tests block the loop on purpose, so --loop-block-ms does not apply
+pytestmark = pytest.mark.allow_loop_blocking
+
+BLOCK_SECONDS = 0.1
+
+
+def blocking_automation(*steps: dict) -> dict:
+    """Return an automation running the given steps on a test event."""
+    return {
+        "id": "blocking",
+        "alias": "Blocking",
+        "triggers": [{"platform": "event", "event_type": "test_event"}],
+        "actions": list(steps),
+    }
+
+
+@pytest.fixture
+def register_services(hass: HomeAssistant):
+    """Register a fast and a blocking test service."""
+
+    @callback
+    def handle_fast(call: ServiceCall) -> None:
+        pass
+
+    @callback
+    def handle_blocking(call: ServiceCall) -> None:
+        time.sleep(BLOCK_SECONDS)
+
+    hass.services.async_register("test", "fast", handle_fast)
+    hass.services.async_register("test", "blocking", handle_blocking)
+
+
+async def run_detected(hass: HomeAssistant, **kwargs) -> LoopBlockingDetector:
+    """Fire the test event with the detector running and return it."""
+    detector = LoopBlockingDetector(threshold_ms=50, **kwargs)
+    detector.start()
+    try:
+        hass.bus.async_fire("test_event")
+        await async_settle(hass)
+    finally:
+        detector.stop()
+    return detector
+
+
+async def test_reports_the_automation_and_step_that_blocked(
+    hass: HomeAssistant, register_services
+):
+    """Test that a blocking service call is attributed to its automation step."""
+    assert await setup_automation(
+        hass,
+        blocking_automation(
+            {"action": "test.fast"},
+            {"action": "test.blocking"},
+            {"action": "test.fast"},
+        ),
+    )
+
+    detector = await run_detected(hass)
+
+    assert len(detector.slow_callbacks) == 1
+    slow = detector.slow_callbacks[0]
+    assert slow.automation == "automation.blocking"
+    assert slow.step == "action/1"
+    assert slow.duration >= BLOCK_SECONDS
+    assert "automation.blocking at action/1" in detector.report()
+
+
+async def test_reports_nested_steps(hass: HomeAssistant, register_services):
+    """Test that a step inside a choose is reported by its full path."""
+    assert await setup_automation(
+        hass,
+        blocking_automation(
+            {
+                "choose": [
+                    {
+                        "conditions": [],
+                        "sequence": [{"action": "test.fast"}, {"action": "test.blocking"}],
+                    }
+                ]
+            },
+        ),
+    )
+
+    detector = await run_detected(hass)
+
+    assert [slow.step for slow in detector.slow_callbacks] == [
+        "action/0/choose/0/sequence/1"
+    ]
+
+
+async def test_fast_automations_are_not_reported(hass: HomeAssistant, register_services):
+    """Test that an automation without blocking work records nothing."""
+    assert await setup_automation(
+        hass, blocking_automation({"action": "test.fast"}, {"action": "test.fast"})
+    )
+
+    detector = await run_detected(hass)
+
+    assert detector.slow_callbacks == []
+
+
+async def test_reports_blocking_outside_automations(hass: HomeAssistant):
+    """Test that a blocking event listener is reported without an automation."""
+
+    async def blocking_listener(event) -> None:
+        # Listener tasks start eagerly, block once the task is on the loop
+        await asyncio.sleep(0)
+        time.sleep(BLOCK_SECONDS)
+
+    hass.bus.async_listen("test_event", blocking_listener)
+
+    detector = await run_detected(hass)
+
+    assert len(detector.slow_callbacks) == 1
+    assert detector.slow_callbacks[0].automation is None
+    assert "outside any automation" in detector.report()
+
+
+@pytest.mark.parametrize(("harness", "reported"), [(True, 0), (False, 1)])
+async def test_harness_tasks_are_let_through(hass: HomeAssistant, harness, reported):
+    """Test that the test's own setup work is not reported."""
+    harness_tasks = {test_harness_tasks_are_let_through.__qualname__} if harness else None
+    detector = LoopBlockingDetector(threshold_ms=50, harness_tasks=harness_tasks)
+    detector.start()
+    try:
+        # Yield first: the callback already running when the detector starts is not timed
+        await asyncio.sleep(0)
+        time.sleep(BLOCK_SECONDS)
+        await asyncio.sleep(0)
+    finally:
+        detector.stop()
+
+    assert len(detector.slow_callbacks) == reported
@@ -0,0 +1,68 @@
+"""Tests for the memory allocation and leak tracker."""
+
+import asyncio
+
+from homeassistant.core import HomeAssistant
+
+from tests.helpers.memory_tracker import MemoryTracker
+from tests.helpers.test_context import AutomationTestContext
+
+
+async def test_cycles_are_labelled_with_the_automation_file(
+    hass: HomeAssistant, load_automation, memory_tracker
+):
+    """Test that a setup/cleanup cycle is recorded for its automation file."""
+    context = AutomationTestContext(hass, load_automation, memory=memory_tracker)
+    await context.setup(
+        automation=("living_room", "aircon.yaml"),
+        mock_service=("climate", "set_hvac_mode"),
+    )
+    await context.cleanup()
+
+    [cycle] = memory_tracker.cycles
+    assert cycle.label == "living_room/aircon.yaml"
+    assert cycle.peak >= cycle.retained
+    assert cycle.peak > 0
+    assert "living_room/aircon.yaml" in memory_tracker.report()
+
+
+async def test_growth_names_the_leaking_line(memory_tracker: MemoryTracker):
+    """Test that memory kept by every run is measured and attributed."""
+    leaked = []
+
+    async def leaky_run() -> None:
+        leaked.append(bytearray(1000))
+
+    growth = await memory_tracker.measure_growth("leaky", leaky_run, runs=10)
+
+    # Other memory freed meanwhile is counted too, so allow some slack
+    assert growth.per_run > 800
+    assert "test_memory_tracker.py" in growth.top[0]
+
+
+async def test_bounded_runs_do_not_grow(memory_tracker: MemoryTracker):
+    """Test that memory kept only up to a limit, like stored traces, is not growth."""
+    kept = []
+
+    async def bounded_run() -> None:
+        kept.append(bytearray(1000))
+        del kept[:-5]
+
+    growth = await memory_tracker.measure_growth("bounded", bounded_run, warmup=5, runs=10)
+
+    assert growth.per_run < 100
+
+
+async def test_runs_are_measured_without_asyncio_debug(memory_tracker: MemoryTracker):
+    """Test that debug mode's task tracebacks and slow callback logs are left out."""
+    loop = asyncio.get_running_loop()
+    loop.set_debug(True)
+    debug = []
+
+    async def run() -> None:
+        debug.append(loop.get_debug())
+
+    await memory_tracker.measure_growth("debug", run, warmup=1, runs=1, windows=1)
+
+    assert debug == [False, False]
+    assert loop.get_debug()
@@ -0,0 +1,121 @@
+"""Tests for the automation mutants and scripts/mutate.py."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from tests.helpers import automation_helpers
+from tests.helpers.mutation import MutantPlugin, generate_mutants, relevant_tests
+
+MUTATE = Path(__file__).parent.parent.parent / "scripts" / "mutate.py"
+PROJECT_ROOT = MUTATE.parent.parent
+
+AUTOMATION = {
+    "id": "test",
+    "alias": "Test",
+    "triggers": [{"trigger": "state", "entity_id": "input_boolean.test", "to": "on"}],
+    "conditions": [{"condition": "time", "after": "08:00:00"}],
+    "actions": [
+        {
+            "choose": [
+                {
+                    "conditions": [
+                        {
+                            "condition": "template",
+                            "value_template": "{{ now().strftime('%H:%M:%S') < '12:00:00' }}",
+                        }
+                    ],
+                    "sequence": [{"action": "light.turn_on"}],
+                },
+                {"conditions": [], "sequence": [{"action": "light.turn_off"}]},
+            ]
+        }
+    ],
+}
+
+
+def test_generates_each_kind_of_mutant():
+    """Test that every mutation operator applies where it should."""
+    descriptions = [mutant.description for mutant in generate_mutants("test/test.yaml", AUTOMATION)]
+
+    assert descriptions == [
+        "triggers/0: to 'on' -> 'off'",
+        "conditions/0: negate condition",
+        "conditions/0: after 08:00:00 -> 09:00:00",
+        "actions/0: swap choose options 0 and 1",
+        "actions/0/choose/0/conditions/0: negate condition",
+        "actions/0/choose/0/conditions/0/value_template: template < -> <= at 30",
+        "actions/0/choose/0/conditions/0/value_template: template '12:00:00' -> '13:00:00'",
+    ]
+
+
+def test_mutants_change_only_their_own_copy():
+    """Test that a mutant does not change the original or values shared by aliases."""
+    shared = {"condition": "state", "entity_id": "input_boolean.test", "state": "on"}
+    config = {"id": "test", "conditions": [shared, shared]}
+
+    first, second = generate_mutants("test/test.yaml", config)
+
+    assert first.config["conditions"] == [{"condition": "not", "conditions": [shared]}, shared]
+    assert second.config["conditions"] == [shared, {"condition": "not", "conditions": [shared]}]
+    assert config["conditions"] == [shared, shared]
+    assert shared == {"condition": "state", "entity_id": "input_boolean.test", "state": "on"}
+
+
+def test_plugin_swaps_the_mutant_in_for_its_file(load_automation, monkeypatch):
+    """Test that the mutant is loaded in place of its own file only."""
+    mutant = generate_mutants("living_room/camera_away_mode.yaml")[0]
+    MutantPlugin(mutant).apply(monkeypatch)
+
+    assert load_automation("living_room", "camera_away_mode.yaml") == mutant.config
+    assert load_automation("living_room", "camera_away_mode") == mutant.config
+    assert load_automation("living_room", "camera.yaml") != mutant.config
+
+
+def test_plugin_swaps_the_mutant_in_for_its_house_automation(monkeypatch):
+    """Test that the whole house is loaded with the mutant in place of the original."""
+    original = automation_helpers.load_house_automations()
+    mutant = generate_mutants("living_room/camera_away_mode.yaml")[0]
+    MutantPlugin(mutant).apply(monkeypatch)
+
+    house = automation_helpers.load_house_automations()
+
+    assert len(house) == len(original)
+    assert mutant.config in house
+    assert sum(config.get("id") == mutant.automation_id for config in house) == 1
+
+
+def test_loaders_are_unmutated_without_the_plugin(load_automation):
+    """Test that a plain test run loads the automations as they are."""
+    config = load_automation("living_room", "camera_away_mode.yaml")
+
+    assert config == automation_helpers.load_automation_file("living_room/camera_away_mode.yaml")
+    assert config in automation_helpers.load_house_automations()
+
+
+def test_relevant_tests_run_the_file_first_then_the_house():
+    """Test that a file's own tests come before the whole-house tests."""
+    tests = relevant_tests("living_room/camera_away_mode.yaml")
+
+    assert tests[0] == "tests/automations/test_living_room_camera_away_mode.py"
+    assert "tests/automations/test_whole_house.py" in tests
+    assert not any(test.startswith(("tests/harness/", "tests/helpers/")) for test in tests)
+
+
+@pytest.mark.slow
+def test_reports_surviving_mutants():
+    """Test that a mutation run reports each file's counts and survivors."""
+    result = subprocess.run(
+        [sys.executable, str(MUTATE), "living_room/camera_away_mode.yaml"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=600,
+    )
+
+    assert "living_room/camera_away_mode.yaml: 5 mutants, 4 killed, 1 survived" in result.stdout
+    # The two options are exclusive, so swapping them changes nothing
+    assert "survived: action/0: swap choose options 0 and 1" in result.stdout
+    assert result.returncode == 1
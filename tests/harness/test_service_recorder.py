@@ -0,0 +1,126 @@
+"""Tests for the global service call recorder."""
+
+import time
+
+from homeassistant.core import Context, HomeAssistant, ServiceCall, callback
+
+from tests.helpers.service_recorder import ServiceCallRecorder
+
+
+async def test_records_every_service_in_one_run(automation_test):
+    """Test that calls to several mocked services are all observed."""
+    await automation_test.setup(
+        automation=("house", "presence.yaml"),
+        entities={
+            "input_select.house_mode": "work",
+            "input_boolean.sam_home": "on",
+        },
+        mock_services=[("light", "turn_off"), ("scene", "turn_on")],
+    )
+
+    await automation_test.state_change("input_boolean.sam_home", "off")
+    await automation_test.state_change("input_boolean.sam_home", "on")
+
+    assert [(call.domain, call.service) for call in automation_test.service_calls] == [
+        ("light", "turn_off"),
+        ("scene", "turn_on"),
+    ]
+    recorder = automation_test.recorder
+    assert recorder.calls(entity_id="light.study_lamp")[0].service == "turn_off"
+    assert recorder.count("scene", "turn_on") == 1
+
+
+async def test_passes_through_to_real_handlers(hass: HomeAssistant, service_recorder):
+    """Test that real handlers still run and their calls are recorded."""
+
+    @callback
+    def handle_turn_on(call: ServiceCall) -> None:
+        hass.states.async_set(call.data["entity_id"], "on")
+
+    hass.services.async_register("input_boolean", "turn_on", handle_turn_on)
+
+    await hass.services.async_call(
+        "input_boolean", "turn_on", {"entity_id": "input_boolean.sam_home"}, blocking=True
+    )
+
+    assert hass.states.get("input_boolean.sam_home").state == "on"
+    assert service_recorder.count("input_boolean", "turn_on") == 1
+    assert not service_recorder.mocked_calls()
+
+
+async def test_mocked_services_are_swallowed(hass: HomeAssistant, service_recorder):
+    """Test that mocking replaces a real handler but still records the call."""
+    handled = []
+    hass.services.async_register("light", "turn_on", handled.append)
+    service_recorder.mock(("light", "turn_on"))
+
+    await hass.services.async_call(
+        "light", "turn_on", {"entity_id": ["light.study_lamp"]}, blocking=True
+    )
+
+    assert not handled
+    [call] = service_recorder.mocked_calls()
+    assert call.entity_ids == ("light.study_lamp",)
+
+
+async def test_query_by_context(hass: HomeAssistant, service_recorder):
+    """Test that calls can be looked up by the context they were made in."""
+    service_recorder.mock(("light", "turn_on"), ("light", "turn_off"))
+    context = Context()
+
+    await hass.services.async_call(
+        "light", "turn_on", {"entity_id": "light.a"}, blocking=True, context=context
+    )
+    await hass.services.async_call("light", "turn_off", {"entity_id": "light.a"}, blocking=True)
+
+    [call] = service_recorder.calls(context_id=context.id)
+    assert call.service == "turn_on"
+    assert service_recorder.count(entity_id="light.a") == 2
+
+
+async def test_ring_buffer_overwrites_oldest_calls(hass: HomeAssistant):
+    """Test that the buffer keeps the newest calls and drops stale index entries."""
+    recorder = ServiceCallRecorder(hass, capacity=8)
+    recorder.async_start()
+    recorder.mock(("light", "turn_on"))
+
+    for index in range(20):
+        await hass.services.async_call(
+            "light", "turn_on", {"entity_id": f"light.{index}"}, blocking=True
+        )
+
+    assert len(recorder) == 8
+    assert recorder.total == 20
+    assert recorder.dropped == 12
+    assert [call.seq for call in recorder.calls("light", "turn_on")] == list(range(12, 20))
+    assert recorder.calls(entity_id="light.3") == []
+    assert recorder.calls(entity_id="light.19")[0].data["entity_id"] == "light.19"
+    recorder.async_stop()
+
+
+async def test_indexed_queries_stay_fast(hass: HomeAssistant):
+    """Test that queries over thousands of calls only visit matching calls."""
+    recorder = ServiceCallRecorder(hass, capacity=20_000)
+    recorder.async_start()
+    recorder.mock(("light", "turn_on"), ("scene", "turn_on"))
+
+    for index in range(10_000):
+        domain = "scene" if index % 100 == 0 else "light"
+        await hass.services.async_call(
+            domain, "turn_on", {"entity_id": f"{domain}.room_{index % 50}"}
+        )
+    await hass.async_block_till_done()
+    assert len(recorder) == 10_000
+
+    # CPU time, so other processes (xdist workers) do not count
+    start = time.process_time()
+    for _ in range(1_000):
+        scene_calls = recorder.calls("scene", "turn_on")
+        room_calls = recorder.calls(entity_id="light.room_7")
+    elapsed = time.process_time() - start
+
+    assert len(scene_calls) == 100
+    assert len(room_calls) == 200
+    # A scan of all 10k calls per query would take several seconds
+    assert elapsed < 1.0, f"1000 indexed queries took {elapsed:.3f}s"
+    recorder.async_stop()
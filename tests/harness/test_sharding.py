@@ -0,0 +1,86 @@
+"""Tests for sharding tests across xdist workers by automation file."""
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from tests.helpers.sharding import _LongestFirstQueue, automation_shard
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+
+@pytest.mark.parametrize(
+    ("nodeid", "shard"),
+    [
+        # A module goes with the automation it loads
+        ("tests/automations/test_house_mode.py::test_work_mode_on_weekday_morning", "house/mode.yaml"),
+        # Whole-house modules are a shard each, not one shard for all of them
+        (
+            "tests/automations/test_whole_house.py::test_all_automations_are_loaded",
+            "tests/automations/test_whole_house.py",
+        ),
+        (
+            "tests/benchmarks/test_day_in_the_life.py::test_day_in_the_life",
+            "tests/benchmarks/test_day_in_the_life.py",
+        ),
+        # Parametrized over automation files or entities
+        (
+            "tests/automations/test_blueprint_expansion.py::test_expanded_matches_blueprint"
+            "[living_room-lamp.yaml-living_room_lamp-presses1]",
+            "living_room/lamp.yaml",
+        ),
+        (
+            "tests/automations/test_automation_memory.py::test_repeated_runs_do_not_leak"
+            "[automation.study_lamp]",
+            "study/lamp.yaml",
+        ),
+        # No automation loaded, the module is its own shard
+        (
+            "tests/harness/test_forkserver.py::test_runs_tests_in_a_forked_child",
+            "tests/harness/test_forkserver.py",
+        ),
+    ],
+)
+def test_tests_are_sharded_by_automation_file(nodeid, shard):
+    """Test that each test is assigned the shard of the automation it loads."""
+    assert automation_shard(nodeid) == shard
+
+
+def test_longest_shard_is_handed_out_first():
+    """Test that shards are taken longest first, by their tests' durations."""
+    durations = {"a::1": 1.0, "b::1": 3.0, "b::2": 3.0, "c::1": 4.0}
+    queue = _LongestFirstQueue(lambda tests: sum(durations[nodeid] for nodeid in tests))
+    queue["a"] = {"a::1": False}
+    queue["b"] = {"b::1": False, "b::2": False}
+    queue["c"] = {"c::1": False}
+
+    assert [queue.popitem(last=False)[0] for _ in range(3)] == ["b", "c", "a"]
+    assert not queue
+
+
+@pytest.mark.slow
+def test_parallel_run_keeps_each_automation_on_one_worker():
+    """Test that a parallel run sends each automation's tests to one worker."""
+    result = subprocess.run(
+        [
+            sys.executable, "-m", "pytest", "-n", "2", "-p", "no:logging",
+            "-p", "no:cacheprovider",
+            "tests/automations/test_living_room_aircon.py",
+            "tests/automations/test_living_room_camera_away_mode.py",
+        ],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+
+    assert result.returncode == 0, result.stdout
+    # Each shard listed with the one worker that ran all its tests
+    shards = re.findall(r"^ +[\d.]+s +\d+ tests  gw\d+ +(\S+)$", result.stdout, re.MULTILINE)
+    assert sorted(shards) == [
+        "living_room/aircon.yaml",
+        "living_room/camera_away_mode.yaml",
+    ]
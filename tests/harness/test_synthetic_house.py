@@ -0,0 +1,65 @@
+"""Tests for the synthetic configuration trees of tests/helpers/synthetic_house.py."""
+
+from tests.helpers.automation_helpers import (
+    load_helper_entities,
+    load_house_automations,
+    load_house_scenes,
+    setup_house_scenes,
+)
+from tests.helpers.fake_devices import async_setup_fake_devices
+from tests.helpers.synthetic_house import generate_house
+
+
+def test_tree_loads_through_the_include_files(tmp_path):
+    """Test that the generated tree loads like this repository, at the asked scale."""
+    house = generate_house(tmp_path, rooms=4, automations=13)
+
+    automations = load_house_automations(house.path)
+    scenes = load_house_scenes(house.path)
+    helpers = load_helper_entities(house.path)
+
+    assert len(automations) == 13
+    assert len({automation["id"] for automation in automations}) == 13
+    assert len({automation["alias"] for automation in automations}) == 13
+    # away and sleep everywhere, work in rooms 1 and 4, bedtime in room 1
+    assert len(scenes) == house.scenes == 4 * 2 + 2 + 1
+    assert "house_mode" in helpers["input_select"]
+    assert set(helpers["input_boolean"]) == {"occupant_1_home", "occupant_2_home"}
+
+
+def test_mode_map_covers_every_room(tmp_path):
+    """Test that apply_mode_scenes.yaml lists every room's scenes for its mode."""
+    house = generate_house(tmp_path, rooms=6, automations=1)
+
+    [apply_mode_scenes] = load_house_automations(house.path)
+    mode_map = apply_mode_scenes["variables"]["mode_map"]
+
+    assert apply_mode_scenes["id"] == "house_apply_mode_scenes"
+    assert mode_map["away"]["always"] == [f"scene.{room}_away" for room in house.rooms]
+    assert [scene["scene"] for scene in mode_map["work"]["conditional"]] == [
+        "scene.room_001_work",
+        "scene.room_004_work",
+    ]
+    assert [scene["condition"] for scene in mode_map["work"]["conditional"]] == [
+        "input_boolean.occupant_1_home",
+        "input_boolean.occupant_2_home",
+    ]
+
+
+async def test_mode_change_applies_the_generated_scenes(automation_test, tmp_path):
+    """Test that the generated house runs: going away turns every light off."""
+    house = generate_house(tmp_path, rooms=3, automations=7)
+    lights = [light for room in house.lights for light in room]
+    log = await async_setup_fake_devices(
+        automation_test.hass, {light: "on" for light in lights}
+    )
+    await setup_house_scenes(automation_test.hass, house.path)
+    await automation_test.setup_house(
+        entities={"input_select.house_mode": "work"}, mock_services=[], config_path=house.path
+    )
+
+    await automation_test.state_change("input_select.house_mode", "away", wait=False)
+    await automation_test.elapse(1)
+
+    assert sorted(log.entity_ids()) == sorted(lights)
+    assert all(automation_test.hass.states.get(light).state == "off" for light in lights)
@@ -0,0 +1,149 @@
+"""Tests for the trace exporter and scripts/trace_report.py."""
+
+import json
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+from homeassistant.components.trace.const import DATA_TRACE
+from homeassistant.helpers.json import ExtendedJSONEncoder
+
+from tests.helpers import trace_export
+from tests.helpers.trace_export import TraceExporter
+
+TRACE_REPORT = Path(__file__).parent.parent.parent / "scripts" / "trace_report.py"
+
+CAMERA_AUTOMATION = "living_room_camera_away_mode_control"
+CAMERA_ALIAS = "Living Room Camera: Away Mode Control"
+
+
+@pytest.fixture
+def exporter(tmp_path):
+    """Export the runs of the test to a file, written once the test is done."""
+    exporter = TraceExporter(tmp_path / "traces.jsonl")
+    exporter.start()
+    yield exporter
+    exporter.stop()
+
+
+async def run_camera_away_mode(automation_test) -> None:
+    """Run the camera away mode automation once, by turning away mode on."""
+    await automation_test.setup(
+        automation=("living_room", "camera_away_mode.yaml"),
+        entities={"input_boolean.house_mode_away": "off"},
+        mock_service=("input_boolean", "turn_on"),
+    )
+    await automation_test.state_change("input_boolean.house_mode_away", "on")
+
+
+def exported_runs(exporter: TraceExporter) -> list[dict]:
+    """Stop the exporter and return the runs it wrote."""
+    exporter.stop()
+    return [json.loads(line) for line in exporter.path.read_text().splitlines()]
+
+
+def trace_report(path: Path, *args: str) -> str:
+    """Run scripts/trace_report.py on a file and return what it printed."""
+    return subprocess.run(
+        [sys.executable, str(TRACE_REPORT), str(path), *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=30,
+    ).stdout
+
+
+async def test_exports_trigger_conditions_and_timed_steps(automation_test, exporter):
+    """Test that a run is written with its trigger, condition results and steps."""
+    await run_camera_away_mode(automation_test)
+
+    [run] = exported_runs(exporter)
+    assert run["automation"] == CAMERA_AUTOMATION
+    assert run["alias"] == CAMERA_ALIAS
+    assert run["trigger"] == "state of input_boolean.house_mode_away"
+    assert run["trigger_id"] == "away_on"
+    assert run["execution"] == "finished"
+    assert run["variables_size"] > 0
+    assert {"path": "action/0/choose/0/conditions/0", "result": True} in run["conditions"]
+
+    choose, service = run["steps"]
+    assert choose["path"] == "action/0"
+    assert choose["result"] == {"choice": 0}
+    assert service["path"] == "action/0/choose/0/sequence/0"
+    # The option's step is timed within the choose step
+    assert choose["start_ms"] <= service["start_ms"] <= service["end_ms"] <= choose["end_ms"]
+    assert run["duration_ms"] == choose["end_ms"] > 0
+
+
+async def test_appends_every_run(automation_test, exporter):
+    """Test that each run is a line of its own, added as the run finishes."""
+    await run_camera_away_mode(automation_test)
+    await automation_test.state_change("input_boolean.house_mode_away", "off")
+    await automation_test.state_change("input_boolean.house_mode_away", "on")
+
+    runs = exported_runs(exporter)
+    assert [run["trigger_id"] for run in runs] == ["away_on", "away_off", "away_on"]
+    assert exporter.runs == 3
+
+
+async def test_records_are_built_on_the_event_loop(automation_test, exporter, monkeypatch):
+    """Test that the writer thread is only handed the record, never the trace."""
+    threads = []
+    run_record = trace_export.run_record
+
+    def _run_record(*args):
+        threads.append(threading.current_thread())
+        return run_record(*args)
+
+    monkeypatch.setattr(trace_export, "run_record", _run_record)
+    await run_camera_away_mode(automation_test)
+
+    [run] = exported_runs(exporter)
+    assert run["trigger_id"] == "away_on"
+    assert set(threads) == {threading.main_thread()}
+
+
+async def test_report_lists_step_durations_per_automation(automation_test, exporter):
+    """Test that the analyzer aggregates the exported steps of an automation."""
+    await run_camera_away_mode(automation_test)
+    await automation_test.state_change("input_boolean.house_mode_away", "off")
+    exporter.stop()
+
+    report = trace_report(exporter.path)
+
+    assert report.startswith(f'{CAMERA_AUTOMATION} "{CAMERA_ALIAS}": 2 runs')
+    steps = {line.split()[0]: line.split()[1] for line in report.splitlines()[2:]}
+    assert steps == {
+        "action/0": "2",
+        "action/0/choose/0/sequence/0": "1",
+        "action/0/choose/1/sequence/0": "1",
+    }
+
+
+async def test_report_reads_saved_traces(automation_test, tmp_path):
+    """Test that the analyzer reads the traces Home Assistant saves on shutdown."""
+    await run_camera_away_mode(automation_test)
+    traces = automation_test.hass.data[DATA_TRACE]
+    saved = tmp_path / "trace.saved_traces"
+    saved.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "minor_version": 1,
+                "key": "trace.saved_traces",
+                "data": {
+                    key: [trace.as_dict() for trace in runs.values()]
+                    for key, runs in traces.items()
+                },
+            },
+            cls=ExtendedJSONEncoder,
+        )
+    )
+
+    report = trace_report(saved, "-a", CAMERA_AUTOMATION)
+
+    assert report.startswith(f'{CAMERA_AUTOMATION} "{CAMERA_ALIAS}": 1 runs')
+    steps = {line.split()[0] for line in report.splitlines()[2:]}
+    assert steps == {"action/0", "action/0/choose/0/sequence/0"}
@@ -1,10 +1,38 @@
 """Helper utilities for testing Home Assistant automations."""
 
+import re
+from pathlib import Path
 from typing import Any
+import yaml
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
+from homeassistant.util.yaml import load_yaml_dict
 from pytest_homeassistant_custom_component.common import async_mock_service
 
+CONFIG_PATH = Path(__file__).parent.parent.parent
+AUTOMATIONS_PATH = CONFIG_PATH / "automations"
+
+# ("category", "file.yaml") as passed to setup() and load_automation()
+AUTOMATION_REFERENCE = re.compile(r'"(\w+)",\s*"(\w+)(?:\.yaml)?"')
+
+# Helper integrations set up for real when the whole house is loaded.
+# shell_command is deliberately missing: it would run the real commands.
+HELPER_DOMAINS = ("input_boolean", "input_select", "input_datetime", "input_text", "timer")
+
+# Services the automations call on devices outside Home Assistant,
+# mocked when the whole house is loaded
+HOUSE_MOCK_SERVICES = [
+    ("scene", "turn_on"),
+    ("light", "turn_on"),
+    ("light", "turn_off"),
+    ("switch", "turn_on"),
+    ("switch", "turn_off"),
+    ("climate", "set_hvac_mode"),
+    ("shell_command", "turn_on_living_room_camera"),
+    ("shell_command", "turn_off_living_room_camera"),
+    ("shell_command", "get_living_room_camera_power_status"),
+]
+
 
 async def setup_automation(
     hass: HomeAssistant, automation_config: dict[str, Any]
@@ -26,6 +54,109 @@ async def setup_automation(
     return result
 
 
+def load_house_automations(config_path: Path = CONFIG_PATH) -> list[dict[str, Any]]:
+    """
+    Load every automation the way integrations/automation.yaml does.
+
+    Uses the Home Assistant YAML loader, so `!include_dir_list` ordering,
+    anchors and duplicate keys behave exactly as in production.
+
+    Args:
+        config_path: Configuration tree to load, e.g. a synthetic one
+            (see tests/helpers/synthetic_house.py)
+
+    Returns:
+        List of automation configurations (from automations.yaml and automations/)
+    """
+    package = load_yaml_dict(config_path / "integrations" / "automation.yaml")
+    return [
+        automation_config
+        for key in ("automation", "automation split")
+        for automation_config in package.get(key) or []
+    ]
+
+
+def load_automation_file(file: str) -> dict[str, Any]:
+    """
+    Load one automation file, as the load_automation fixture does.
+
+    Args:
+        file: Automation file relative to automations/, e.g. house/mode.yaml
+
+    Returns:
+        Parsed automation dictionary
+    """
+    with open(AUTOMATIONS_PATH / file) as f:
+        return yaml.safe_load(f)
+
+
+def automation_files() -> list[str]:
+    """Return every automation file, relative to automations/."""
+    return [
+        str(path.relative_to(AUTOMATIONS_PATH))
+        for path in sorted(AUTOMATIONS_PATH.glob("*/*.yaml"))
+    ]
+
+
+def load_helper_entities(config_path: Path = CONFIG_PATH) -> dict[str, dict[str, Any]]:
+    """
+    Load the helper entity definitions the way integrations/entities.yaml does.
+
+    Args:
+        config_path: Configuration tree to load
+
+    Returns:
+        Dictionary mapping helper domain to its configuration
+    """
+    package = load_yaml_dict(config_path / "integrations" / "entities.yaml")
+    return {domain: package.get(domain) or {} for domain in HELPER_DOMAINS}
+
+
+async def setup_helper_entities(hass: HomeAssistant, config_path: Path = CONFIG_PATH) -> None:
+    """
+    Set up the real helper entities (input_boolean, input_select, ...).
+
+    Args:
+        hass: Home Assistant instance
+        config_path: Configuration tree to load
+    """
+    for domain, config in load_helper_entities(config_path).items():
+        assert await async_setup_component(hass, domain, {domain: config})
+    await hass.async_block_till_done()
+
+
+def load_house_scenes(config_path: Path = CONFIG_PATH) -> list[dict[str, Any]]:
+    """
+    Load every scene the way integrations/scene.yaml does.
+
+    Args:
+        config_path: Configuration tree to load
+
+    Returns:
+        List of scene configurations (from scenes.yaml and scenes/)
+    """
+    package = load_yaml_dict(config_path / "integrations" / "scene.yaml")
+    return [
+        scene_config
+        for key in ("scene", "scene split")
+        for scene_config in package.get(key) or []
+    ]
+
+
+async def setup_house_scenes(hass: HomeAssistant, config_path: Path = CONFIG_PATH) -> None:
+    """
+    Set up the real scenes, so scene.turn_on reproduces their states.
+
+    Args:
+        hass: Home Assistant instance
+        config_path: Configuration tree to load
+    """
+    assert await async_setup_component(
+        hass, "scene", {"scene": load_house_scenes(config_path)}
+    )
+    await hass.async_block_till_done()
+
+
 async def trigger_state_change(
     hass: HomeAssistant, entity_id: str, new_state: str, old_state: str | None = None
 ):
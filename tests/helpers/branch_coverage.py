@@ -0,0 +1,248 @@
+"""Branch coverage of the automation YAML, collected from automation traces.
+
+Python coverage cannot see which parts of an automation ran. The trace of
+every run can: a `choose` step records the option it took, an `if` step
+whether it ran `then` or `else`, and a `repeat` step one element per
+iteration. Each finished trace is reduced to those counts and dropped, so
+nothing beyond Home Assistant's own stored traces is kept in memory.
+
+The branches themselves are listed from the YAML, with their line numbers,
+so branches no test takes show up in the report too.
+"""
+
+from collections import Counter
+from typing import Any, NamedTuple
+from unittest.mock import patch
+
+import yaml
+from homeassistant.components.automation.trace import AutomationTrace
+
+from tests.helpers.automation_helpers import AUTOMATIONS_PATH
+
+# Counted per (automation id, trace path of the step, choice)
+BranchKey = tuple[str, str, int | str]
+
+# Choice a repeat step's iterations are counted under
+REPEAT = "repeat"
+
+
+class Branch(NamedTuple):
+    """A branch of an automation's actions."""
+
+    file: str  # e.g. house/mode.yaml
+    line: int
+    automation_id: str
+    path: str  # trace path of the step, e.g. action/0
+    choice: int | str  # option index, "default", "then", "else" or REPEAT
+    label: str
+
+    @property
+    def key(self) -> BranchKey:
+        """Return the key the branch is counted under."""
+        return (self.automation_id, self.path, self.choice)
+
+
+def automation_branches(file: str) -> list[Branch]:
+    """Return the branches of an automation file, in file order.
+
+    Args:
+        file: Automation file relative to automations/, e.g. house/mode.yaml
+    """
+    with open(AUTOMATIONS_PATH / file) as f:
+        root = yaml.compose(f, Loader=yaml.SafeLoader)
+    if not isinstance(root, yaml.MappingNode):
+        return []
+    automation_id = _value(root, "id")
+    actions = _value(root, "actions") or _value(root, "action")
+    if automation_id is None or actions is None:
+        # Blueprint instances run the blueprint's actions
+        return []
+    branches: list[Branch] = []
+    _sequence_branches(file, str(automation_id.value), actions, "action", branches)
+    return branches
+
+
+def _value(node: yaml.MappingNode, key: str) -> yaml.Node | None:
+    """Return the value of a key in a mapping node, following `<<` merges.
+
+    Args:
+        node: Mapping node
+        key: Key to look up
+    """
+    merged = []
+    for key_node, value_node in node.value:
+        if key_node.value == key:
+            return value_node
+        if key_node.value == "<<":
+            merged += value_node.value if isinstance(value_node, yaml.SequenceNode) else [value_node]
+    for merged_node in merged:
+        if isinstance(merged_node, yaml.MappingNode) and (
+            value := _value(merged_node, key)
+        ) is not None:
+            return value
+    return None
+
+
+def _steps(node: yaml.Node) -> list[yaml.Node]:
+    """Return the steps of a sequence, which may be a single step."""
+    return node.value if isinstance(node, yaml.SequenceNode) else [node]
+
+
+def _label(node: yaml.Node, default: str) -> str:
+    """Return a node's alias, or a default label."""
+    alias = _value(node, "alias") if isinstance(node, yaml.MappingNode) else None
+    return f'"{alias.value}"' if alias is not None else default
+
+
+def _sequence_branches(
+    file: str, automation_id: str, sequence: yaml.Node, path: str, branches: list[Branch]
+) -> None:
+    """Add the branches of a sequence of steps, and of the steps nested in them.
+
+    Args:
+        file: Automation file relative to automations/
+        automation_id: The automation's id
+        sequence: Sequence (or single step) node
+        path: Trace path of the sequence, e.g. action/0/choose/1/sequence
+        branches: List the branches are added to
+    """
+    for index, step in enumerate(_steps(sequence)):
+        if not isinstance(step, yaml.MappingNode):
+            continue
+        step_path = f"{path}/{index}"
+
+        def add(node: yaml.Node, choice: int | str, label: str) -> None:
+            branches.append(
+                Branch(file, node.start_mark.line + 1, automation_id, step_path, choice, label)
+            )
+
+        if (options := _value(step, "choose")) is not None:
+            for option_index, option in enumerate(_steps(options)):
+                add(option, option_index, _label(option, str(option_index)))
+                if (option_sequence := _value(option, "sequence")) is not None:
+                    _sequence_branches(
+                        file,
+                        automation_id,
+                        option_sequence,
+                        f"{step_path}/choose/{option_index}/sequence",
+                        branches,
+                    )
+            if (default := _value(step, "default")) is not None:
+                add(default, "default", "default")
+                _sequence_branches(file, automation_id, default, f"{step_path}/default", branches)
+
+        if _value(step, "if") is not None:
+            for branch in ("then", "else"):
+                if (branch_sequence := _value(step, branch)) is not None:
+                    add(branch_sequence, branch, branch)
+                    _sequence_branches(
+                        file, automation_id, branch_sequence, f"{step_path}/{branch}", branches
+                    )
+
+        if (repeat := _value(step, "repeat")) is not None:
+            add(step, REPEAT, _label(step, f"at {step_path}"))
+            if (repeat_sequence := _value(repeat, "sequence")) is not None:
+                _sequence_branches(
+                    file, automation_id, repeat_sequence, f"{step_path}/repeat/sequence", branches
+                )
+
+
+class BranchCoverage:
+    """Count the branches taken by every automation run, from its trace."""
+
+    def __init__(self):
+        """Initialize empty counts (collection starts with `start()`)."""
+        self.counts: Counter[BranchKey] = Counter()
+        self._patch = None
+
+    def start(self) -> None:
+        """Start counting the branches of every automation run that finishes."""
+        if self._patch is not None:
+            return
+        finished = AutomationTrace.finished
+        coverage = self
+
+        def _finished(trace: AutomationTrace) -> None:
+            finished(trace)
+            coverage.record(trace)
+
+        self._patch = patch.object(AutomationTrace, "finished", _finished)
+        self._patch.start()
+
+    def stop(self) -> None:
+        """Stop counting."""
+        if self._patch is not None:
+            self._patch.stop()
+            self._patch = None
+
+    def record(self, trace: AutomationTrace) -> None:
+        """Count the branches a finished run took.
+
+        Args:
+            trace: The run's trace
+        """
+        automation_id = trace.key.removeprefix("automation.")
+        for path, elements in (trace._trace or {}).items():
+            if path.endswith("/repeat/sequence/0"):
+                # One element per iteration (Home Assistant keeps the last 20)
+                step = path.removesuffix("/repeat/sequence/0")
+                self.counts[(automation_id, step, REPEAT)] += len(elements)
+            for element in elements:
+                result = element._result
+                if result and "choice" in result:
+                    self.counts[(automation_id, path, result["choice"])] += 1
+
+    def as_list(self) -> list[list[Any]]:
+        """Return the counts in a form that can be sent between processes."""
+        return [[*key, count] for key, count in self.counts.items()]
+
+    def merge(self, counts: list[list[Any]]) -> None:
+        """Add counts collected elsewhere, e.g. by an xdist worker.
+
+        Args:
+            counts: Counts as returned by `as_list()`
+        """
+        for automation_id, path, choice, count in counts:
+            self.counts[(automation_id, path, choice)] += count
+
+    def report(self, files: list[str] | None = None) -> str:
+        """Return each file's branches taken, listing those never taken.
+
+        Args:
+            files: Automation files to report, relative to automations/
+                (default: every file with branches)
+        """
+        if files is None:
+            files = [
+                str(path.relative_to(AUTOMATIONS_PATH))
+                for path in sorted(AUTOMATIONS_PATH.glob("*/*.yaml"))
+            ]
+        lines = []
+        total = taken = 0
+        for file in files:
+            branches = automation_branches(file)
+            if not branches:
+                continue
+            missed = [branch for branch in branches if not self.counts[branch.key]]
+            total += len(branches)
+            taken += len(branches) - len(missed)
+            lines.append(
+                f"{file:<40} {len(branches) - len(missed):>3}/{len(branches):<3} "
+                f"{(len(branches) - len(missed)) / len(branches):>5.0%}"
+            )
+            lines += [
+                f"  line {branch.line:>4}: {_describe(branch)} never taken"
+                for branch in missed
+            ]
+        if total:
+            lines.append(f"{'total':<40} {taken:>3}/{total:<3} {taken / total:>5.0%}")
+        return "\n".join(lines)
+
+
+def _describe(branch: Branch) -> str:
+    """Return what kind of branch it is, and its label."""
+    if isinstance(branch.choice, int):
+        return f"choose option {branch.label}"
+    if branch.choice == REPEAT:
+        return f"repeat {branch.label}"
+    return f"{branch.label} branch of the step at {branch.path}"
@@ -0,0 +1,233 @@
+"""Cheap-first ordering of the conditions of an automation.
+
+Conditions in a list are and-ed, and `or` conditions are or-ed, both
+stopping at the first condition that settles the result. Putting the cheap
+checks first (a trigger id, an entity's state) saves rendering a template
+whenever a cheap check already settles it.
+
+Reordering such a list does not change its result: conditions have no side
+effects, and Home Assistant evaluates `and`/`or`/`not` to the same result in
+any order, errors included. The only difference is which conditions show
+up in the trace, and, for a choose option's conditions, whether an error
+is logged when a cheaper condition is already false.
+
+The cost of a condition is a rough estimate, in arbitrary units:
+`CONDITION_COSTS` per condition, more per entity checked, and for a
+template more per function it calls. A condition with nested conditions
+costs as much as all of them, the worst case.
+"""
+
+import re
+from typing import Any, NamedTuple
+
+from tests.helpers.automation_helpers import load_automation_file
+
+# Estimated cost of each kind of condition
+CONDITION_COSTS = {
+    "trigger": 1,
+    "state": 2,
+    "numeric_state": 3,
+    "time": 3,
+    "zone": 4,
+    "device": 5,
+    "sun": 5,
+    "template": 20,
+}
+# Conditions of an unknown kind
+DEFAULT_COST = 10
+# Each entity a state or numeric_state condition checks beyond the first
+ENTITY_COST = 1
+# Each function a template calls, e.g. states() or now()
+TEMPLATE_CALL_COST = 5
+
+TEMPLATE_CALL = re.compile(r"\b\w+\(")
+
+# Keys of conditions holding other conditions
+NESTED_KEYS = ("and", "or", "not")
+
+
+class Reordering(NamedTuple):
+    """A list of conditions not in cheap-first order."""
+
+    path: str  # e.g. action/0/choose/2/conditions/0/conditions
+    label: str  # alias of the option or condition holding the list
+    current: list[tuple[str, float]]  # (label, cost) of each condition
+    suggested: list[tuple[str, float]]
+
+
+def condition_cost(condition: Any) -> float:
+    """Return the estimated cost of evaluating a condition.
+
+    Args:
+        condition: Condition configuration, as loaded from YAML
+    """
+    if isinstance(condition, str):
+        # A template in shorthand form
+        return _template_cost(condition)
+    if isinstance(condition, list):
+        return sum(condition_cost(nested) for nested in condition)
+    if not isinstance(condition, dict):
+        return DEFAULT_COST
+    kind = _kind(condition)
+    if kind in NESTED_KEYS:
+        return sum(condition_cost(nested) for nested in _nested(condition))
+    if kind == "template":
+        return _template_cost(condition.get("value_template", ""))
+    cost = CONDITION_COSTS.get(kind, DEFAULT_COST)
+    if kind in ("state", "numeric_state"):
+        entities = condition.get("entity_id", [])
+        count = len(entities) if isinstance(entities, list) else 1
+        cost += ENTITY_COST * max(count - 1, 0)
+    return cost
+
+
+def cheapest_first(conditions: list[Any]) -> list[Any]:
+    """Return conditions ordered by cost, keeping the order of equal ones."""
+    return sorted(conditions, key=condition_cost)
+
+
+def reorderings(config: dict[str, Any]) -> list[Reordering]:
+    """Return every list of conditions of an automation not in cheap-first order.
+
+    Args:
+        config: Automation configuration, as loaded from YAML
+    """
+    found: list[Reordering] = []
+    for key in ("conditions", "condition"):
+        if key in config:
+            _condition_reorderings(config[key], key, _label(config), found)
+    for key in ("actions", "action"):
+        if key in config:
+            _sequence_reorderings(config[key], key, found)
+    return found
+
+
+def reorder(config: Any) -> Any:
+    """Return a copy of an automation with every list of conditions cheap-first.
+
+    Args:
+        config: Automation configuration, or any part of it
+    """
+    if isinstance(config, list):
+        return [reorder(value) for value in config]
+    if not isinstance(config, dict):
+        return config
+    reordered = {key: reorder(value) for key, value in config.items()}
+    for key in ("conditions", "condition", *NESTED_KEYS, "if"):
+        if isinstance(reordered.get(key), list):
+            reordered[key] = cheapest_first(reordered[key])
+    return reordered
+
+
+def file_reorderings(file: str) -> list[Reordering]:
+    """Return the reorderings of an automation file.
+
+    Args:
+        file: Automation file relative to automations/, e.g. house/mode.yaml
+    """
+    return reorderings(load_automation_file(file))
+
+
+def _kind(condition: dict[str, Any]) -> str:
+    """Return the kind of a condition, shorthand `and`/`or`/`not` included."""
+    if "condition" in condition:
+        return condition["condition"]
+    return next((key for key in NESTED_KEYS if key in condition), "")
+
+
+def _nested(condition: dict[str, Any]) -> list[Any]:
+    """Return the conditions nested in an `and`, `or` or `not` condition."""
+    nested = condition.get("conditions", condition.get(_kind(condition), []))
+    return nested if isinstance(nested, list) else [nested]
+
+
+def _template_cost(template: str) -> float:
+    """Return the estimated cost of rendering a template."""
+    return CONDITION_COSTS["template"] + TEMPLATE_CALL_COST * len(TEMPLATE_CALL.findall(template))
+
+
+def _label(condition: Any) -> str:
+    """Return the alias of a condition, or its kind."""
+    if isinstance(condition, dict):
+        return f'"{condition["alias"]}"' if "alias" in condition else _kind(condition)
+    return "template"
+
+
+def _condition_reorderings(
+    conditions: Any, path: str, label: str, found: list[Reordering]
+) -> None:
+    """Add the reorderings of a list of conditions, and of those nested in it.
+
+    Args:
+        conditions: Condition or list of conditions
+        path: Path of the list from the automation root
+        label: Alias of the option or condition holding the list
+        found: List the reorderings are added to
+    """
+    if not isinstance(conditions, list):
+        # A single condition: nothing to reorder, only what is nested in it
+        _nested_reorderings(conditions, path, label, found)
+        return
+    suggested = cheapest_first(conditions)
+    if suggested != conditions:
+        found.append(
+            Reordering(
+                path,
+                label,
+                [(_label(condition), condition_cost(condition)) for condition in conditions],
+                [(_label(condition), condition_cost(condition)) for condition in suggested],
+            )
+        )
+    for index, condition in enumerate(conditions):
+        _nested_reorderings(condition, f"{path}/{index}", label, found)
+
+
+def _nested_reorderings(condition: Any, path: str, label: str, found: list[Reordering]) -> None:
+    """Add the reorderings of the conditions nested in an `and`, `or` or `not`.
+
+    Args:
+        condition: Condition, which may have none nested
+        path: Path of the condition from the automation root
+        label: Label of the list holding the condition, for one without alias
+        found: List the reorderings are added to
+    """
+    if isinstance(condition, dict) and _kind(condition) in NESTED_KEYS:
+        key = "conditions" if "conditions" in condition else _kind(condition)
+        if "alias" in condition:
+            label = _label(condition)
+        _condition_reorderings(condition[key], f"{path}/{key}", label, found)
+
+
+def _sequence_reorderings(sequence: Any, path: str, found: list[Reordering]) -> None:
+    """Add the reorderings of the conditions in a sequence of steps.
+
+    Args:
+        sequence: Sequence, or a single step
+        path: Path of the sequence from the automation root
+        found: List the reorderings are added to
+    """
+    steps = sequence if isinstance(sequence, list) else [sequence]
+    for index, step in enumerate(steps):
+        if not isinstance(step, dict):
+            continue
+        step_path = f"{path}/{index}" if isinstance(sequence, list) else path
+        if "choose" in step:
+            options = step["choose"] if isinstance(step["choose"], list) else [step["choose"]]
+            for option_index, option in enumerate(options):
+                option_path = f"{step_path}/choose/{option_index}"
+                _condition_reorderings(
+                    option.get("conditions", []),
+                    f"{option_path}/conditions",
+                    _label(option) if "alias" in option else f"option {option_index}",
+                    found,
+                )
+                _sequence_reorderings(option.get("sequence", []), f"{option_path}/sequence", found)
+        if "if" in step:
+            _condition_reorderings(step["if"], f"{step_path}/if", step.get("alias", "if"), found)
+        for key in ("sequence", "then", "else", "default", "parallel"):
+            if key in step:
+                _sequence_reorderings(step[key], f"{step_path}/{key}", found)
+        if isinstance(step.get("repeat"), dict):
+            _sequence_reorderings(
+                step["repeat"].get("sequence", []), f"{step_path}/repeat/sequence", found
+            )
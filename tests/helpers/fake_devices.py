@@ -0,0 +1,186 @@
+"""Fake light and switch platforms that count the commands they receive.
+
+The fake devices stand in for the Zigbee lights and switches, so a test can
+apply the real scenes and see exactly which radio commands an activation
+would send. Initial states use the same format as the scene files.
+"""
+
+from typing import Any, NamedTuple
+from homeassistant.components.light import (
+    ATTR_BRIGHTNESS,
+    ATTR_COLOR_TEMP_KELVIN,
+    ColorMode,
+    LightEntity,
+    LightEntityFeature,
+)
+from homeassistant.components.switch import SwitchEntity
+from homeassistant.const import STATE_ON
+from homeassistant.core import HomeAssistant
+from homeassistant.loader import async_get_integration
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import (
+    MockModule,
+    MockPlatform,
+    mock_integration,
+    mock_platform,
+)
+
+FAKE_DOMAIN = "fake_device"
+
+
+class DeviceCommand(NamedTuple):
+    """A command received by a fake device."""
+
+    entity_id: str
+    service: str
+    data: dict[str, Any]
+
+
+class CommandLog:
+    """Commands received by the fake devices, oldest first."""
+
+    def __init__(self):
+        """Initialize the log."""
+        self.commands: list[DeviceCommand] = []
+
+    def record(self, entity_id: str, service: str, data: dict[str, Any]) -> None:
+        """Record a command sent to a device."""
+        self.commands.append(DeviceCommand(entity_id, service, data))
+
+    def count(self, entity_id: str | None = None, service: str | None = None) -> int:
+        """Return the number of commands matching every given filter.
+
+        Args:
+            entity_id: Device the command was sent to
+            service: "turn_on" or "turn_off"
+        """
+        return sum(
+            1
+            for command in self.commands
+            if (entity_id is None or command.entity_id == entity_id)
+            and (service is None or command.service == service)
+        )
+
+    def entity_ids(self) -> list[str]:
+        """Return the devices that received a command, in order."""
+        return [command.entity_id for command in self.commands]
+
+    def clear(self) -> None:
+        """Forget every recorded command."""
+        self.commands.clear()
+
+
+class FakeLight(LightEntity):
+    """A dimmable, tunable white light."""
+
+    _attr_should_poll = False
+    _attr_supported_color_modes = {ColorMode.COLOR_TEMP}
+    _attr_color_mode = ColorMode.COLOR_TEMP
+    _attr_supported_features = LightEntityFeature.TRANSITION
+
+    def __init__(self, entity_id: str, state: dict[str, Any], log: CommandLog):
+        """Initialize the light.
+
+        Args:
+            entity_id: Entity ID to register the light under
+            state: Initial state in scene format (state, brightness, ...)
+            log: Log receiving every command
+        """
+        self.entity_id = entity_id
+        self._attr_unique_id = entity_id
+        self._attr_is_on = state.get("state") == STATE_ON
+        self._attr_brightness = state.get(ATTR_BRIGHTNESS, 255)
+        self._attr_color_temp_kelvin = state.get(ATTR_COLOR_TEMP_KELVIN, 2700)
+        self._log = log
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn the light on."""
+        self._log.record(self.entity_id, "turn_on", kwargs)
+        self._attr_is_on = True
+        self._attr_brightness = kwargs.get(ATTR_BRIGHTNESS, self._attr_brightness)
+        self._attr_color_temp_kelvin = kwargs.get(
+            ATTR_COLOR_TEMP_KELVIN, self._attr_color_temp_kelvin
+        )
+        self.async_write_ha_state()
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn the light off."""
+        self._log.record(self.entity_id, "turn_off", kwargs)
+        self._attr_is_on = False
+        self.async_write_ha_state()
+
+
+class FakeSwitch(SwitchEntity):
+    """A relay switching a circuit of lights."""
+
+    _attr_should_poll = False
+
+    def __init__(self, entity_id: str, state: dict[str, Any], log: CommandLog):
+        """Initialize the switch.
+
+        Args:
+            entity_id: Entity ID to register the switch under
+            state: Initial state in scene format
+            log: Log receiving every command
+        """
+        self.entity_id = entity_id
+        self._attr_unique_id = entity_id
+        self._attr_is_on = state.get("state") == STATE_ON
+        self._log = log
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn the switch on."""
+        self._log.record(self.entity_id, "turn_on", kwargs)
+        self._attr_is_on = True
+        self.async_write_ha_state()
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn the switch off."""
+        self._log.record(self.entity_id, "turn_off", kwargs)
+        self._attr_is_on = False
+        self.async_write_ha_state()
+
+
+async def async_setup_fake_devices(
+    hass: HomeAssistant, devices: dict[str, dict[str, Any] | str]
+) -> CommandLog:
+    """Set up fake lights and switches that record the commands they receive.
+
+    Args:
+        hass: Home Assistant instance
+        devices: Dictionary of entity_id -> initial state, either a state
+            string ("on"/"off") or a scene-format dict
+
+    Returns:
+        Log of every command the devices receive
+    """
+    log = CommandLog()
+    entities = {"light": [], "switch": []}
+    for entity_id, state in devices.items():
+        if isinstance(state, str):
+            state = {"state": state}
+        domain = entity_id.split(".", 1)[0]
+        entity_class = FakeLight if domain == "light" else FakeSwitch
+        entities[domain].append(entity_class(entity_id, state, log))
+
+    mock_integration(hass, MockModule(FAKE_DOMAIN))
+    for domain, domain_entities in entities.items():
+
+        async def async_setup_platform(
+            hass, config, async_add_entities, discovery_info=None, _entities=domain_entities
+        ):
+            async_add_entities(_entities)
+
+        mock_platform(
+            hass,
+            f"{FAKE_DOMAIN}.{domain}",
+            MockPlatform(async_setup_platform=async_setup_platform),
+        )
+        await async_setup_component(hass, domain, {domain: [{"platform": FAKE_DOMAIN}]})
+        # Scenes import this platform in the executor on first use, which
+        # virtual time cannot wait for, so import it now
+        integration = await async_get_integration(hass, domain)
+        await integration.async_get_platform("reproduce_state")
+
+    await hass.async_block_till_done()
+    return log
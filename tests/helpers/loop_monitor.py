@@ -0,0 +1,181 @@
+"""Event loop blocking detection for automation tests.
+
+A service handler, template or helper that does blocking work stalls every
+automation in the house, but a test still passes as long as the result is
+right. The monitor here times every callback the event loop runs and
+records the ones over a threshold, together with the automation and step
+that was executing, so such a stall fails the test instead.
+
+Attribution uses the script trace: each action step pushes a trace element
+when it starts, so the step followed by the longest gap inside a slow
+callback is the one that blocked.
+"""
+
+import asyncio
+import contextvars
+from time import perf_counter
+from typing import NamedTuple
+from unittest.mock import patch
+from homeassistant.helpers import script
+from homeassistant.helpers.trace import TraceElement, trace_id_cv, trace_stack_cv
+
+# Default threshold in milliseconds, well above a normal automation step
+DEFAULT_THRESHOLD_MS = 50.0
+
+
+class SlowCallback(NamedTuple):
+    """An event loop callback that ran longer than the threshold."""
+
+    duration: float
+    callback: str
+    automation: str | None
+    step: str | None
+
+
+class LoopBlockingDetector:
+    """Record event loop callbacks that run longer than a threshold."""
+
+    def __init__(
+        self,
+        threshold_ms: float = DEFAULT_THRESHOLD_MS,
+        harness_tasks: set[str] | None = None,
+    ):
+        """Initialize the detector.
+
+        Args:
+            threshold_ms: Callbacks running at least this long are recorded
+            harness_tasks: Coroutine names of test code whose own work (loading
+                components, setting up the house) is not recorded, only the
+                automations it runs inline
+        """
+        self.threshold = threshold_ms / 1000
+        self.harness_tasks = harness_tasks or set()
+        self.slow_callbacks: list[SlowCallback] = []
+        self._patches: list = []
+        # (start time, automation, step) of each step started in the running callback
+        self._steps: list[tuple[float, str | None, str | None]] | None = None
+
+    def start(self) -> None:
+        """Start timing event loop callbacks."""
+        if self._patches:
+            return
+        run_handle = asyncio.Handle._run
+        push = script.trace_stack_push
+
+        def _timed_run(handle: asyncio.Handle) -> None:
+            self._steps = []
+            start = perf_counter()
+            try:
+                run_handle(handle)
+            finally:
+                duration = perf_counter() - start
+                steps, self._steps = self._steps, None
+                if duration >= self.threshold:
+                    self._record(handle, start, duration, steps)
+
+        def _tracked_push(trace_stack_var, node) -> None:
+            push(trace_stack_var, node)
+            if self._steps is not None and isinstance(node, TraceElement):
+                trace_id = trace_id_cv.get()
+                self._steps.append(
+                    (perf_counter(), trace_id[0] if trace_id else None, node.path)
+                )
+
+        self._patches = [
+            patch.object(asyncio.Handle, "_run", _timed_run),
+            patch.object(script, "trace_stack_push", _tracked_push),
+        ]
+        for active in self._patches:
+            active.start()
+
+    def stop(self) -> None:
+        """Stop timing event loop callbacks."""
+        for active in reversed(self._patches):
+            active.stop()
+        self._patches = []
+
+    def _record(
+        self,
+        handle: asyncio.Handle,
+        start: float,
+        duration: float,
+        steps: list[tuple[float, str | None, str | None]],
+    ) -> None:
+        """Record a slow callback, attributed to the step that blocked.
+
+        Args:
+            handle: The callback that ran
+            start: perf_counter() when it started
+            duration: Seconds it ran for
+            steps: Steps started while it ran, see `start()`
+        """
+        # The step the callback resumed in, before any new step started
+        resumed = _context_step(handle._context)
+        segments = [(start, *resumed), *steps]
+        ends = [segment[0] for segment in segments[1:]] + [start + duration]
+        _, automation, step = max(
+            zip(segments, ends), key=lambda pair: pair[1] - pair[0][0]
+        )[0]
+        if automation is None and _task_name(handle) in self.harness_tasks:
+            return
+        self.slow_callbacks.append(
+            SlowCallback(duration, _describe(handle), automation, step)
+        )
+
+    def report(self) -> str:
+        """Return a readable list of the slow callbacks."""
+        lines = [
+            f"{len(self.slow_callbacks)} callback(s) blocked the event loop "
+            f"for {self.threshold * 1000:g}ms or more:"
+        ]
+        for slow in self.slow_callbacks:
+            where = (
+                f"{slow.automation} at {slow.step}"
+                if slow.automation
+                else "outside any automation"
+            )
+            lines.append(f"  {slow.duration * 1000:.1f}ms in {where}: {slow.callback}")
+        return "\n".join(lines)
+
+
+def _context_step(
+    context: contextvars.Context | None,
+) -> tuple[str | None, str | None]:
+    """Return the automation and step executing in a callback's context.
+
+    Args:
+        context: The context the callback runs in
+    """
+    if context is None:
+        return None, None
+    trace_id = context.get(trace_id_cv)
+    trace_stack = context.get(trace_stack_cv)
+    return (
+        trace_id[0] if trace_id else None,
+        trace_stack[-1].path if trace_stack else None,
+    )
+
+
+def _task_name(handle: asyncio.Handle) -> str | None:
+    """Return the coroutine name of the task a handle steps, if any.
+
+    Args:
+        handle: The callback that ran
+    """
+    # Task steps are bound methods of the task
+    task = getattr(handle._callback, "__self__", None)
+    if isinstance(task, asyncio.Task):
+        return getattr(task.get_coro(), "__qualname__", None)
+    return None
+
+
+def _describe(handle: asyncio.Handle) -> str:
+    """Return a short description of the callback a handle runs.
+
+    Args:
+        handle: The callback that ran
+    """
+    if (name := _task_name(handle)) is not None:
+        return f"task {name}"
+    callback = handle._callback
+    return getattr(callback, "__qualname__", repr(callback))
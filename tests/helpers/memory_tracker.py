@@ -0,0 +1,190 @@
+"""Memory allocation and leak tracking for automation tests.
+
+Uses tracemalloc to measure how much an automation allocates at its peak
+and how much it leaves behind. Two measurements are offered:
+
+- Cycles: the peak and retained memory of one `AutomationTestContext`
+  setup/cleanup cycle, labelled with the automation file. Cheap, as only
+  the traced totals are read.
+- Growth: the memory retained across repeated runs of the same automation,
+  compared with snapshots so the allocation sites that grew can be named.
+  A run leaving listeners, timers or traces behind grows it on every run.
+
+Every automation keeps `stored_traces: 25`, so the trace store keeps
+growing for the first 25 runs by design; measure growth after that warmup.
+"""
+
+import asyncio
+import gc
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from typing import NamedTuple
+
+# Traces kept per automation (`trace: stored_traces:` in every automation)
+STORED_TRACES = 25
+
+# Allocations made by the test tooling itself, not by Home Assistant
+IGNORED_ALLOCATIONS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<unknown>"),
+    # Log records captured by pytest for the report
+    tracemalloc.Filter(False, "*/logging/*"),
+    tracemalloc.Filter(False, "*/_pytest/*"),
+    # Bounded standard library caches of compiled patterns
+    tracemalloc.Filter(False, "*/re/*"),
+    tracemalloc.Filter(False, "*/fnmatch.py"),
+)
+
+
+class CycleStats(NamedTuple):
+    """Memory allocated by one setup/cleanup cycle, in bytes."""
+
+    label: str
+    peak: int
+    retained: int
+
+
+class GrowthStats(NamedTuple):
+    """Memory retained across repeated runs, in bytes."""
+
+    label: str
+    runs: int
+    retained: int
+    top: list[str]
+
+    @property
+    def per_run(self) -> float:
+        """Return the bytes retained per run."""
+        return self.retained / self.runs
+
+
+class MemoryTracker:
+    """Measure allocations with tracemalloc."""
+
+    def __init__(self):
+        """Initialize the tracker (tracing starts with `start()`)."""
+        self.cycles: list[CycleStats] = []
+        self._started = False
+        self._label: str | None = None
+        self._baseline = 0
+
+    def start(self) -> None:
+        """Start tracing allocations, unless they already are."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started = True
+
+    def stop(self) -> None:
+        """Stop tracing allocations, if this tracker started it."""
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def begin_cycle(self, label: str) -> None:
+        """Start measuring a setup/cleanup cycle.
+
+        Args:
+            label: What is being set up, e.g. the automation file
+        """
+        self.start()
+        gc.collect()
+        self._label = label
+        self._baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def end_cycle(self) -> CycleStats | None:
+        """Finish measuring the current cycle and record it.
+
+        Returns:
+            The cycle's stats, or None if no cycle was started
+        """
+        if self._label is None:
+            return None
+        # Peak first, collecting garbage allocates
+        peak = tracemalloc.get_traced_memory()[1]
+        gc.collect()
+        current = tracemalloc.get_traced_memory()[0]
+        stats = CycleStats(self._label, peak - self._baseline, current - self._baseline)
+        self.cycles.append(stats)
+        self._label = None
+        return stats
+
+    async def measure_growth(
+        self,
+        label: str,
+        run: Callable[[], Awaitable[None]],
+        runs: int = 20,
+        warmup: int = STORED_TRACES,
+        windows: int = 2,
+    ) -> GrowthStats:
+        """Measure the memory retained across repeated runs.
+
+        The runs are measured in several windows and the smallest growth is
+        kept: a leak grows in every window, while a one-off allocation (a
+        delayed registry save, a cache filling up) only shows in one.
+
+        Args:
+            label: What is being run, e.g. the automation entity
+            run: Coroutine function running it once and waiting for it to finish
+            runs: Number of measured runs per window
+            warmup: Runs made first, filling the trace store and caches
+            windows: Number of windows of measured runs
+
+        Returns:
+            The memory retained by the measured runs of the window that grew
+            least, with the allocation sites that grew the most
+        """
+        # Home Assistant's test plugin runs the loop in debug mode, which keeps
+        # a traceback per task and logs every callback slower than 100ms with
+        # the task's repr. Under tracemalloc, and more so on a loaded machine,
+        # many are, and the log records kept those reprs as if runs leaked
+        loop = asyncio.get_running_loop()
+        debug = loop.get_debug()
+        loop.set_debug(False)
+        try:
+            self.start()
+            for _ in range(warmup):
+                await run()
+            before = _snapshot()
+            measured = []
+            for _ in range(windows):
+                for _ in range(runs):
+                    await run()
+                after = _snapshot()
+                differences = after.compare_to(before, "lineno")
+                measured.append(
+                    GrowthStats(
+                        label,
+                        runs,
+                        sum(stat.size_diff for stat in differences),
+                        [str(stat) for stat in differences[:5] if stat.size_diff > 0],
+                    )
+                )
+                before = after
+        finally:
+            loop.set_debug(debug)
+        return min(measured, key=lambda growth: growth.retained)
+
+    def report(self) -> str:
+        """Return the cycles grouped by label, largest retained first."""
+        by_label: dict[str, list[CycleStats]] = {}
+        for cycle in self.cycles:
+            by_label.setdefault(cycle.label, []).append(cycle)
+
+        lines = [f"{'automation':<40} {'cycles':>6} {'peak KiB':>10} {'retained KiB':>13}"]
+        for label, cycles in sorted(
+            by_label.items(),
+            key=lambda item: max(cycle.retained for cycle in item[1]),
+            reverse=True,
+        ):
+            peak = max(cycle.peak for cycle in cycles) / 1024
+            retained = max(cycle.retained for cycle in cycles) / 1024
+            lines.append(f"{label:<40} {len(cycles):>6} {peak:>10.1f} {retained:>13.1f}")
+        return "\n".join(lines)
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    """Return a snapshot of the live allocations, without the tooling's own."""
+    gc.collect()
+    return tracemalloc.take_snapshot().filter_traces(IGNORED_ALLOCATIONS)
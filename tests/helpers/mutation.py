@@ -0,0 +1,246 @@
+"""Mutation testing of the automation YAML.
+
+A mutant is an automation with one deliberate mistake in it: a trigger's
+`to:` state flipped, two `choose` options swapped, a condition negated or a
+time comparison shifted. Running an automation's tests against the mutant
+should fail; a mutant the tests still pass with ("survived") points at
+behaviour no assertion covers.
+
+Mutants are made from the parsed automation. `scripts/mutate.py`
+generates them and runs the tests against each one with a `MutantPlugin`
+registered, which swaps the mutant in for the original wherever the tests
+load it. Test runs without the plugin never see a mutant.
+"""
+
+import re
+from collections.abc import Iterator
+from typing import Any, NamedTuple
+
+import pytest
+
+from tests.helpers import automation_helpers, test_context
+from tests.helpers.automation_helpers import (
+    AUTOMATION_REFERENCE,
+    CONFIG_PATH,
+    load_automation_file,
+)
+
+TESTS_PATH = CONFIG_PATH / "tests"
+
+# Keys whose value is a condition or a list of conditions
+CONDITION_KEYS = {"condition", "conditions", "and", "or", "not", "if"}
+
+# Keys holding no behaviour, or only data the steps read
+SKIPPED_KEYS = {"id", "alias", "description", "trace", "variables", "mode"}
+
+TIME = re.compile(r"^(\d{1,2}):(\d{2})(?::(\d{2}))?$")
+# A quoted time literal in a template, e.g. '00:00:00'
+TEMPLATE_TIME = re.compile(r"'(\d{2}):(\d{2}):(\d{2})'")
+# A comparison operator in a template, made strict or non-strict by a mutant
+TEMPLATE_COMPARISON = re.compile(r"<=|>=|(?<![<>=!])[<>](?!=)")
+FLIPPED_COMPARISON = {"<=": "<", ">=": ">", "<": "<=", ">": ">="}
+
+# How far a time comparison is shifted
+SHIFT_HOURS = 1
+
+
+class Mutant(NamedTuple):
+    """An automation with one mutation."""
+
+    file: str  # e.g. house/mode.yaml
+    automation_id: str | None
+    description: str
+    config: dict[str, Any]
+
+
+class MutantPlugin:
+    """Pytest plugin swapping a mutant in for its automation in every test.
+
+    Register it for a test run, e.g. `pytest.main(args, plugins=[MutantPlugin(mutant)])`:
+    the `load_automation` fixture then returns the mutant for its file, and
+    the whole house is set up with the mutant in place of the original.
+    """
+
+    def __init__(self, mutant: Mutant):
+        """Initialize the plugin.
+
+        Args:
+            mutant: Mutant to swap in
+        """
+        self.mutant = mutant
+
+    @pytest.fixture(autouse=True)
+    def swap_in_mutant(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Swap the mutant in for the duration of each test."""
+        self.apply(monkeypatch)
+
+    def apply(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Patch the automation loaders to return the mutant.
+
+        Args:
+            monkeypatch: Patches to undo after the test
+        """
+        mutant = self.mutant
+        load_file = automation_helpers.load_automation_file
+        load_house = automation_helpers.load_house_automations
+
+        def load_mutated_file(file: str) -> dict[str, Any]:
+            return mutant.config if file == mutant.file else load_file(file)
+
+        def load_mutated_house(*args: Any, **kwargs: Any) -> list[dict[str, Any]]:
+            automations = load_house(*args, **kwargs)
+            if mutant.automation_id is None:
+                return automations
+            return [
+                mutant.config if config.get("id") == mutant.automation_id else config
+                for config in automations
+            ]
+
+        monkeypatch.setattr(automation_helpers, "load_automation_file", load_mutated_file)
+        monkeypatch.setattr(automation_helpers, "load_house_automations", load_mutated_house)
+        monkeypatch.setattr(test_context, "load_house_automations", load_mutated_house)
+
+
+def generate_mutants(file: str, config: dict[str, Any] | None = None) -> list[Mutant]:
+    """Return every mutant of an automation file.
+
+    Args:
+        file: Automation file relative to automations/, e.g. house/mode.yaml
+        config: The parsed automation, loaded from the file if not given
+    """
+    if config is None:
+        config = load_automation_file(file)
+    mutants = []
+    for path, node, parent_key in _walk(config, ()):
+        for description, replacement in _mutations(node, parent_key):
+            mutated = _replace(config, path, replacement)
+            if mutated != config:
+                where = "/".join(str(key) for key in path)
+                mutants.append(
+                    Mutant(file, config.get("id"), f"{where}: {description}", mutated)
+                )
+    return mutants
+
+
+def relevant_tests(file: str) -> list[str]:
+    """Return the test modules that run an automation file.
+
+    Those loading it by name come first, as they are the likeliest to fail
+    fast, then those setting up the whole house.
+
+    Args:
+        file: Automation file relative to automations/, e.g. house/mode.yaml
+    """
+    category, name = file.removesuffix(".yaml").split("/")
+    own, house = [], []
+    for path in sorted(TESTS_PATH.glob("*/test_*.py")):
+        # The harness tests check the tooling, not the automations
+        if path.parent.name in ("harness", "helpers"):
+            continue
+        source = path.read_text()
+        module = str(path.relative_to(CONFIG_PATH))
+        if (category, name) in AUTOMATION_REFERENCE.findall(source):
+            own.append(module)
+        elif "setup_house(" in source:
+            house.append(module)
+    return own + house
+
+
+def _walk(node: Any, path: tuple, parent_key: Any = None) -> Iterator[tuple[tuple, Any, Any]]:
+    """Yield (path, node, key of the enclosing mapping) for every node.
+
+    Args:
+        node: Node to walk from
+        path: Path of the node from the automation root
+        parent_key: Mapping key the node (or its list) is under
+    """
+    yield path, node, parent_key
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key not in SKIPPED_KEYS:
+                yield from _walk(value, (*path, key), key)
+    elif isinstance(node, list):
+        for index, value in enumerate(node):
+            yield from _walk(value, (*path, index), parent_key)
+
+
+def _mutations(node: Any, parent_key: Any) -> Iterator[tuple[str, Any]]:
+    """Yield (description, replacement) for each mutation of a node.
+
+    Args:
+        node: Node to mutate
+        parent_key: Mapping key the node (or its list) is under
+    """
+    if isinstance(node, dict):
+        # Flip a state trigger's `to:`
+        if parent_key in ("trigger", "triggers") and isinstance(node.get("to"), str):
+            flipped = {"on": "off", "off": "on"}.get(node["to"])
+            yield f"to {node['to']!r} -> {flipped!r}", {**node, "to": flipped}
+
+        # Swap neighbouring choose options
+        options = node.get("choose")
+        if isinstance(options, list):
+            for index in range(len(options) - 1):
+                swapped = list(options)
+                swapped[index], swapped[index + 1] = swapped[index + 1], swapped[index]
+                yield f"swap choose options {index} and {index + 1}", {**node, "choose": swapped}
+
+        # Negate a condition (in a condition list, or a condition step)
+        if parent_key in CONDITION_KEYS or isinstance(node.get("condition"), str):
+            yield "negate condition", {"condition": "not", "conditions": [node]}
+
+        # Shift a time condition or trigger
+        for key in ("after", "before", "at"):
+            if (shifted := _shift_time(node.get(key))) is not None:
+                yield f"{key} {node[key]} -> {shifted}", {**node, key: shifted}
+
+    elif isinstance(node, str) and "{{" in node and "time" in node:
+        # Shift a time comparison in a template
+        for match in TEMPLATE_COMPARISON.finditer(node):
+            flipped = FLIPPED_COMPARISON[match.group()]
+            yield (
+                f"template {match.group()} -> {flipped} at {match.start()}",
+                node[: match.start()] + flipped + node[match.end() :],
+            )
+        for match in TEMPLATE_TIME.finditer(node):
+            shifted = _shift_time(":".join(match.groups()))
+            yield (
+                f"template '{':'.join(match.groups())}' -> '{shifted}'",
+                node[: match.start()] + f"'{shifted}'" + node[match.end() :],
+            )
+
+
+def _shift_time(value: Any) -> str | int | None:
+    """Return a time moved SHIFT_HOURS later, or None if the value is no time.
+
+    Args:
+        value: "HH:MM[:SS]", or seconds since midnight as YAML 1.1 reads an
+            unquoted 02:00:00
+    """
+    if isinstance(value, int) and not isinstance(value, bool):
+        return (value + SHIFT_HOURS * 3600) % 86400
+    if not isinstance(value, str) or not (match := TIME.match(value)):
+        return None
+    hours, minutes, seconds = match.groups()
+    return f"{(int(hours) + SHIFT_HOURS) % 24:02d}:{minutes}:{seconds or '00'}"
+
+
+def _replace(node: Any, path: tuple, value: Any) -> Any:
+    """Return a copy of node with the value at path replaced.
+
+    Only the containers along the path are copied: YAML aliases share
+    objects, and a mutation must not leak into the other places they are used.
+
+    Args:
+        node: Root to replace in
+        path: Keys and indexes leading to the value
+        value: Replacement
+    """
+    if not path:
+        return value
+    key, rest = path[0], path[1:]
+    if isinstance(node, dict):
+        return {**node, key: _replace(node[key], rest, value)}
+    copied = list(node)
+    copied[key] = _replace(node[key], rest, value)
+    return copied
@@ -0,0 +1,262 @@
+"""Global service call recorder for automation tests.
+
+Records every service call made on the bus, not just one mocked service, so
+a test touching scene.turn_on, light.turn_off and shell_command.* in one run
+can observe all of them.
+
+Calls are stored in a fixed-size ring buffer made of parallel slot lists,
+with per-key indexes holding sequence numbers, so recording is a handful of
+list writes and queries only visit the matching calls.
+"""
+
+from collections import deque
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any, NamedTuple
+from homeassistant.const import (
+    ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
+    ATTR_SERVICE,
+    ATTR_SERVICE_DATA,
+    EVENT_CALL_SERVICE,
+)
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, ServiceCall, callback
+
+DEFAULT_CAPACITY = 4096
+
+
+class RecordedCall(NamedTuple):
+    """A service call captured by the recorder."""
+
+    seq: int
+    domain: str
+    service: str
+    data: dict[str, Any]
+    entity_ids: tuple[str, ...]
+    context_id: str | None
+    parent_id: str | None
+    time_fired: datetime
+
+
+class ServiceCallRecorder:
+    """Record every service call on the bus into a ring buffer.
+
+    Real service handlers still run (pass-through). Services that do not
+    exist in the test, or that should not run, are replaced with a no-op
+    handler using `mock()`; their calls are recorded all the same.
+    """
+
+    def __init__(self, hass: HomeAssistant, capacity: int = DEFAULT_CAPACITY):
+        """Initialize the recorder.
+
+        Args:
+            hass: Home Assistant instance
+            capacity: Number of calls kept before the oldest are overwritten
+        """
+        self.hass = hass
+        self.capacity = capacity
+        self.mocked: set[tuple[str, str]] = set()
+        self._unsub: CALLBACK_TYPE | None = None
+        self._seq = 0
+        # One list per field, indexed by slot (seq % capacity)
+        self._domain: list[str | None] = [None] * capacity
+        self._service: list[str | None] = [None] * capacity
+        self._data: list[dict[str, Any] | None] = [None] * capacity
+        self._entity_ids: list[tuple[str, ...]] = [()] * capacity
+        self._context_id: list[str | None] = [None] * capacity
+        self._parent_id: list[str | None] = [None] * capacity
+        self._time_fired: list[datetime | None] = [None] * capacity
+        # Index key -> sequence numbers, oldest first
+        self._by_domain: dict[str, deque[int]] = {}
+        self._by_service: dict[tuple[str, str], deque[int]] = {}
+        self._by_entity: dict[str, deque[int]] = {}
+        self._by_context: dict[str, deque[int]] = {}
+
+    @callback
+    def async_start(self) -> None:
+        """Start recording service calls."""
+        if self._unsub is None:
+            self._unsub = self.hass.bus.async_listen(
+                EVENT_CALL_SERVICE, self._async_record
+            )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop recording service calls."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def mock(self, *services: tuple[str, str]) -> None:
+        """Replace services with a no-op handler, so calls are only recorded.
+
+        Args:
+            services: (domain, service) tuples to mock
+        """
+
+        @callback
+        def mock_service(call: ServiceCall) -> None:
+            """Swallow the call, the recorder has already seen it."""
+
+        for domain, service in services:
+            self.mocked.add((domain, service))
+            self.hass.services.async_register(domain, service, mock_service)
+
+    @callback
+    def _async_record(self, event: Event) -> None:
+        """Store a call_service event in the next slot."""
+        seq = self._seq
+        self._seq = seq + 1
+        slot = seq % self.capacity
+        if slot == 0 and seq:
+            self._prune()
+
+        data = event.data
+        domain = data[ATTR_DOMAIN]
+        service = data[ATTR_SERVICE]
+        service_data = data.get(ATTR_SERVICE_DATA) or {}
+        entity_ids = service_data.get(ATTR_ENTITY_ID) or ()
+        if isinstance(entity_ids, str):
+            entity_ids = (entity_ids,)
+        else:
+            entity_ids = tuple(entity_ids)
+        context = event.context
+
+        self._domain[slot] = domain
+        self._service[slot] = service
+        self._data[slot] = service_data
+        self._entity_ids[slot] = entity_ids
+        self._context_id[slot] = context.id
+        self._parent_id[slot] = context.parent_id
+        self._time_fired[slot] = event.time_fired
+
+        self._by_domain.setdefault(domain, deque()).append(seq)
+        self._by_service.setdefault((domain, service), deque()).append(seq)
+        for entity_id in entity_ids:
+            self._by_entity.setdefault(entity_id, deque()).append(seq)
+        self._by_context.setdefault(context.id, deque()).append(seq)
+
+    @property
+    def total(self) -> int:
+        """Return the number of calls recorded, including overwritten ones."""
+        return self._seq
+
+    @property
+    def dropped(self) -> int:
+        """Return the number of calls overwritten by newer ones."""
+        return max(0, self._seq - self.capacity)
+
+    def __len__(self) -> int:
+        """Return the number of calls currently held."""
+        return self._seq - self.dropped
+
+    def _live(self, seqs: deque[int]) -> deque[int]:
+        """Drop sequence numbers whose slot has been overwritten."""
+        oldest = self.dropped
+        while seqs and seqs[0] < oldest:
+            seqs.popleft()
+        return seqs
+
+    def _prune(self) -> None:
+        """Drop overwritten calls from every index, once per buffer wrap."""
+        for index in (self._by_domain, self._by_service, self._by_entity, self._by_context):
+            for key in [key for key, seqs in index.items() if not self._live(seqs)]:
+                del index[key]
+
+    def _get(self, seq: int) -> RecordedCall:
+        """Build the call stored for a sequence number."""
+        slot = seq % self.capacity
+        return RecordedCall(
+            seq,
+            self._domain[slot],
+            self._service[slot],
+            self._data[slot],
+            self._entity_ids[slot],
+            self._context_id[slot],
+            self._parent_id[slot],
+            self._time_fired[slot],
+        )
+
+    def _candidates(
+        self,
+        domain: str | None,
+        service: str | None,
+        entity_id: str | None,
+        context_id: str | None,
+    ) -> Iterable[int]:
+        """Return the sequence numbers of the most selective index."""
+        if context_id is not None:
+            return self._live(self._by_context.get(context_id, deque()))
+        if entity_id is not None:
+            return self._live(self._by_entity.get(entity_id, deque()))
+        if domain is not None and service is not None:
+            return self._live(self._by_service.get((domain, service), deque()))
+        if domain is not None:
+            return self._live(self._by_domain.get(domain, deque()))
+        return range(self.dropped, self._seq)
+
+    def calls(
+        self,
+        domain: str | None = None,
+        service: str | None = None,
+        entity_id: str | None = None,
+        context_id: str | None = None,
+    ) -> list[RecordedCall]:
+        """Return the recorded calls matching every given filter, oldest first.
+
+        Args:
+            domain: Service domain (e.g., "scene")
+            service: Service name (e.g., "turn_on")
+            entity_id: Entity targeted by the call
+            context_id: Id of the context the call was made in
+        """
+        result = []
+        for seq in self._candidates(domain, service, entity_id, context_id):
+            slot = seq % self.capacity
+            if domain is not None and self._domain[slot] != domain:
+                continue
+            if service is not None and self._service[slot] != service:
+                continue
+            if entity_id is not None and entity_id not in self._entity_ids[slot]:
+                continue
+            if context_id is not None and self._context_id[slot] != context_id:
+                continue
+            result.append(self._get(seq))
+        return result
+
+    def count(
+        self,
+        domain: str | None = None,
+        service: str | None = None,
+        entity_id: str | None = None,
+        context_id: str | None = None,
+    ) -> int:
+        """Return the number of recorded calls matching every given filter."""
+        if entity_id is None and context_id is None:
+            if domain is not None and service is not None:
+                return len(self._live(self._by_service.get((domain, service), deque())))
+            if domain is not None and service is None:
+                return len(self._live(self._by_domain.get(domain, deque())))
+            if domain is None and service is None:
+                return len(self)
+        return len(self.calls(domain, service, entity_id, context_id))
+
+    def mocked_calls(self) -> list[RecordedCall]:
+        """Return the recorded calls to mocked services, oldest first."""
+        if len(self.mocked) == 1:
+            return self.calls(*next(iter(self.mocked)))
+        seqs = sorted(
+            seq
+            for key in self.mocked
+            for seq in self._live(self._by_service.get(key, deque()))
+        )
+        return [self._get(seq) for seq in seqs]
+
+    def clear(self) -> None:
+        """Forget every recorded call (mocked services stay mocked)."""
+        self._seq = 0
+        self._by_domain.clear()
+        self._by_service.clear()
+        self._by_entity.clear()
+        self._by_context.clear()
@@ -0,0 +1,226 @@
+"""Parallel test sharding grouped by automation file.
+
+With `pytest -n auto`, tests are sent to workers in shards: every test that
+loads the same automation YAML runs on the same worker, so that worker's
+caches (parsed YAML, compiled templates, imported integrations) stay warm.
+Whole-house modules (`setup_house()`) load every automation, so each one is
+a shard of its own and they spread over the workers.
+
+Shards are handed out longest first, using each test's duration recorded by
+earlier runs in the pytest cache, so one slow shard is not left running
+alone at the end.
+"""
+
+import re
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import cache
+import pytest
+import yaml
+from homeassistant.util import slugify
+from xdist.scheduler import LoadScopeScheduling
+
+from tests.helpers.automation_helpers import (
+    AUTOMATION_REFERENCE,
+    AUTOMATIONS_PATH,
+    CONFIG_PATH,
+)
+
+# Cache key of the recorded test durations, by node id
+DURATIONS_KEY = "automation_shards/durations"
+
+# Seconds assumed for a test without a recorded duration
+DEFAULT_DURATION = 0.5
+
+# category-file.yaml in a parametrized test id
+AUTOMATION_PARAMETER = re.compile(r"(?:^|[\[-])(\w+)-(\w+)\.yaml")
+# An automation entity in a parametrized test id
+AUTOMATION_ENTITY = re.compile(r"automation\.(\w+)")
+
+
+def _automation_file(category: str, name: str) -> str | None:
+    """Return the automation file a reference names, if it exists.
+
+    Args:
+        category: Subdirectory of automations/
+        name: File name, without .yaml
+    """
+    path = AUTOMATIONS_PATH / category / f"{name}.yaml"
+    return f"{category}/{name}.yaml" if path.is_file() else None
+
+
+@cache
+def _automation_entities() -> dict[str, str]:
+    """Return the automation file of each automation entity, by object id."""
+    entities = {}
+    for path in sorted(AUTOMATIONS_PATH.glob("*/*.yaml")):
+        with open(path) as f:
+            config = yaml.safe_load(f)
+        if isinstance(config, dict) and "alias" in config:
+            entities[slugify(config["alias"])] = str(path.relative_to(AUTOMATIONS_PATH))
+    return entities
+
+
+@cache
+def _module_shard(module: str) -> str:
+    """Return the shard of a test module, from the automations it loads.
+
+    Args:
+        module: Test module path relative to the project root
+    """
+    path = CONFIG_PATH / module
+    if not path.is_file():
+        return module
+    source = path.read_text()
+    # Every automation loaded, none of them is the one the module is about
+    if "setup_house(" in source:
+        return module
+    references = [
+        automation
+        for category, name in AUTOMATION_REFERENCE.findall(source)
+        if (automation := _automation_file(category, name))
+    ]
+    if not references:
+        return module
+    # The automation a module is about is the one it loads most
+    return max(set(references), key=references.count)
+
+
+def automation_shard(nodeid: str) -> str:
+    """Return the shard a test belongs to.
+
+    A test parametrized over automation files or entities goes with that
+    automation's file, other tests go with the automation their module
+    loads, and tests that load no automation stay with their module.
+
+    Args:
+        nodeid: pytest node id, e.g. tests/automations/test_house_mode.py::test_x
+    """
+    module, _, name = nodeid.partition("::")
+    if "[" in name:
+        parameters = name.split("[", 1)[1]
+        for category, file_name in AUTOMATION_PARAMETER.findall(parameters):
+            if automation := _automation_file(category, file_name):
+                return automation
+        for object_id in AUTOMATION_ENTITY.findall(parameters):
+            if automation := _automation_entities().get(object_id):
+                return automation
+    return _module_shard(module)
+
+
+def load_durations(config: pytest.Config) -> dict[str, float]:
+    """Return the test durations recorded by earlier runs, by node id."""
+    if getattr(config, "cache", None) is None:
+        return {}
+    return config.cache.get(DURATIONS_KEY, {})
+
+
+def save_durations(config: pytest.Config, durations: dict[str, float]) -> None:
+    """Merge this run's test durations into the recorded ones."""
+    if getattr(config, "cache", None) is None or not durations:
+        return
+    config.cache.set(DURATIONS_KEY, {**load_durations(config), **durations})
+
+
+class _LongestFirstQueue(OrderedDict):
+    """Work queue of shards that hands out the longest remaining shard first."""
+
+    def __init__(self, cost: Callable[[dict[str, bool]], float]):
+        """Initialize the queue.
+
+        Args:
+            cost: Estimated seconds of a shard's tests ({node id: completed})
+        """
+        super().__init__()
+        self.cost = cost
+
+    def popitem(self, last: bool = True) -> tuple[str, dict[str, bool]]:
+        """Remove and return the shard with the most work left."""
+        if not self:
+            raise KeyError("popitem(): work queue is empty")
+        shard = max(self, key=lambda key: self.cost(self[key]))
+        return shard, self.pop(shard)
+
+
+class AutomationShardScheduling(LoadScopeScheduling):
+    """Send each automation's tests to one worker, longest shards first."""
+
+    def __init__(self, config: pytest.Config, log=None):
+        """Initialize the scheduler.
+
+        Args:
+            config: pytest configuration, holding the duration cache
+            log: xdist log producer
+        """
+        super().__init__(config, log)
+        durations = load_durations(config)
+        known = list(durations.values())
+        default = sum(known) / len(known) if known else DEFAULT_DURATION
+        self.workqueue = _LongestFirstQueue(
+            lambda tests: sum(durations.get(nodeid, default) for nodeid in tests)
+        )
+
+    def _split_scope(self, nodeid: str) -> str:
+        """Return the shard of a test (the automation file it loads)."""
+        return automation_shard(nodeid)
+
+
+class ShardReport:
+    """Record test durations for the next run and report the time of each shard.
+
+    Registered as a plugin in the controlling process, which receives the
+    reports of every worker.
+    """
+
+    def __init__(self, config: pytest.Config):
+        """Initialize the report.
+
+        Args:
+            config: pytest configuration, holding the duration cache
+        """
+        self.config = config
+        self.durations: dict[str, float] = {}
+        # Shard -> (worker ids, seconds, test node ids)
+        self.shards: dict[str, tuple[set[str], list[float], set[str]]] = {}
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        """Add up the setup, call and teardown time of each test."""
+        self.durations[report.nodeid] = (
+            self.durations.get(report.nodeid, 0.0) + report.duration
+        )
+        if (node := getattr(report, "node", None)) is None:
+            return
+        workers, seconds, tests = self.shards.setdefault(
+            automation_shard(report.nodeid), (set(), [0.0], set())
+        )
+        workers.add(node.gateway.id)
+        seconds[0] += report.duration
+        tests.add(report.nodeid)
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        """Record this run's durations for balancing the next one."""
+        save_durations(self.config, self.durations)
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        """List each shard's time and worker, longest first, then each worker's total."""
+        if not self.shards:
+            return
+        terminalreporter.write_sep("=", "time per shard")
+        totals: dict[str, list[float]] = {}
+        for shard, (workers, seconds, tests) in sorted(
+            self.shards.items(), key=lambda item: item[1][1][0], reverse=True
+        ):
+            terminalreporter.write_line(
+                f"{seconds[0]:>7.1f}s {len(tests):>4} tests  "
+                f"{','.join(sorted(workers)):<5} {shard}"
+            )
+            for worker in workers:
+                totals.setdefault(worker, [0.0, 0])
+                totals[worker][0] += seconds[0] / len(workers)
+                totals[worker][1] += 1
+        terminalreporter.write_line(
+            "  ".join(
+                f"{worker} {seconds:.1f}s ({shards} shards)"
+                for worker, (seconds, shards) in sorted(totals.items())
+            )
+        )
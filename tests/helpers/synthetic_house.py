@@ -0,0 +1,337 @@
+"""Synthetic configuration trees at a chosen scale, laid out like this repository.
+
+The house has six rooms and about fifteen automations, which says nothing
+about how the layout behaves when it grows. `generate_house()` writes a
+tree with any number of rooms and automations, following the same
+conventions, so it loads through the same `!include_dir_*` files:
+
+- configuration.yaml and integrations/automation.yaml, scene.yaml and
+  entities.yaml, copied as-is, so `automation.reload` reads the tree too
+- entities/input_select/house_mode.yaml, copied, and an `input_boolean` per
+  occupant in entities/input_boolean/
+- scenes/<room>/<mode>.yaml: `away` and `sleep` scenes for every room, a
+  `work` scene for every third room (applied if its occupant is home) and
+  a `bedtime` scene for every fifth
+- automations/house/apply_mode_scenes.yaml: the real automation, with a
+  `mode_map` listing every room's scenes
+- automations/<room>/<kind>_<n>.yaml: motion lights, a scene button and a
+  sleep mode follower per room, in turn until the automation count is met
+
+Entity ids follow the room names: `light.<room>_light_<n>`,
+`binary_sensor.<room>_motion`, `scene.<room>_<mode>`.
+"""
+
+import shutil
+import uuid
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import yaml
+
+from tests.helpers.automation_helpers import CONFIG_PATH
+
+# Modes with a scene in every room, and the rooms of the others
+EVERY_ROOM_MODES = ("away", "sleep")
+WORK_ROOM_EVERY = 3
+BEDTIME_ROOM_EVERY = 5
+
+DEFAULT_LIGHTS_PER_ROOM = 3
+DEFAULT_OCCUPANTS = 2
+
+# Packages of integrations/ a tree loads
+PACKAGES = ("automation.yaml", "scene.yaml", "entities.yaml")
+
+# What copy_house() copies of the repository, besides configuration.yaml and PACKAGES
+HOUSE_TREES = ("automations", "blueprints", "entities", "scenes")
+HOUSE_FILES = ("automations.yaml", "scenes.yaml")
+
+# Namespace of the generated ids, so a tree is the same every time
+ID_NAMESPACE = uuid.UUID("0b0e8f2c-6c1a-4d55-9d07-7f0a1c4e2a91")
+
+
+class SyntheticHouse(NamedTuple):
+    """A generated configuration tree."""
+
+    path: Path
+    rooms: list[str]
+    occupants: list[str]
+    lights: list[list[str]]  # per room
+    automations: int
+    scenes: int
+
+
+def room_name(index: int) -> str:
+    """Return the name of the room at an index, e.g. room_007."""
+    return f"room_{index + 1:03d}"
+
+
+def generate_house(
+    path: Path,
+    rooms: int,
+    automations: int,
+    lights_per_room: int = DEFAULT_LIGHTS_PER_ROOM,
+    occupants: int = DEFAULT_OCCUPANTS,
+) -> SyntheticHouse:
+    """Write a synthetic configuration tree.
+
+    Args:
+        path: Directory to write it to, created if missing
+        rooms: Number of rooms
+        automations: Number of automations, apply_mode_scenes.yaml included
+        lights_per_room: Lights in each room
+        occupants: Occupants with an `input_boolean.<occupant>_home`; the
+            work scenes are shared out between them
+    """
+    if automations < 1:
+        raise ValueError("A house has at least apply_mode_scenes.yaml")
+    path.mkdir(parents=True, exist_ok=True)
+    room_names = [room_name(index) for index in range(rooms)]
+    occupant_names = [f"occupant_{index + 1}" for index in range(occupants)]
+
+    _copy(CONFIG_PATH / "configuration.yaml", path / "configuration.yaml")
+    for name in PACKAGES:
+        _copy(CONFIG_PATH / "integrations" / name, path / "integrations" / name)
+    for name in ("automations.yaml", "scenes.yaml"):
+        (path / name).write_text("[]\n")
+    _copy(
+        CONFIG_PATH / "entities" / "input_select" / "house_mode.yaml",
+        path / "entities" / "input_select" / "house_mode.yaml",
+    )
+    for occupant in occupant_names:
+        _write(
+            path / "entities" / "input_boolean" / f"{occupant}_home.yaml",
+            {f"{occupant}_home": {"name": f"{occupant.replace('_', ' ').title()} Home"}},
+        )
+
+    mode_map: dict[str, dict[str, list]] = {}
+    scenes = 0
+    for index, room in enumerate(room_names):
+        lights = _lights(room, lights_per_room)
+        for mode, state in _room_modes(index):
+            _write(
+                path / "scenes" / room / f"{mode}.yaml",
+                {
+                    "id": _id("scene", room, mode),
+                    "name": f"{_title(room)}: {mode.title()}",
+                    "entities": {light: _light_state(state) for light in lights},
+                },
+            )
+            scenes += 1
+            entry = mode_map.setdefault(mode, {"always": [], "conditional": []})
+            if mode == "work" and occupant_names:
+                occupant = occupant_names[index // WORK_ROOM_EVERY % len(occupant_names)]
+                entry["conditional"].append(
+                    {"scene": f"scene.{room}_work", "condition": f"input_boolean.{occupant}_home"}
+                )
+            else:
+                entry["always"].append(f"scene.{room}_{mode}")
+
+    apply_mode_scenes = yaml.safe_load(
+        (CONFIG_PATH / "automations" / "house" / "apply_mode_scenes.yaml").read_text()
+    )
+    apply_mode_scenes["variables"]["mode_map"] = mode_map
+    _write(path / "automations" / "house" / "apply_mode_scenes.yaml", apply_mode_scenes)
+
+    kinds = list(ROOM_AUTOMATIONS)
+    for index in range(automations - 1):
+        room = room_names[index % rooms]
+        kind = kinds[index // rooms % len(kinds)]
+        number = index // (rooms * len(kinds)) + 1
+        config = ROOM_AUTOMATIONS[kind](room, f"{room}_{kind}_{number}", lights_per_room)
+        if number > 1:
+            config["alias"] += f" {number}"
+        _write(path / "automations" / room / f"{kind}_{number}.yaml", config)
+
+    return SyntheticHouse(
+        path,
+        room_names,
+        occupant_names,
+        [_lights(room, lights_per_room) for room in room_names],
+        automations,
+        scenes,
+    )
+
+
+def copy_house(path: Path) -> Path:
+    """Copy this house's automations, scenes and helpers into a tree to edit.
+
+    Only the packages loading them are copied, so reloading the copy does
+    not set up the integrations that are not installed in tests.
+
+    Args:
+        path: Directory to copy to, created if missing
+
+    Returns:
+        The path, to pass as `config_path`
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    _copy(CONFIG_PATH / "configuration.yaml", path / "configuration.yaml")
+    for name in PACKAGES:
+        _copy(CONFIG_PATH / "integrations" / name, path / "integrations" / name)
+    for name in HOUSE_FILES:
+        _copy(CONFIG_PATH / name, path / name)
+    for name in HOUSE_TREES:
+        shutil.copytree(CONFIG_PATH / name, path / name, ignore=shutil.ignore_patterns("*.md"))
+    return path
+
+
+def _room_modes(index: int) -> list[tuple[str, str]]:
+    """Return the modes a room has a scene for, with the state of its lights."""
+    modes = [(mode, "off") for mode in EVERY_ROOM_MODES]
+    if index % WORK_ROOM_EVERY == 0:
+        modes.append(("work", "on"))
+    if index % BEDTIME_ROOM_EVERY == 0:
+        modes.append(("bedtime", "on"))
+    return modes
+
+
+def _light_state(state: str) -> dict[str, Any]:
+    """Return a scene's state for a light, in scene file format."""
+    if state == "off":
+        return {"state": "off"}
+    return {"state": "on", "brightness": 214, "color_temp_kelvin": 2518}
+
+
+def _motion_lights(room: str, automation_id: str, lights: int) -> dict[str, Any]:
+    """Return a motion light automation, like study/lamp.yaml."""
+    target = {"entity_id": _lights(room, lights)}
+    return {
+        "id": _id("automation", automation_id),
+        "alias": f"{_title(room)}: Motion Lights",
+        "description": "Turns the lights on with motion, and off once the room is clear.",
+        "mode": "queued",
+        "trace": {"stored_traces": 25},
+        "triggers": [
+            {
+                "trigger": "state",
+                "id": "motion",
+                "entity_id": f"binary_sensor.{room}_motion",
+                "to": "on",
+            },
+            {
+                "trigger": "state",
+                "id": "clear",
+                "entity_id": f"binary_sensor.{room}_motion",
+                "to": "off",
+                "for": {"minutes": 10},
+            },
+        ],
+        "action": [
+            {
+                "choose": [
+                    {
+                        "alias": "Turn on with motion, unless asleep or away",
+                        "conditions": [
+                            {"condition": "trigger", "id": "motion"},
+                            {
+                                "condition": "not",
+                                "conditions": [
+                                    {
+                                        "condition": "state",
+                                        "entity_id": "input_select.house_mode",
+                                        "state": ["sleep", "away"],
+                                    }
+                                ],
+                            },
+                        ],
+                        "sequence": [{"action": "light.turn_on", "target": target}],
+                    },
+                    {
+                        "alias": "Turn off when the room is clear",
+                        "conditions": [{"condition": "trigger", "id": "clear"}],
+                        "sequence": [{"action": "light.turn_off", "target": target}],
+                    },
+                ]
+            }
+        ],
+    }
+
+
+def _scene_button(room: str, automation_id: str, lights: int) -> dict[str, Any]:
+    """Return a scene button automation, like bedroom/scene_button.yaml."""
+    return {
+        "id": _id("automation", automation_id),
+        "alias": f"{_title(room)}: Scene Button",
+        "description": "Applies the room's sleep scene on `off`, turns a light on otherwise.",
+        "mode": "restart",
+        "trace": {"stored_traces": 25},
+        "triggers": [
+            {
+                "trigger": "event",
+                "event_type": "zha_event",
+                "event_data": {"device_id": _id("device", room)},
+            }
+        ],
+        "action": [
+            {
+                "choose": [
+                    {
+                        "alias": "Sleep scene when off pressed",
+                        "conditions": [
+                            {
+                                "condition": "template",
+                                "value_template": "{{ trigger.event.data.command == 'off' }}",
+                            }
+                        ],
+                        "sequence": [
+                            {"action": "scene.turn_on", "target": {"entity_id": f"scene.{room}_sleep"}}
+                        ],
+                    }
+                ],
+                "default": [
+                    {
+                        "action": "light.turn_on",
+                        "target": {"entity_id": f"light.{room}_light_1"},
+                    }
+                ],
+            }
+        ],
+    }
+
+
+def _sleep_follower(room: str, automation_id: str, lights: int) -> dict[str, Any]:
+    """Return an automation turning a room's lights off when the house goes to sleep."""
+    return {
+        "id": _id("automation", automation_id),
+        "alias": f"{_title(room)}: Lights Off At Sleep",
+        "description": "Turns the lights off when the house mode changes to sleep.",
+        "mode": "single",
+        "trace": {"stored_traces": 25},
+        "triggers": [{"trigger": "state", "entity_id": "input_select.house_mode", "to": "sleep"}],
+        "action": [{"action": "light.turn_off", "target": {"entity_id": _lights(room, lights)}}],
+    }
+
+
+# Room automations by file name, each taking (room, automation id, lights per room)
+ROOM_AUTOMATIONS = {
+    "motion_lights": _motion_lights,
+    "scene_button": _scene_button,
+    "lights_off_at_sleep": _sleep_follower,
+}
+
+
+def _lights(room: str, count: int) -> list[str]:
+    """Return the light entity ids of a room."""
+    return [f"light.{room}_light_{light + 1}" for light in range(count)]
+
+
+def _id(*parts: str) -> str:
+    """Return a stable UUID for a generated item."""
+    return str(uuid.uuid5(ID_NAMESPACE, "/".join(parts)))
+
+
+def _title(room: str) -> str:
+    """Return a room's display name, e.g. Room 007."""
+    return room.replace("_", " ").title()
+
+
+def _copy(source: Path, destination: Path) -> None:
+    """Copy a file of the repository into the tree."""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(source, destination)
+
+
+def _write(path: Path, data: Any) -> None:
+    """Write a YAML file, starting with a document marker like the repository's."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("---\n" + yaml.safe_dump(data, sort_keys=False, allow_unicode=True))
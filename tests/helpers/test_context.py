@@ -1,33 +1,59 @@
 """Simplified test context for automation testing with minimal boilerplate."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Any
 from unittest.mock import patch
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import CoreState, HomeAssistant
 from homeassistant.util import dt as dt_util
-from pytest_homeassistant_custom_component.common import (
-    async_mock_service,
-    async_fire_time_changed,
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+from tests.helpers.automation_helpers import (
+    CONFIG_PATH,
+    HOUSE_MOCK_SERVICES,
+    load_house_automations,
+    setup_automation,
+    setup_helper_entities,
 )
-from tests.helpers.automation_helpers import setup_automation
+from tests.helpers.memory_tracker import MemoryTracker
+from tests.helpers.service_recorder import RecordedCall, ServiceCallRecorder
+from tests.helpers.virtual_time import VirtualClock, async_settle
+
+# Services used to set helper entities, so the entity itself holds the state
+HELPER_SET_SERVICES = {
+    "input_boolean": lambda state: (f"turn_{state}", {}),
+    "input_select": lambda state: ("select_option", {"option": state}),
+}
 
 
 class AutomationTestContext:
     """Context manager for simplified automation testing."""
 
-    def __init__(self, hass: HomeAssistant, load_automation):
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        load_automation,
+        memory: MemoryTracker | None = None,
+    ):
         """Initialize the test context.
 
         Args:
             hass: Home Assistant instance
             load_automation: Fixture to load automation from YAML
+            memory: Optional tracker measuring each setup/cleanup cycle,
+                labelled with the automation file ("house" for setup_house)
         """
         self.hass = hass
         self.load_automation = load_automation
-        self.service_calls = None
+        self.memory = memory
         self.automation_entity_id = None
+        self.recorder = ServiceCallRecorder(hass)
+        self.recorder.async_start()
+        self.clock = VirtualClock(hass)
         self._time_patch = None
         self._target_time = None
+        self._house = False
+        self._config_dir = None
 
     async def setup(
         self,
@@ -36,7 +62,9 @@ class AutomationTestContext:
         mock_service: tuple[str, str] | None = None,
         time: datetime | None = None,
         register_input_select_service: bool = False,
+        mock_services: list[tuple[str, str]] | None = None,
         automation_entity_id: str | None = None,
+        variables: dict[str, Any] | None = None,
     ):
         """Set up the test with all common boilerplate.
 
@@ -46,18 +74,25 @@ class AutomationTestContext:
             mock_service: Tuple of (domain, service) to mock, e.g. ("input_select", "select_option")
             time: Optional datetime to mock as current time
             register_input_select_service: If True, register working input_select.select_option service
+            mock_services: List of (domain, service) tuples to mock, for several services
             automation_entity_id: Optional custom automation entity ID for cleanup
+            variables: Automation variables to set over the file's, e.g. an optional target
         """
+        category, filename = automation
+        if self.memory:
+            self.memory.begin_cycle(f"{category}/{filename}")
+
         # Set up entities
         if entities:
             for entity_id, state in entities.items():
                 self.hass.states.async_set(entity_id, state)
             await self.hass.async_block_till_done()
 
-        # Mock service for call tracking
+        # Mock services for call tracking (every call is recorded regardless)
         if mock_service:
-            domain, service = mock_service
-            self.service_calls = async_mock_service(self.hass, domain, service)
+            self.recorder.mock(mock_service)
+        if mock_services:
+            self.recorder.mock(*mock_services)
 
         # Register working input_select service if requested
         if register_input_select_service:
@@ -73,8 +108,9 @@ class AutomationTestContext:
             self.hass.services.async_register("input_select", "select_option", handle_select_option)
 
         # Load automation config
-        category, filename = automation
         automation_config = self.load_automation(category, filename)
+        if variables:
+            automation_config["variables"] = {**automation_config.get("variables", {}), **variables}
 
         # Infer automation entity ID from config if not provided
         if automation_entity_id:
@@ -89,9 +125,7 @@ class AutomationTestContext:
 
         # Set up time mocking if requested
         if time:
-            self._target_time = time
-            self._time_patch = patch("homeassistant.util.dt.now", return_value=time)
-            self._time_patch.__enter__()
+            self._start_time_patch(time)
 
         # Set up automation
         await setup_automation(self.hass, automation_config)
@@ -101,6 +135,99 @@ class AutomationTestContext:
             async_fire_time_changed(self.hass, time)
             await self.hass.async_block_till_done()
 
+    async def setup_house(
+        self,
+        entities: dict[str, str] | None = None,
+        mock_services: list[tuple[str, str]] | None = None,
+        time: datetime | None = None,
+        started: bool = True,
+        config_path: Path = CONFIG_PATH,
+    ):
+        """Set up every automation in the house together, in one session.
+
+        The automations are loaded the way integrations/automation.yaml does
+        (`!include_dir_list`), blueprints are resolved from blueprints/, and
+        the helper entities from entities/ are real, so one automation's
+        service calls trigger the next (e.g. away -> mode -> scenes, camera).
+
+        Args:
+            entities: Dictionary of entity_id -> initial_state to set up
+            mock_services: (domain, service) tuples to mock, defaults to
+                every service the house calls on devices outside Home Assistant.
+                Other services run for real; all calls are recorded.
+            time: Optional datetime to mock as current time
+            started: If False, Home Assistant is left starting up, with the
+                automation triggers attached once start_house() is called
+            config_path: Configuration tree to load, e.g. a synthetic one
+                (see tests/helpers/synthetic_house.py)
+        """
+        self._house = True
+        if self.memory:
+            self.memory.begin_cycle("house")
+
+        if time:
+            self._start_time_patch(time)
+
+        await setup_helper_entities(self.hass, config_path)
+
+        if entities:
+            for entity_id, state in entities.items():
+                await self._set_state(entity_id, state)
+            await self.hass.async_block_till_done()
+
+        self.recorder.mock(
+            *(HOUSE_MOCK_SERVICES if mock_services is None else mock_services)
+        )
+        # Only record what happens once the house is running
+        self.recorder.clear()
+
+        # Resolve `use_blueprint` paths against the configuration tree
+        self._config_dir = self.hass.config.config_dir
+        self.hass.config.config_dir = str(config_path)
+        if not started:
+            self.hass.set_state(CoreState.not_running)
+        await setup_automation(self.hass, load_house_automations(config_path))
+
+        if time:
+            async_fire_time_changed(self.hass, time)
+            await self.hass.async_block_till_done()
+
+    async def start_house(self):
+        """Finish starting Home Assistant, firing the `homeassistant: start` triggers.
+
+        Does not wait for delays in the triggered runs, use elapse() to let
+        them pass.
+        """
+        self.hass.set_state(CoreState.running)
+        self.hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await async_settle(self.hass)
+
+    async def _set_state(self, entity_id: str, state: str):
+        """Set an entity state, through its service if it is a real helper.
+
+        Args:
+            entity_id: Entity to set
+            state: State value
+        """
+        domain = entity_id.split(".", 1)[0]
+        if domain in HELPER_SET_SERVICES and self.hass.states.get(entity_id):
+            service, data = HELPER_SET_SERVICES[domain](state)
+            await self.hass.services.async_call(
+                domain, service, {"entity_id": entity_id, **data}, blocking=True
+            )
+        else:
+            self.hass.states.async_set(entity_id, state)
+
+    def _start_time_patch(self, time: datetime):
+        """Start mocking the current time.
+
+        Args:
+            time: Datetime to mock as current time
+        """
+        self._target_time = time
+        self._time_patch = patch("homeassistant.util.dt.now", return_value=time)
+        self._time_patch.__enter__()
+
     async def trigger_automation(self, entity_id: str | None = None):
         """Manually trigger the automation.
 
@@ -118,31 +245,54 @@ class AutomationTestContext:
             blocking=True,
         )
 
-    async def state_change(self, entity_id: str, new_state: str, old_state: str | None = None):
+    async def state_change(
+        self,
+        entity_id: str,
+        new_state: str,
+        old_state: str | None = None,
+        wait: bool = True,
+    ):
         """Trigger a state change.
 
         Args:
             entity_id: Entity to change
             new_state: New state value
             old_state: Optional old state (will be set first if provided)
+            wait: If False, do not wait for delays in the triggered runs
+                (use elapse() to let them pass)
         """
         if old_state is not None:
             self.hass.states.async_set(entity_id, old_state)
             await self.hass.async_block_till_done()
 
         self.hass.states.async_set(entity_id, new_state)
+        if not wait:
+            await async_settle(self.hass)
+            return
         await self.hass.async_block_till_done()
         # Give automation time to process the state change event
         await self.hass.async_block_till_done()
 
-    async def fire_event(self, event_type: str, event_data: dict[str, Any] | None = None):
+    async def fire_event(
+        self,
+        event_type: str,
+        event_data: dict[str, Any] | None = None,
+        wait: bool = True,
+    ):
         """Fire an event on the Home Assistant bus.
 
         Args:
             event_type: Type of event to fire (e.g., "zha_event")
             event_data: Optional event data dictionary
+            wait: If False, do not wait for delays in the triggered runs
+                (use elapse() to let them pass)
         """
         self.hass.bus.async_fire(event_type, event_data or {})
+        if not wait:
+            await async_settle(self.hass)
+            return
+        await self.hass.async_block_till_done()
+        # Give automations triggered by the resulting state changes time to run
         await self.hass.async_block_till_done()
 
     async def advance_time(self, new_time: datetime):
@@ -164,15 +314,45 @@ class AutomationTestContext:
         async_fire_time_changed(self.hass, new_time)
         await self.hass.async_block_till_done()
 
+    async def elapse(self, seconds: float):
+        """Let virtual time pass, running delays and timers that fall due.
+
+        Unlike advance_time(), this does not wait in real time and works
+        without time mocking. If time mocking is set up, the mocked time
+        moves along.
+
+        Args:
+            seconds: Number of seconds to pass
+        """
+        if self._time_patch:
+            self._time_patch.__exit__(None, None, None)
+            self._start_time_patch(self._target_time + timedelta(seconds=seconds))
+        await self.clock.advance(seconds)
+
     async def cleanup(self):
         """Clean up after the test (turn off automation and stop time mocking)."""
+        self.recorder.async_stop()
+        self.clock.stop()
+
         # Stop time mocking
         if self._time_patch:
             self._time_patch.__exit__(None, None, None)
             self._time_patch = None
 
+        # Turn off every automation in the house to cancel any timers
+        if self._house:
+            self.hass.set_state(CoreState.running)
+            await self.hass.services.async_call(
+                "automation",
+                "turn_off",
+                {"entity_id": "all"},
+                blocking=True,
+            )
+            await self.hass.async_block_till_done()
+            self.hass.config.config_dir = self._config_dir
+
         # Turn off automation to cancel any timers
-        if self.automation_entity_id:
+        elif self.automation_entity_id:
             await self.hass.services.async_call(
                 "automation",
                 "turn_off",
@@ -181,18 +361,44 @@ class AutomationTestContext:
             )
             await self.hass.async_block_till_done()
 
+        if self.memory:
+            self.memory.end_cycle()
+
+    @property
+    def service_calls(self) -> list[RecordedCall]:
+        """Return the calls made to the mocked services, oldest first."""
+        return self.recorder.mocked_calls()
+
+    def service_calls_for(
+        self,
+        domain: str | None = None,
+        service: str | None = None,
+        entity_id: str | None = None,
+    ) -> list[RecordedCall]:
+        """Return every recorded service call matching the filters, mocked or not.
+
+        Args:
+            domain: Optional service domain (e.g., "scene")
+            service: Optional service name (e.g., "turn_on")
+            entity_id: Optional entity targeted by the call
+        """
+        return self.recorder.calls(domain, service, entity_id)
+
+    def _mocked_calls(self) -> list[RecordedCall]:
+        """Return the calls to the mocked services, failing if nothing was mocked."""
+        if not self.recorder.mocked:
+            raise AssertionError("No service was mocked. Did you forget to pass mock_service?")
+        return self.service_calls
+
     def assert_option_selected(self, expected_option: str):
         """Assert that input_select.select_option was called with the expected option.
 
         Args:
             expected_option: Expected option value (e.g., "work", "bedtime")
         """
-        if not self.service_calls:
-            raise AssertionError("No service was mocked. Did you forget to pass mock_service?")
-
-        assert len(self.service_calls) >= 1, "Expected at least one service call"
-        last_call = self.service_calls[-1]
-        actual_option = last_call.data.get("option")
+        calls = self._mocked_calls()
+        assert len(calls) >= 1, "Expected at least one service call"
+        actual_option = calls[-1].data.get("option")
         assert actual_option == expected_option, (
             f"Expected option '{expected_option}', got '{actual_option}'"
         )
@@ -203,14 +409,10 @@ class AutomationTestContext:
         Args:
             forbidden_option: Option that should not have been selected
         """
-        if not self.service_calls:
-            return  # No calls made, so the option wasn't selected
-
-        for call in self.service_calls:
-            if "option" in call.data:
-                assert call.data["option"] != forbidden_option, (
-                    f"Option '{forbidden_option}' should not have been selected"
-                )
+        for call in self.recorder.calls("input_select", "select_option"):
+            assert call.data.get("option") != forbidden_option, (
+                f"Option '{forbidden_option}' should not have been selected"
+            )
 
     def assert_hvac_mode_set(self, expected_mode: str):
         """Assert that climate.set_hvac_mode was called with the expected mode.
@@ -218,11 +420,9 @@ class AutomationTestContext:
         Args:
             expected_mode: Expected HVAC mode (e.g., "off", "cool", "heat")
         """
-        if not self.service_calls:
-            raise AssertionError("No service was mocked. Did you forget to pass mock_service?")
-
-        assert len(self.service_calls) >= 1, "Expected at least one service call"
-        last_call = self.service_calls[-1]
+        calls = self._mocked_calls()
+        assert len(calls) >= 1, "Expected at least one service call"
+        last_call = calls[-1]
         assert last_call.domain == "climate", f"Expected climate service, got {last_call.domain}"
         assert last_call.service == "set_hvac_mode", f"Expected set_hvac_mode, got {last_call.service}"
         actual_mode = last_call.data.get("hvac_mode")
@@ -231,25 +431,19 @@ class AutomationTestContext:
         )
 
     def assert_no_service_calls(self):
-        """Assert that no service calls were made."""
-        if not self.service_calls:
-            return  # No mock set up, so no calls could have been made
-
-        assert len(self.service_calls) == 0, (
-            f"Expected no service calls, but got {len(self.service_calls)}"
+        """Assert that no calls were made to the mocked services."""
+        actual_count = len(self.service_calls)
+        assert actual_count == 0, (
+            f"Expected no service calls, but got {actual_count}"
         )
 
     def assert_service_call_count(self, expected_count: int):
-        """Assert the number of service calls made.
+        """Assert the number of calls made to the mocked services.
 
         Args:
             expected_count: Expected number of calls
         """
-        if not self.service_calls:
-            actual_count = 0
-        else:
-            actual_count = len(self.service_calls)
-
+        actual_count = len(self.service_calls)
         assert actual_count == expected_count, (
             f"Expected {expected_count} service call(s), got {actual_count}"
         )
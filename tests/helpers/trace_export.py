@@ -0,0 +1,185 @@
+"""Streaming export of automation traces, with step timings, as JSON Lines.
+
+Home Assistant keeps the last `stored_traces` runs of each automation in
+memory, which is enough to look at one run but not to profile many. The
+exporter writes every run as one JSON line as soon as it finishes:
+
+    {"automation": "living_room_camera_away_mode_control",
+     "alias": "Living Room Camera: Away Mode Control", "run_id": "...",
+     "start": "2025-01-20T07:00:00+00:00", "execution": "finished",
+     "trigger": "state of input_boolean.house_mode_away", "trigger_id": "away_on",
+     "duration_ms": 1.9, "variables_size": 2210,
+     "conditions": [{"path": "action/0/choose/0/conditions/0", "result": true}],
+     "steps": [{"path": "action/0", "start_ms": 0.0, "end_ms": 1.8,
+                "duration_ms": 1.8, "variables_size": 0, "result": {"choice": 0}}]}
+
+`start` is the run's start on Home Assistant's clock (virtual in tests).
+Step times are measured on a real clock, in milliseconds from the first
+step's start, so steps are timed by the work they did even while time is
+virtual. A step's time includes the steps nested in it (a `choose` includes
+the option it ran). `variables_size` is the size in bytes of the JSON of the
+variables a step set; the run's is that of all variables, trigger included.
+
+Each record is built on the event loop as its run finishes, while nothing
+else touches the trace; a background thread only encodes and writes it, each
+line with a single write to a file opened for appending, so xdist workers
+can share a file.
+"""
+
+import os
+import queue
+import threading
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.components.automation.trace import AutomationTrace
+from homeassistant.helpers import script
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.trace import TraceElement, trace_id_cv
+
+# perf_counter() start and end of each step of a run, by id of its trace element
+StepTimings = dict[int, tuple[float, float]]
+
+
+class TraceExporter:
+    """Write every finished automation run to a JSON Lines file."""
+
+    def __init__(self, path: str | Path):
+        """Initialize the exporter (export starts with `start()`).
+
+        Args:
+            path: File the runs are appended to
+        """
+        self.path = Path(path)
+        self.runs = 0
+        # Timings of the runs in progress, by (trace key, run id)
+        self._timings: dict[tuple[str, str], StepTimings] = {}
+        # Records of the finished runs, for the writer thread
+        self._queue: queue.SimpleQueue[dict[str, Any] | None] = queue.SimpleQueue()
+        self._writer: threading.Thread | None = None
+        self._patches: list = []
+
+    def start(self) -> None:
+        """Start exporting every automation run that finishes."""
+        if self._patches:
+            return
+        trace_action = script.trace_action
+        finished = AutomationTrace.finished
+        exporter = self
+
+        @asynccontextmanager
+        async def _timed_trace_action(*args: Any) -> AsyncIterator[TraceElement]:
+            start = perf_counter()
+            async with trace_action(*args) as element:
+                try:
+                    yield element
+                finally:
+                    if trace_id := trace_id_cv.get():
+                        exporter._timings.setdefault(trace_id, {})[id(element)] = (
+                            start,
+                            perf_counter(),
+                        )
+
+        def _finished(trace: AutomationTrace) -> None:
+            finished(trace)
+            timings = exporter._timings.pop((trace.key, trace.run_id), {})
+            exporter._queue.put(run_record(trace, timings))
+
+        fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._writer = threading.Thread(
+            target=self._write, args=(fd,), name="trace_export", daemon=True
+        )
+        self._writer.start()
+        self._patches = [
+            patch.object(script, "trace_action", _timed_trace_action),
+            patch.object(AutomationTrace, "finished", _finished),
+        ]
+        for active in self._patches:
+            active.start()
+
+    def stop(self) -> None:
+        """Stop exporting, once the runs already finished are written."""
+        for active in reversed(self._patches):
+            active.stop()
+        self._patches = []
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+        self._timings.clear()
+
+    def _write(self, fd: int) -> None:
+        """Encode and append the records of finished runs until `stop()`.
+
+        Args:
+            fd: Descriptor of the export file, opened for appending
+        """
+        try:
+            while (record := self._queue.get()) is not None:
+                os.write(fd, json_bytes(record) + b"\n")
+                self.runs += 1
+        finally:
+            os.close(fd)
+
+
+def run_record(trace: AutomationTrace, timings: StepTimings) -> dict[str, Any]:
+    """Return the exported record of a finished run.
+
+    Called on the event loop: the record holds no reference into the trace,
+    so the writer thread can encode it while the loop goes on.
+
+    Args:
+        trace: The run's trace
+        timings: Start and end of each of its steps, see `StepTimings`
+    """
+    elements = [
+        element for path_elements in (trace._trace or {}).values() for element in path_elements
+    ]
+    origin = min((start for start, _ in timings.values()), default=0.0)
+    conditions = []
+    steps = []
+    variables_size = 0
+    trigger_id = None
+    for element in sorted(elements, key=lambda element: element._timestamp):
+        size = len(json_bytes(element._variables)) if element._variables else 0
+        variables_size += size
+        result = element._result
+        if element.path.startswith("trigger"):
+            trigger_id = (element._variables or {}).get("trigger", {}).get("id")
+        elif (timing := timings.get(id(element))) is not None:
+            start, end = timing
+            step: dict[str, Any] = {
+                "path": element.path,
+                "start_ms": round((start - origin) * 1000, 3),
+                "end_ms": round((end - origin) * 1000, 3),
+                "duration_ms": round((end - start) * 1000, 3),
+                "variables_size": size,
+            }
+            if result is not None:
+                step["result"] = dict(result)
+            if element._error is not None:
+                step["error"] = str(element._error) or type(element._error).__name__
+            steps.append(step)
+        elif result is not None and "result" in result:
+            conditions.append({"path": element.path, "result": result["result"]})
+    steps.sort(key=lambda step: step["start_ms"])
+    record: dict[str, Any] = {
+        "automation": trace.key.removeprefix("automation."),
+        "alias": (trace._config or {}).get("alias"),
+        "run_id": trace.run_id,
+        "start": trace._timestamp_start,
+        "execution": trace._script_execution,
+        "trigger": trace._trigger_description,
+        "trigger_id": trigger_id,
+        "duration_ms": max((step["end_ms"] for step in steps), default=0.0),
+        "variables_size": variables_size,
+        "conditions": conditions,
+        "steps": steps,
+    }
+    if trace._error is not None:
+        record["error"] = str(trace._error)
+    return record
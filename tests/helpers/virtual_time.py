@@ -0,0 +1,87 @@
+"""Virtual time for testing delays, debounces and `for:` durations.
+
+`hass.async_block_till_done()` waits for running automations to finish,
+so a test firing a burst of presses at an automation with a `delay` would
+sit out every delay in real time. The clock here offsets the event loop's
+time instead: advancing it makes delays and timers due immediately, and
+`async_settle` runs whatever is ready without waiting for pending delays.
+Point-in-time trackers (a `timer` entity finishing, a `time_pattern`)
+check the wall clock once due, so theirs is offset too.
+"""
+
+import asyncio
+import time
+from datetime import timedelta
+from typing import Any
+from unittest.mock import patch
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+# Upper bound on loop iterations per settle, guards against runaway loops
+MAX_SETTLE_ROUNDS = 1000
+
+
+async def async_settle(hass: HomeAssistant) -> None:
+    """Run every callback that is ready, without waiting for pending timers.
+
+    Args:
+        hass: Home Assistant instance
+    """
+    idle_rounds = 0
+    for _ in range(MAX_SETTLE_ROUNDS):
+        await asyncio.sleep(0)
+        # Two idle rounds in a row: nothing ready, only timers remain
+        idle_rounds = idle_rounds + 1 if not hass.loop._ready else 0
+        if idle_rounds == 2:
+            return
+
+
+class VirtualClock:
+    """Offset the event loop clock so time can be advanced instantly."""
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize the clock.
+
+        Args:
+            hass: Home Assistant instance
+        """
+        self.hass = hass
+        self.elapsed = 0.0
+        self._patches: list[Any] = []
+
+    def start(self) -> None:
+        """Start offsetting the event loop time and the time trackers' wall clock."""
+        if not self._patches:
+            real_time = self.hass.loop.time
+            self._patches = [
+                patch.object(self.hass.loop, "time", lambda: real_time() + self.elapsed),
+                patch(
+                    "homeassistant.helpers.event.time_tracker_timestamp",
+                    lambda: time.time() + self.elapsed,
+                ),
+                patch(
+                    "homeassistant.helpers.event.time_tracker_utcnow",
+                    lambda: dt_util.utcnow() + timedelta(seconds=self.elapsed),
+                ),
+            ]
+            for clock_patch in self._patches:
+                clock_patch.start()
+
+    def stop(self) -> None:
+        """Restore the real event loop time and wall clock."""
+        for clock_patch in reversed(self._patches):
+            clock_patch.stop()
+        self._patches = []
+
+    async def advance(self, seconds: float) -> None:
+        """Advance the clock and run the timers that fall due.
+
+        Timers scheduled while advancing count from the new time, so advance
+        in steps to follow a chain of delays.
+
+        Args:
+            seconds: Number of seconds to advance
+        """
+        self.start()
+        self.elapsed += seconds
+        await async_settle(self.hass)
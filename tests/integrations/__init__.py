@@ -0,0 +1 @@
+"""Integration package tests."""
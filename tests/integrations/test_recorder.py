@@ -0,0 +1,211 @@
+"""Tests for the recorder write-volume policy (integrations/recorder.yaml).
+
+These replay a simulated day against a recorder writing to a local SQLite
+file and count the rows that end up in the database.
+"""
+
+from collections import Counter
+from datetime import datetime, timedelta
+
+import pytest
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.db_schema import (
+    EventTypes,
+    Events,
+    States,
+    StatesMeta,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_mock_service
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+from sqlalchemy import func, select
+
+from tests.helpers.automation_helpers import setup_automation
+
+# Maximum number of rows (states + events) a normal day may write
+DAILY_WRITE_BUDGET = 1000
+
+# Maximum number of state rows a single entity may write per day
+ENTITY_WRITE_BUDGET = 200
+
+
+@pytest.fixture
+def persistent_database() -> bool:
+    """Record to an SQLite file instead of an in-memory database."""
+    return True
+
+
+@pytest.fixture
+def recorder_config(request, load_integration):
+    """Return the recorder package config, or the defaults when parametrized False."""
+    if not getattr(request, "param", True):
+        return None
+    return load_integration("recorder.yaml")["recorder"]
+
+
+def simulated_day(start: datetime):
+    """Yield (time, entity_id, state) tuples for a typical day in the house.
+
+    Args:
+        start: Midnight of the simulated day
+    """
+    for minute in range(24 * 60):
+        now = start + timedelta(minutes=minute)
+        hour = now.hour
+
+        # Illuminance reports every minute, following the sun
+        lux = max(0, 400 - abs(hour * 60 + now.minute - 780) // 2)
+        yield now, "sensor.study_motion_sensor_illuminance", str(lux + minute % 3)
+
+        # The camera REST sensor polls every minute and sometimes times out
+        power = "on" if hour < 8 or hour >= 17 else "off"
+        if minute % 45 == 0:
+            yield now, "sensor.living_room_cam_power", "unavailable"
+        yield now, "sensor.living_room_cam_power", power
+
+        # Study motion and occupancy during working hours
+        if 9 <= hour < 17 and minute % 15 == 0:
+            yield now, "binary_sensor.study_motion_sensor_motion", "on"
+            yield now, "binary_sensor.study_motion_sensor_occupancy", "on"
+        elif 9 <= hour < 17 and minute % 15 == 1:
+            yield now, "binary_sensor.study_motion_sensor_motion", "off"
+
+        # A handful of bedroom remote presses
+        if minute in (6 * 60 + 30, 7 * 60, 21 * 60, 22 * 60 + 30):
+            yield now, "input_text.sam_bedroom_switch", f"press-{minute}"
+
+    # Mode transitions and the Apple TV over the day
+    for hour, mode in (
+        (6, "wake up"),
+        (8, "work"),
+        (17, "default"),
+        (18, "dinner"),
+        (20, "relaxation"),
+        (22, "bedtime"),
+        (23, "sleep"),
+    ):
+        yield start + timedelta(hours=hour), "input_select.house_mode", mode
+    yield start + timedelta(hours=20), "media_player.lounge_room", "on"
+    yield start + timedelta(hours=22), "media_player.lounge_room", "off"
+
+
+async def replay_day(hass: HomeAssistant, load_automation) -> None:
+    """Replay a simulated day with the high-churn automations loaded."""
+    async_mock_service(hass, "light", "turn_on")
+    async_mock_service(hass, "light", "turn_off")
+    async_mock_service(hass, "shell_command", "turn_on_living_room_camera")
+    async_mock_service(hass, "shell_command", "turn_off_living_room_camera")
+    await setup_automation(
+        hass,
+        [
+            load_automation("study", "lamp.yaml"),
+            load_automation("living_room", "camera.yaml"),
+        ],
+    )
+
+    start = dt_util.start_of_local_day(datetime(2025, 1, 20))
+    for _, entity_id, state in sorted(simulated_day(start), key=lambda row: row[0]):
+        hass.states.async_set(entity_id, state)
+        await hass.async_block_till_done()
+
+    await async_wait_recording_done(hass)
+
+
+def count_rows(instance: Recorder) -> tuple[Counter, Counter]:
+    """Count state rows per entity and event rows per event type.
+
+    Returns:
+        Tuple of (state rows by entity_id, event rows by event_type)
+    """
+    with session_scope(session=instance.get_session(), read_only=True) as session:
+        states = Counter(
+            dict(
+                session.execute(
+                    select(StatesMeta.entity_id, func.count(States.state_id))
+                    .join(States, States.metadata_id == StatesMeta.metadata_id)
+                    .group_by(StatesMeta.entity_id)
+                ).all()
+            )
+        )
+        events = Counter(
+            dict(
+                session.execute(
+                    select(EventTypes.event_type, func.count(Events.event_id))
+                    .join(Events, Events.event_type_id == EventTypes.event_type_id)
+                    .group_by(EventTypes.event_type)
+                ).all()
+            )
+        )
+    return states, events
+
+
+def format_report(states: Counter, events: Counter) -> str:
+    """Render the rows written per entity and event type as a table."""
+    lines = [f"{'rows':>6}  source"]
+    lines += [f"{count:>6}  {entity_id}" for entity_id, count in states.most_common()]
+    lines += [f"{count:>6}  event:{event}" for event, count in events.most_common()]
+    lines.append(f"{states.total() + events.total():>6}  total")
+    return "\n".join(lines)
+
+
+async def test_recorder_policy_keeps_day_within_write_budget(
+    recorder_mock: Recorder, hass: HomeAssistant, load_automation
+):
+    """Test that a simulated day stays within the daily write budget."""
+    await replay_day(hass, load_automation)
+
+    states, events = await recorder_mock.async_add_executor_job(
+        count_rows, recorder_mock
+    )
+    report = format_report(states, events)
+
+    assert states.total() + events.total() <= DAILY_WRITE_BUDGET, (
+        f"Daily write budget of {DAILY_WRITE_BUDGET} rows exceeded:\n{report}"
+    )
+    for entity_id, count in states.items():
+        assert count <= ENTITY_WRITE_BUDGET, (
+            f"{entity_id} wrote {count} rows, budget is {ENTITY_WRITE_BUDGET}:\n{report}"
+        )
+
+
+async def test_recorder_policy_excludes_high_churn_sources(
+    recorder_mock: Recorder, hass: HomeAssistant, load_automation
+):
+    """Test that the excluded entities and events are not written at all."""
+    await replay_day(hass, load_automation)
+
+    states, events = await recorder_mock.async_add_executor_job(
+        count_rows, recorder_mock
+    )
+
+    assert "sensor.study_motion_sensor_illuminance" not in states
+    assert "sensor.living_room_cam_power" not in states
+    assert "input_text.sam_bedroom_switch" not in states
+    assert not any(entity_id.startswith("automation.") for entity_id in states)
+    assert "call_service" not in events
+    # Mode history is still recorded
+    assert states["input_select.house_mode"] == 7
+
+
+@pytest.mark.parametrize("recorder_config", [False], indirect=True)
+async def test_default_recorder_exceeds_write_budget(
+    recorder_mock: Recorder, hass: HomeAssistant, load_automation
+):
+    """Test that without the policy the same day blows the budget.
+
+    This keeps the budget meaningful: if the replay stops producing churn,
+    this test fails instead of the budget test silently passing.
+    """
+    await replay_day(hass, load_automation)
+
+    states, events = await recorder_mock.async_add_executor_job(
+        count_rows, recorder_mock
+    )
+
+    assert states.total() + events.total() > DAILY_WRITE_BUDGET, format_report(
+        states, events
+    )
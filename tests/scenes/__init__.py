@@ -0,0 +1 @@
+"""Scene tests."""
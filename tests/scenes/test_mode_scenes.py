@@ -0,0 +1,110 @@
+"""Tests for the commands sent to devices when mode scenes are applied.
+
+scene.turn_on reproduces each scene state and skips entities already in
+that state, so applying an away or sleep scene over a mostly-dark house
+should only command the devices that are still on.
+"""
+
+import pytest
+
+from tests.helpers.automation_helpers import load_house_scenes, setup_house_scenes
+from tests.helpers.fake_devices import async_setup_fake_devices
+
+PRESENCE = {
+    "input_boolean.sam_home": "on",
+    "input_boolean.maddy_home": "on",
+}
+
+
+def scene_devices() -> dict[str, str]:
+    """Return every device used by a scene, switched off."""
+    return {
+        entity_id: "off"
+        for scene in load_house_scenes()
+        for entity_id in scene["entities"]
+    }
+
+
+def scene_entity_count(name: str) -> int:
+    """Return the number of devices set by scenes with the given file name suffix."""
+    return sum(
+        len(scene["entities"])
+        for scene in load_house_scenes()
+        if scene["name"].endswith(f": {name}")
+    )
+
+
+@pytest.fixture
+async def house_devices(hass):
+    """Set up the real scenes over fake devices, returning a setup function."""
+
+    async def _setup(**states):
+        devices = scene_devices()
+        devices.update(states)
+        log = await async_setup_fake_devices(hass, devices)
+        await setup_house_scenes(hass)
+        return log
+
+    return _setup
+
+
+async def apply_mode(automation_test, mode: str):
+    """Change the house mode and let Apply Mode Scenes run."""
+    await automation_test.state_change("input_select.house_mode", mode, wait=False)
+    await automation_test.elapse(1)
+
+
+async def test_away_only_commands_devices_that_are_on(automation_test, house_devices):
+    """Test that going away only turns off the devices that were left on."""
+    log = await house_devices(
+        **{
+            "light.study_lights": "on",
+            "light.study_lamp": {"state": "on", "brightness": 214},
+        }
+    )
+    await automation_test.setup(
+        automation=("house", "apply_mode_scenes.yaml"),
+        entities={"input_select.house_mode": "work", **PRESENCE},
+    )
+
+    await apply_mode(automation_test, "away")
+
+    assert scene_entity_count("Away") > 2
+    assert sorted(log.entity_ids()) == ["light.study_lamp", "light.study_lights"]
+    assert log.count(service="turn_off") == 2
+    assert automation_test.hass.states.get("light.study_lights").state == "off"
+
+
+async def test_matching_scene_sends_no_commands(automation_test, house_devices):
+    """Test that applying sleep over a house that is already dark sends nothing."""
+    log = await house_devices()
+    await automation_test.setup(
+        automation=("house", "apply_mode_scenes.yaml"),
+        entities={"input_select.house_mode": "bedtime", **PRESENCE},
+    )
+
+    await apply_mode(automation_test, "sleep")
+
+    assert automation_test.recorder.count("scene", "turn_on") == 1
+    assert log.commands == []
+
+
+async def test_lights_off_only_commands_lights_that_are_on(hass, house_devices):
+    """Test that the living room off scene skips the lights already off."""
+    log = await house_devices(
+        **{
+            "light.living_room_lamp": {"state": "on", "brightness": 217},
+            "switch.bedroom_lights_switch": "on",
+        }
+    )
+
+    await hass.services.async_call(
+        "scene",
+        "turn_on",
+        {"entity_id": "scene.living_room_lights_off", "transition": 2.5},
+        blocking=True,
+    )
+
+    assert log.entity_ids() == ["light.living_room_lamp"]
+    assert log.commands[0].data == {"transition": 2.5}
+    assert hass.states.get("switch.bedroom_lights_switch").state == "on"
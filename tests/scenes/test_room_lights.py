@@ -0,0 +1,61 @@
+"""Tests for the radio commands room scenes send per device.
+
+Rooms are derived from the scene directory layout (scenes/<room>/). No room
+light groups are declared for the scenes to target, because none would cut
+the radio traffic:
+
+- Each room's ceiling bulbs are already one ZHA group, which ZHA keeps in its
+  own storage and commands with a single multicast (light.<room>_lights).
+- The other scene entries are single-bulb lamps, and a switch in the bedroom.
+  Lamps that always change together (the living room's two) could only be
+  grouped by a YAML light group (`platform: group`), which sends one command
+  per member, as the scene already does, and also commands members that are
+  already in the target state, which scene.turn_on skips.
+
+So these tests guard the traffic the scenes already have: a mode applies one
+scene per room at once, so a device shared between rooms would be commanded
+twice, and no device may be commanded more than once.
+"""
+
+from collections import defaultdict
+
+from homeassistant.util.yaml import load_yaml_dict
+
+from tests.helpers.automation_helpers import CONFIG_PATH, setup_house_scenes
+from tests.helpers.fake_devices import async_setup_fake_devices
+
+
+def room_devices() -> dict[str, set[str]]:
+    """Return the devices used by each room's scenes, keyed by scene directory."""
+    rooms = defaultdict(set)
+    for path in sorted((CONFIG_PATH / "scenes").glob("*/*.yaml")):
+        rooms[path.parent.name].update(load_yaml_dict(path)["entities"])
+    return dict(rooms)
+
+
+def test_no_device_is_shared_between_rooms():
+    """Test that each device belongs to exactly one room's scenes."""
+    owners = defaultdict(list)
+    for room, devices in room_devices().items():
+        for entity_id in devices:
+            owners[entity_id].append(room)
+
+    assert {entity_id: rooms for entity_id, rooms in owners.items() if len(rooms) > 1} == {}
+
+
+async def test_sleep_sends_one_command_per_device(hass, automation_test):
+    """Test that applying sleep over a fully lit house commands each device once."""
+    devices = set().union(*room_devices().values())
+    log = await async_setup_fake_devices(hass, dict.fromkeys(devices, "on"))
+    await setup_house_scenes(hass)
+    await automation_test.setup(
+        automation=("house", "apply_mode_scenes.yaml"),
+        entities={"input_select.house_mode": "bedtime"},
+    )
+    log.clear()
+
+    await automation_test.state_change("input_select.house_mode", "sleep", wait=False)
+    await automation_test.elapse(1)
+
+    assert sorted(log.entity_ids()) == sorted(devices)
+    assert automation_test.recorder.count("scene", "turn_on") == 1